@@ -32,6 +32,8 @@ pipenv Install codes:
 import sys
 import gc
 import os
+# Import threading for probing the ports in the background
+import threading
 # Expend file path
 sys.path.append('.')
 
@@ -48,20 +50,42 @@ import pandas as pd
 import serial
 import serial.tools.list_ports
 # Import PyQt widgets: PySide6
-from PySide6.QtCore import QDateTime, QTimer
-from PySide6.QtGui import QIcon, QIntValidator
-from PySide6.QtWidgets import (QAbstractItemView, QApplication, QComboBox,
-                               QFileDialog, QHBoxLayout, QLabel, QMainWindow,
-                               QMessageBox, QPushButton, QSizePolicy,
-                               QSpacerItem, QTableWidgetItem, QVBoxLayout, QDialog)
+from PySide6.QtCore import QDateTime, QTimer, Signal
+from PySide6.QtGui import QAction, QIcon, QIntValidator
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QCheckBox, QComboBox,
+                               QFileDialog, QHBoxLayout, QInputDialog, QLabel, QMainWindow,
+                               QMessageBox, QPushButton, QSizePolicy, QSpinBox,
+                               QSpacerItem, QVBoxLayout, QDialog)
 # Import style sheet
 import qdarkstyle
 # from qdarkstyle.light.palette import LightPalette # Light Style
 
 # Import util functions
 import util.util as util
+# Import frame layout schema
+from util.frameSchema import CELL_POSITIONS, FRAME
+# Import min/max decimation pyramid for the live graph
+from util.decimationPyramid import minMaxPyramid
+# Import memory-mapped store for the full graph history
+from util.historyStore import historyStore
+# Import last rendered GUI state
+from util.renderCache import renderCache
+# Import vectorised threshold check
+from util.alarmEngine import PACK_VOLTAGE, CELL_VOLTAGE, IC_TEMP, PACK_CURRENT, alarmPolicy, packAlarmEngine
+# Import raw UART capture log
+from util.captureLog import captureWriter
+# Import replay source for recorded data
+from util.replaySerial import replaySerial
+# Import acquisition health metrics
+from util.acquisitionMetrics import acquisitionMetrics
+# Import serial port auto-discovery
+from util.portDiscovery import discoverPorts
 # Import graph window
-from BMS_plotWindow import loadGraphWindow, plotWindow, zoomWindow, SOCPlotWindow, SOHPlotWindow, CBPlotWindow, setInitValueDialog
+from BMS_plotWindow import loadGraphWindow, plotWindow, zoomWindow, SOCPlotWindow, SOHPlotWindow, CBPlotWindow, curveRegistry, setInitValueDialog
+# Import cell voltage table model
+from BMS_voltageModel import voltageTableModel
+# Import session manager for monitoring several ports
+from BMS_sessionManager import sessionManager
 # Import UI file
 from UI.BMS_GUI import Ui_MainWindow
 # Import Plotly file
@@ -100,8 +124,27 @@ class balancingStatus(Enum):
     ON = 1
 
 
+# Displayed status of the alarm engine codes: normal, under, over
+VOLTAGE_STATUS = [voltageStatus.DEFAULT, voltageStatus.UNDERVOLTAGE, voltageStatus.OVERVOLTAGE]
+CURRENT_STATUS = [currentStatus.DEFAULT, currentStatus.UNDERCURRENT, currentStatus.OVERCURRENT]
+TEMP_STATUS = [tempStatus.DEFAULT, tempStatus.UNDERTEMPERATURE, tempStatus.OVERTEMPERATURE]
+
+
+# Colours of the status displays, selected by their status property
+STATUS_STYLE_SHEET = """
+*[status="normal"] { background-color: rgb(0, 255, 0); }
+*[status="alarm"] { background-color: rgb(255, 0, 0); }
+*[status="idle"] { background-color: rgb(0, 0, 0); }
+*[status="charge"] { background-color: rgb(65, 105, 225); }
+*[status="discharge"] { background-color: rgb(0, 201, 87); }
+*[status="opencircuit"] { background-color: rgb(192, 192, 192); }
+*[status="fault"] { background-color: rgb(255, 0, 0); }
+"""
+
+
 class mainWindow(QMainWindow, Ui_MainWindow):
     """Main window widget for BMS GUI"""
+    portsProbed = Signal(list) # Ranked port discovery results
     def __init__(self):
         super(mainWindow, self).__init__()
 
@@ -160,6 +203,16 @@ class mainWindow(QMainWindow, Ui_MainWindow):
         self.cellData = {'voltage': [],
                          'voltageStatus': [], 'currentStatus': []}
 
+        # Latest decoded frame, the data below are views of it
+        self.frameData = np.zeros(FRAME.words).astype(np.int32)
+
+        # Time stamp of the latest frame (perf_counter, or the recorded wall-clock time of a replay),
+        # None until a frame is received
+        self.frameTime = None
+
+        # Read time of the latest received frame (perf_counter) for the GUI latency, None for a redisplayed frame
+        self.frameReadTime = None
+
         # Raw battery data in integer form
         self.bccData = [0 for _ in range(17)]
 
@@ -175,19 +228,44 @@ class mainWindow(QMainWindow, Ui_MainWindow):
             self.cellData['voltageStatus'].append(voltageStatus.DEFAULT)
             self.cellData['currentStatus'].append(currentStatus.DEFAULT)
 
-        # Battery status flag
-        self.statusUpdateFlag = [0 for _ in range(17)]
+        # Threshold check of the pack channels
+        self.alarmEngine = packAlarmEngine()
+
+        # An alarm is raised or cleared by 3 of the last 5 frames, so single corrupted frames do not change the status
+        self.alarmPolicy = alarmPolicy(self.alarmEngine.channels, window=5)
+        self.alarmPolicy.setDebounce(slice(None), 3)
+
+        # A value must come back this far inside its limits for clearing the alarm
+        self.alarmPolicy.setHysteresis(PACK_VOLTAGE, 50) # mV
+        self.alarmPolicy.setHysteresis(CELL_VOLTAGE, 10) # mV
+        self.alarmPolicy.setHysteresis(IC_TEMP, 1) # degree
+        self.alarmPolicy.setHysteresis(PACK_CURRENT, 10) # mA
 
         # ===================Real time data====================
 
-        self.outputData = np.zeros((1,59)).astype(np.int32)
+        # Recorded rows: (recorded words, time information)
+        self.outputData = []
+
+        # Every decoded frame is recorded instead of one frame per second
+        self.fullRateRecording = False
 
-        self.graphData = np.zeros((59,1)).astype(np.float16)
+        # Time span of the live graph (min), one point is plotted every 0.2 s
+        self.liveWindow = 30
 
-        self.xaxis = np.zeros(1).astype(np.float16)
+        # Live graph window with its min/max summary, the oldest points are overwritten after the live window
+        self.graphPyramid = minMaxPyramid(self.liveWindow * 300, len(FRAME.plotIndex))
+
+        # Every point of the session, kept in memory-mapped files for browsing the older data
+        self.historyStore = historyStore(len(FRAME.plotIndex))
+
+        # Revision of the graph data, bumped on every change
+        self.graphRevision = 0
 
         self.EFC_Data = 0
 
+        # Start of the dropout of the displayed session, None while the port is connected
+        self.disconnectTime = None
+
         # BMS command
         self.command = b'IDLE'
 
@@ -205,16 +283,45 @@ class mainWindow(QMainWindow, Ui_MainWindow):
         # Initialisation of serial
         self.serial = serial.Serial()
 
+        # Open ports, each session has its own acquisition thread and decoded data
+        # self.serial and self.metrics belong to the displayed session
+        self.sessionManager = sessionManager()
+        self.displayedSession = None
+
+        # Acquisition health metrics
+        self.metrics = acquisitionMetrics()
+
         # Initialisation of graph window
         self.graphWindow = plotWindow()
         self.graphWindow_SOC = SOCPlotWindow()
         self.graphWindow_SOH = SOHPlotWindow()
         self.graphWindow_CB = CBPlotWindow()
 
-        # Three timers
-        self.timer = QTimer() # Timer for GUI data displaying
+        # Live curves of the graph windows, one per graph data row
+        self.curves = curveRegistry(FRAME.plotColumns, self.graphWindow.livePlots() + self.graphWindow_SOC.livePlots() +
+                                    self.graphWindow_SOH.livePlots() + self.graphWindow_CB.livePlots())
+
+        # Two timers, serial data is received by the serial acquisition thread
         self.timer2 = QTimer() # Timer for data plotting
         self.timer3 = QTimer() # Timer for data recoding
+        self.timer4 = QTimer() # Timer for acquisition metrics displaying
+        self.timer5 = QTimer() # Timer for GUI refreshing
+
+        # A zoom or pan redraws the curves for the new range at most every 50 ms, even if plotting is stopped
+        self.viewTimer = QTimer()
+        self.viewTimer.setSingleShot(True)
+        self.viewTimer.setInterval(50)
+
+        # The displayed values are refreshed at most displayRate times per second, only the changed widgets are updated
+        self.displayRate = 10
+        self.guiDirty = False
+        self.renderCache = renderCache()
+
+        # The status displays are coloured by one style sheet, the inline colours of the UI file are dropped
+        self.setStyleSheet(STATUS_STYLE_SHEET)
+        for widget in self.statusButtonList + [self.packVoltageStatusDisplay, self.packCurrentStatusDisplay, self.ICStatusDisplay]:
+            widget.setStyleSheet("")
+            self.setWidgetStatus(widget, 'normal')
 
 # ===================Class initialisation====================
 
@@ -379,14 +486,67 @@ class mainWindow(QMainWindow, Ui_MainWindow):
         self.stopPlotButton = QPushButton("Stop Plotting")
 
         graphSpacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        # Add live window spin box
+        liveWindowLabel = QLabel("Live window")
+        self.liveWindowSpinBox = QSpinBox()
+        self.liveWindowSpinBox.setRange(1, 1440)
+        self.liveWindowSpinBox.setSuffix(" min")
+        self.liveWindowSpinBox.setValue(self.liveWindow)
+        self.liveWindowSpinBox.setKeyboardTracking(False) # Rebuild the window once the value is typed
+
+        # Add display rate spin box
+        displayRateLabel = QLabel("Display rate")
+        self.displayRateSpinBox = QSpinBox()
+        self.displayRateSpinBox.setRange(1, 50)
+        self.displayRateSpinBox.setSuffix(" Hz")
+        self.displayRateSpinBox.setValue(self.displayRate)
         
         # Set layouts
+        plotButtonLayout.addWidget(liveWindowLabel)
+        plotButtonLayout.addWidget(self.liveWindowSpinBox)
+        plotButtonLayout.addWidget(displayRateLabel)
+        plotButtonLayout.addWidget(self.displayRateSpinBox)
         plotButtonLayout.addItem(graphSpacer)
         plotButtonLayout.addWidget(self.startPlotButton)
         plotButtonLayout.addWidget(self.stopPlotButton)
 
         self.monitorGroupBoxLayout.addLayout(plotButtonLayout)
 
+        # Add raw UART capture check box
+        self.captureCheckBox = QCheckBox("Capture raw UART data")
+        self.portConfigBoxLayout.addWidget(self.captureCheckBox)
+
+        # Add session selector and the summary of all the open sessions
+        sessionLayout = QHBoxLayout()
+        sessionLabel = QLabel("Displayed session")
+        self.sessionComboBox = QComboBox()
+        sessionLayout.addWidget(sessionLabel)
+        sessionLayout.addWidget(self.sessionComboBox)
+        self.portConfigBoxLayout.addLayout(sessionLayout)
+
+        self.sessionSummaryLabel = QLabel("No open session")
+        self.portConfigBoxLayout.addWidget(self.sessionSummaryLabel)
+
+        # Add acquisition metrics panel to the status bar
+        self.metricsLabel = QLabel("Frames: 0")
+        self.exportMetricsButton = QPushButton("Export Metrics")
+        self.statusBar().addPermanentWidget(self.metricsLabel)
+        self.statusBar().addPermanentWidget(self.exportMetricsButton)
+
+        # Add replay menu action
+        self.actionReplay = QAction("Replay recorded data", self)
+        self.menuSetting.addAction(self.actionReplay)
+
+        # Add alarm latching check box, the alarms clear by themselves when it is unchecked
+        self.latchCheckBox = QCheckBox("Latch alarms")
+        self.latchCheckBox.setChecked(True)
+        self.thresholdGroupBoxLayout.addWidget(self.latchCheckBox)
+
+        # Add full rate recording check box
+        self.fullRateCheckBox = QCheckBox("Record every frame")
+        self.recordGroupBoxLayout.addWidget(self.fullRateCheckBox, 1, 0, 1, 3)
+
         # Init record button
         self.startRecordButton.setEnabled(False)
         self.stopRecordButton.setChecked(True)
@@ -407,12 +567,12 @@ class mainWindow(QMainWindow, Ui_MainWindow):
         # Disable the change of the table item
         self.voltageTable.setEditTriggers(QAbstractItemView.NoEditTriggers)
 
-        # Set table item
+        # Show the cell voltages through the table model
         for num in range(0, 14):
             self.cellData['voltage'][num] = 0
-            self.voltageTable.setItem(num, 0, QTableWidgetItem(
-                str(self.cellData['voltage'][num])))
-            self.voltageTable.setItem(num, 1, QTableWidgetItem('mV'))
+
+        self.voltageModel = voltageTableModel(len(self.cellData['voltage']))
+        self.voltageTable.setModel(self.voltageModel)
 
         # Disable spinbox line edit
         self.recordDoubleSpinBox.lineEdit().setReadOnly(True)
@@ -442,11 +602,24 @@ class mainWindow(QMainWindow, Ui_MainWindow):
         self.tempMiniLineEdit.setText(str(self.tempThreshold[0]))
         self.tempMaxLineEdit.setText(str(self.tempThreshold[1]))
 
+        # Check the channels against the initial threshold values
+        self.updateAlarmThresholds()
+
         # Connect serial button functions
         self.detectPortButton.clicked.connect(self.detectPort)
+        self.portsProbed.connect(self.portProbeFinished)
         self.startButton.clicked.connect(self.startMonitor)
         self.stopButton.clicked.connect(self.stopMonitor)
 
+        # Connect session functions
+        self.sessionComboBox.activated.connect(
+            lambda: self.selectSession(self.sessionComboBox.currentText()))
+        self.sessionManager.frameReceived.connect(self.receiveData)
+        self.sessionManager.errorOccurred.connect(self.serialError)
+        self.sessionManager.connectionLost.connect(self.connectionLost)
+        self.sessionManager.connectionRestored.connect(self.connectionRestored)
+        self.sessionManager.replayFinished.connect(self.replayFinished)
+
         # Connect cell state display
         self.Cell1StatusDisplay.clicked.connect(lambda: self.displayCellStatus(
             self.statusButtonList.index(self.Cell1StatusDisplay)))
@@ -484,6 +657,7 @@ class mainWindow(QMainWindow, Ui_MainWindow):
         # Connect setting menu actions
         self.actionConnect.triggered.connect(self.startMonitor)
         self.actionDetectPort.triggered.connect(self.detectPort)
+        self.actionReplay.triggered.connect(self.startReplay)
 
         # Connect clear data button
         self.clearDataButton.clicked.connect(self.clearWarning)
@@ -510,6 +684,9 @@ class mainWindow(QMainWindow, Ui_MainWindow):
         self.zoomButton_3.clicked.connect(self.zoomGraph_3)
         self.zoomButton_4.clicked.connect(self.zoomGraph_4)
 
+        # Connect export metrics button function
+        self.exportMetricsButton.clicked.connect(self.exportMetrics)
+
         # Connect load button function
         self.loadingButton.clicked.connect(self.openFile)
         # self.plotlyButton.clicked.connect(self.plotByPlotly) # Not work, function removed
@@ -518,9 +695,19 @@ class mainWindow(QMainWindow, Ui_MainWindow):
         self.cbPushButtonSoC.clicked.connect(lambda: self.cbStackedWidget.setCurrentIndex(0))
         self.cbPushButtonControl.clicked.connect(lambda: self.cbStackedWidget.setCurrentIndex(1))
 
+        # Hidden graphs are not drawn, they catch up as soon as their page is shown
+        self.monitorWindowTab.currentChanged.connect(self.drawCurves)
+        self.cbStackedWidget.currentChanged.connect(self.drawCurves)
+
         # Connect output time interval function
         self.recordDoubleSpinBox.valueChanged.connect(self.updateOutputTimeInterval)
 
+        # Connect live window function
+        self.liveWindowSpinBox.valueChanged.connect(self.updateLiveWindow)
+
+        # Connect display rate function
+        self.displayRateSpinBox.valueChanged.connect(self.updateDisplayRate)
+
         # Update threshold values
         self.voltageMaxLineEdit.textChanged.connect(self.updateThreshold)
         self.voltageMiniLineEdit.textChanged.connect(self.updateThreshold)
@@ -531,14 +718,25 @@ class mainWindow(QMainWindow, Ui_MainWindow):
         self.tempMaxLineEdit.textChanged.connect(self.updateThreshold)
         self.tempMiniLineEdit.textChanged.connect(self.updateThreshold)
 
+        # Update alarm latching
+        self.latchCheckBox.toggled.connect(lambda checked: self.alarmPolicy.setLatch(slice(None), checked))
+
         # Update cell number
         self.cellNumberRadioButton_7.toggled.connect(self.cellNumberHandler)
         self.cellNumberRadioButton_14.toggled.connect(self.cellNumberHandler)
 
         # Link the timer to functions
-        self.timer.timeout.connect(self.receiveData)
         self.timer2.timeout.connect(self.updateGraphData)
         self.timer3.timeout.connect(self.recordData)
+        self.timer4.timeout.connect(self.updateMetricsDisplay)
+        self.timer5.timeout.connect(self.refreshGUI)
+        self.viewTimer.timeout.connect(self.drawCurves)
+
+        # Redraw the curves when the x range of a graph is changed
+        for viewBox in self.curves.viewBoxes():
+            viewBox.sigXRangeChanged.connect(self.viewRangeChanged)
+
+        self.timer5.start(round(1000 / self.displayRate))
 
 # ===================Update threshold values====================
 
@@ -553,6 +751,15 @@ class mainWindow(QMainWindow, Ui_MainWindow):
         self.tempThreshold = [int(self.tempMiniLineEdit.text()), int(
             self.tempMaxLineEdit.text())]
 
+        self.updateAlarmThresholds()
+
+    def updateAlarmThresholds(self):
+        """Handler for copying the threshold values to the alarm engine"""
+        self.alarmEngine.setThreshold(PACK_VOLTAGE, *self.packVoltageThreshold)
+        self.alarmEngine.setThreshold(CELL_VOLTAGE, *self.voltageThreshold)
+        self.alarmEngine.setThreshold(IC_TEMP, *self.tempThreshold)
+        self.alarmEngine.setThreshold(PACK_CURRENT, *self.currentThreshold)
+
 # ===================Clear and reset data====================
 
     def clearData(self):
@@ -560,31 +767,32 @@ class mainWindow(QMainWindow, Ui_MainWindow):
         # Clear cell voltage
         for num in range(0, 14):
             self.cellData['voltage'][num] = 0
-            self.voltageTable.item(num, 0).setText(str(0))
+
+        self.voltageModel.setVoltages(self.cellData['voltage'])
 
         # Clear pack data
         self.packData['voltage'] = 0
         self.packData['current'] = 0
         self.packData['packVoltageDifference'] = 0
         self.EFC_Data = 0
-        self.packVoltageLineEdit.setText(str(self.packData['voltage']))
-        self.packCurrentLineEdit.setText(str(self.packData['current']))
+        self.setWidgetText(self.packVoltageLineEdit, str(self.packData['voltage']))
+        self.setWidgetText(self.packCurrentLineEdit, str(self.packData['current']))
 
         # Clear IC temp data
         self.ICData['temp'] = 0
-        self.ICTempLineEdit.setText(str(self.ICData['temp']))
+        self.setWidgetText(self.ICTempLineEdit, str(self.ICData['temp']))
 
         # Clear port status
         self.portStatusDisplay.setEnabled(False)
 
         # Clear output data and graph data
         self.stopRecordButton.setChecked(True)
-        self.graphData = np.zeros((59,1)).astype(np.float16)
-        self.xaxis = np.zeros(1).astype(np.float16)
+        self.resetGraphData()
 
-        self.outputData = np.zeros((1,59)).astype(np.int32)
+        self.outputData = []
 
         # Clear battery data
+        self.frameData = np.zeros(FRAME.words).astype(np.int32)
         self.bccData = [0 for _ in range(17)]
         self.SOC_SOHData = [0 for _ in range(28)]
 
@@ -592,65 +800,7 @@ class mainWindow(QMainWindow, Ui_MainWindow):
             if self.timer2.isActive() == True:
                 self.stopPlotting()
 
-            self.cellCurve0.clear()
-            self.cellCurve1.clear()
-            self.cellCurve2.clear()
-            self.cellCurve3.clear()
-            self.cellCurve4.clear()
-            self.cellCurve5.clear()
-            self.cellCurve6.clear()
-            self.cellCurve7.clear()
-            self.cellCurve8.clear()
-            self.cellCurve9.clear()
-            self.cellCurve10.clear()
-            self.cellCurve11.clear()
-            self.cellCurve12.clear()
-            self.cellCurve13.clear()
-            self.cellCurve14.clear()
-            self.cellCurve15.clear()
-            self.cellCurve16.clear()
-            self.cellCurve17.clear()
-            self.cellCurve18.clear()
-            self.cellCurve19.clear()
-            self.cellCurve20.clear()
-            self.cellCurve21.clear()
-            self.cellCurve22.clear()
-            self.cellCurve23.clear()
-            self.cellCurve24.clear()
-            self.cellCurve25.clear()
-            self.cellCurve26.clear()
-            self.cellCurve27.clear()
-            self.cellCurve28.clear()
-            self.cellCurve29.clear()
-            self.cellCurve30.clear()
-            self.cellCurve31.clear()
-            self.cellCurve32.clear()
-            self.cellCurve33.clear()
-            self.cellCurve34.clear()
-            self.cellCurve35.clear()
-            self.cellCurve36.clear()
-            self.cellCurve37.clear()
-            self.cellCurve38.clear()
-            self.cellCurve39.clear()
-            self.cellCurve40.clear()
-            self.cellCurve41.clear()
-            self.cellCurve42.clear()
-            self.cellCurve43.clear()
-            self.cellCurve44.clear()
-            self.cellCurve45.clear()
-            self.cellCurve46.clear()
-            self.cellCurve47.clear()
-            self.cellCurve48.clear()
-            self.cellCurve49.clear()
-            self.cellCurve50.clear()
-            self.cellCurve51.clear()
-            self.cellCurve52.clear()
-            self.cellCurve53.clear()
-            self.cellCurve54.clear()
-            self.cellCurve55.clear()
-            self.cellCurve56.clear()
-            self.cellCurve57.clear()
-            self.cellCurve58.clear()
+            self.curves.clear()
 
             self.cbProgressBar.setValue(round(self.SOC_SOHData[0]*0.1))
             self.cbProgressBar_2.setValue(round(self.SOC_SOHData[1]*0.1))
@@ -680,34 +830,28 @@ class mainWindow(QMainWindow, Ui_MainWindow):
             self.cellData['currentStatus'][i] = currentStatus.DEFAULT
 
         for button in self.statusButtonList:
-            button.setStyleSheet(
-                "background-color: rgb(0, 255, 0)")
+            self.setWidgetStatus(button, 'normal')
 
         # Clear pack status
         self.packData['voltageStatus'] = voltageStatus.DEFAULT
         self.packData['currentStatus'] = currentStatus.DEFAULT
-        self.packVoltageStatusDisplay.setText(
-            self.packData['voltageStatus'].value)
-        self.packCurrentStatusDisplay.setText(
-            self.packData['currentStatus'].value)
-        self.packVoltageStatusDisplay.setStyleSheet(
-            "background-color: rgb(0, 255, 0)")
-        self.packCurrentStatusDisplay.setStyleSheet(
-            "background-color: rgb(0, 255, 0)")
+        self.setWidgetText(self.packVoltageStatusDisplay, self.packData['voltageStatus'].value)
+        self.setWidgetText(self.packCurrentStatusDisplay, self.packData['currentStatus'].value)
+        self.setWidgetStatus(self.packVoltageStatusDisplay, 'normal')
+        self.setWidgetStatus(self.packCurrentStatusDisplay, 'normal')
 
         # Clear IC status
         self.ICData['tempStatus'] = tempStatus.DEFAULT
-        self.ICStatusDisplay.setText(self.ICData['tempStatus'].value)
-        self.ICStatusDisplay.setStyleSheet(
-            "background-color: rgb(0, 255, 0)")
+        self.setWidgetText(self.ICStatusDisplay, self.ICData['tempStatus'].value)
+        self.setWidgetStatus(self.ICStatusDisplay, 'normal')
 
-        # Clear status
-        self.statusUpdateFlag = [0 for _ in range(17)]
+        # Clear the alarms, latched ones included
+        self.alarmPolicy.reset()
 
 # ===================Port configuration and communication====================
 
     def detectPort(self):
-        """Check the connected ports"""
+        """Check the connected ports and probe them for BMS frames"""
         self.portsDict = {}
         ports = serial.tools.list_ports.comports()
 
@@ -719,9 +863,58 @@ class mainWindow(QMainWindow, Ui_MainWindow):
         if len(self.portsDict) == 0:
             self.portComboBox.addItem("NULL")
             QMessageBox.critical(self, "COM error", "COM detect failed")
+            return None
+
+        # Skip the ports which are already open
+        portNames = [name for name in self.portsDict if name not in self.sessionManager.sessions]
+
+        # Try the selected baud rate first
+        baudRates = [int(self.baudRateComboBox.currentText())]
+        for i in range(self.baudRateComboBox.count()):
+            if int(self.baudRateComboBox.itemText(i)) not in baudRates:
+                baudRates.append(int(self.baudRateComboBox.itemText(i)))
+
+        self.detectPortButton.setEnabled(False)
+        self.statusBar().showMessage("Probing %d ports for BMS frames..." % len(portNames))
+
+        # Listen to all the ports at once in the background
+        threading.Thread(target=lambda: self.portsProbed.emit(discoverPorts(portNames, baudRates)),
+                         daemon=True).start()
+
+    def portProbeFinished(self, results):
+        """Handler for choosing the port and baud rate which give the cleanest stream of frames"""
+        self.detectPortButton.setEnabled(True)
+
+        if len(results) == 0:
+            self.statusBar().showMessage("No BMS frames found, please choose the port manually", 5000)
+            return None
+
+        # List the ports with frames first
+        rankedPorts = [result[0] for result in results]
+        otherPorts = [name for name in self.portsDict if name not in rankedPorts]
+
+        self.portComboBox.clear()
+        for name in rankedPorts + otherPorts:
+            self.portComboBox.addItem(name)
+
+        self.portComboBox.setCurrentIndex(0)
+        self.baudRateComboBox.setCurrentText(str(results[0][1]))
+
+        portName, baudRate, frameNumber, quality = results[0]
+        self.statusBar().showMessage("BMS frames found on %s at %d baud (%d frames, %.0f%% valid)"
+                                     % (portName, baudRate, frameNumber, quality * 100), 5000)
 
     def startMonitor(self):
         """Start the monitor process"""
+        # Display the session if the port is already open
+        if self.portComboBox.currentText() in self.sessionManager.sessions:
+            self.selectSession(self.portComboBox.currentText())
+            return None
+
+        # Every session has its own port
+        previousSerial = self.serial
+        self.serial = serial.Serial()
+
         # Set COM port
         self.serial.port = self.portComboBox.currentText()
 
@@ -762,167 +955,268 @@ class mainWindow(QMainWindow, Ui_MainWindow):
             self.serial.open()
             self.startRecordButton.setEnabled(True)
         except:
+            self.serial = previousSerial
             QMessageBox.critical(self, "COM error", "Please check COM port!")
             return None
 
-        # Disable stop monitor if monitoring is started
+        self.startAcquisition()
+
+    def startReplay(self):
+        """Replay a raw UART capture or a recorded CSV file through the monitor process"""
+        openFileName = QFileDialog.getOpenFileName(
+            self, 'Choose a file to replay', '.', 'Recorded data(*.bin *.csv)')
+
+        if openFileName[0] == '':
+            return None
+
+        if openFileName[0] in self.sessionManager.sessions:
+            QMessageBox.critical(self, "Data error", "This file is already being replayed")
+            return None
+
+        speedDict = {
+            '1x': 1,
+            '10x': 10,
+            '100x': 100,
+            'Unthrottled': 0
+        }
+        speed, accepted = QInputDialog.getItem(
+            self, 'Replay speed', 'Choose the replay speed', list(speedDict.keys()), 0, False)
+
+        if not accepted:
+            return None
+
+        previousSerial = self.serial
+
+        try:
+            self.serial = replaySerial(openFileName[0], speedDict.get(speed))
+            self.serial.open()
+            self.startRecordButton.setEnabled(True)
+        except (OSError, ValueError, KeyError):
+            self.serial = previousSerial
+            QMessageBox.critical(self, "Data error", "Invalid data, please check file")
+            return None
+
+        self.startAcquisition()
+
+    def startAcquisition(self):
+        """Start a session for the opened serial port or replay source"""
+        # Enable stop monitor if monitoring is started
         if self.serial.isOpen():
-            self.startButton.setEnabled(False)
             self.stopButton.setEnabled(True)
             self.portStatusDisplay.setChecked(True)
 
-        # Set the timer for receiving
-        self.timer.start(1)  # 1ms/T
+        # Open the raw UART capture log
+        writer = None
+        if self.captureCheckBox.isChecked():
+            writer = self.startCapture()
+
+        # Start the serial acquisition thread of the session for receiving
+        session = self.sessionManager.addSession(self.serial, writer)
+        self.sessionComboBox.addItem(session.name)
+        self.selectSession(session.name)
+
+        self.timer4.start(1000) # 1s
 
     def stopMonitor(self):
-        """Stop the monitoring process"""
-        try:
-            self.timer.stop()
-            self.stopPlotting()
-            self.stopRecordButton.setChecked(True) #Stop timer 3
-            self.stopCellBalancing()
-            self.serial.close()
-        except:
-            QMessageBox.critical(self, "COM error", "COM close failed")
+        """Stop the monitoring process of the displayed session"""
+        session = self.sessionManager.activeSession()
+
+        if session is not None:
+            try:
+                self.stopCellBalancing() # Send stop balancing command before closing the port
+            except:
+                pass
+
+            self.closeSession(session.name)
+
+        # Display the next open session
+        if self.sessionManager.activeName is not None:
+            self.selectSession(self.sessionManager.activeName)
+            return None
+
+        self.timer4.stop()
+        self.updateMetricsDisplay()
+        self.stopPlotting()
+        self.stopRecordButton.setChecked(True) #Stop timer 3
 
         self.startRecordButton.setEnabled(False)
         self.startButton.setEnabled(True)
         self.stopButton.setEnabled(False)
         self.portStatusDisplay.setChecked(False)
+        self.displayedSession = None
+        self.disconnectTime = None
+
+        # Return to an unopened serial port
+        self.serial = serial.Serial()
+
+    def closeSession(self, name, stopBalancing=False):
+        """Stop one session and remove it from the session list, the displayed session is left as it is"""
+        session = self.sessionManager.sessions.get(name)
+
+        if session is None:
+            return None
+
+        if stopBalancing:
+            try:
+                session.serial.write(b'OVER\t') # Send stop balancing command before closing the port
+            except:
+                pass
+
+        try:
+            self.sessionManager.removeSession(name)
+        except:
+            QMessageBox.critical(self, "COM error", "%s close failed" % name)
+
+        self.sessionComboBox.removeItem(self.sessionComboBox.findText(name))
+
+    def selectSession(self, name):
+        """Display the data of one of the open sessions"""
+        if name not in self.sessionManager.sessions:
+            return None
+
+        self.sessionManager.setActive(name)
+        session = self.sessionManager.activeSession()
+
+        self.serial = session.serial
+        self.metrics = session.metrics
+        self.sessionComboBox.setCurrentIndex(self.sessionComboBox.findText(name))
+
+        # The balancing of the newly displayed pack is checked again
+        if self.displayedSession != name:
+            self.renderCache.forget('cellsBalanced')
+
+        # The live graph, the recording and the status belong to one pack
+        if self.displayedSession is not None and self.displayedSession != name:
+            self.stopRecordButton.setChecked(True)
+            self.resetGraphData()
+            self.frameTime = None
+            self.resetStatus()
+            self.statusBar().showMessage("Displaying %s" % name, 3000)
+            self.disconnectTime = None if session.connected else time.monotonic()
+
+        self.displayedSession = name
+        self.portStatusDisplay.setChecked(session.connected)
+
+        # Show the latest data of the session
+        if session.data is not None:
+            self.displayData(session.data, session.frameTime)
+            self.frameReadTime = None
+
+        self.updateMetricsDisplay()
+
+    def startCapture(self):
+        """Handler for opening the raw UART capture log of the new session"""
+        currentTime = QDateTime.currentDateTime()
+
+        outputDir_1 = '.\\Data' + '\\' + self.batteryType
+        outputDir_2 = outputDir_1 + '\\' + currentTime.toString('dd-MM-yyyy')
+
+        if not os.path.exists(outputDir_1):
+            os.mkdir(outputDir_1)
+
+        if not os.path.exists(outputDir_2):
+            os.mkdir(outputDir_2)
+
+        # Add the port name to tell the sessions apart
+        portName = ''.join(c if c.isalnum() else '_' for c in os.path.basename(str(self.serial.port)))
+        fileName = outputDir_2 + "\\" + str(currentTime.toSecsSinceEpoch()) + "_" + portName + ".bin" # Address name
+
+        try:
+            return captureWriter(fileName)
+        except OSError:
+            QMessageBox.critical(self, "File error", "Raw UART capture file open failed")
+            return None
 
 # ===================Data printing====================
 
     def startRecording(self):
         """Handler for start data recording"""
-        # Detect port status
-        self.timer3.start(1000) # 1s
+        # Record every frame as it is received, or the latest frame every second
+        if self.fullRateCheckBox.isChecked():
+            self.fullRateRecording = True
+        else:
+            self.timer3.start(1000) # 1s
 
         # Disable change output time interval function
         self.recordDoubleSpinBox.setEnabled(False)
+        self.fullRateCheckBox.setEnabled(False)
 
     def stopRecording(self):
         """Handler for stop data recording"""
         self.timer3.stop()
+        self.fullRateRecording = False
 
         # Enable change output time interval function
         self.recordDoubleSpinBox.setEnabled(True)
+        self.fullRateCheckBox.setEnabled(True)
 
     def updateOutputTimeInterval(self):
         """Handler for changing output time interval"""
         self.outputTimeInterval = int(self.recordDoubleSpinBox.value() * 3600)
         
     def recordData(self):
-        """Handler for updating data"""
-        # Update real time data
-        realTimeData = [0 for _ in range(59)]
-
-        if self.serial.isOpen():
+        """Handler for recording the latest frame every second"""
+        # Nothing new is recorded while the port is reconnecting
+        if self.serial.isOpen() and self.disconnectTime is None:
             # Set time information
             currentTime = QDateTime.currentDateTime()
             timeInfo = currentTime.toSecsSinceEpoch()
 
-            # Add realtime data
-            realTimeData[0:14] = self.bccData[1:15] # Cell Voltage Data
-            realTimeData[14] = self.bccData[16] # Pack Current Data
-            realTimeData[15:43] = self.SOC_SOHData # SoC and SoH Data
-            realTimeData[43] = self.EFC_Data
-            realTimeData[44:58] = self.CBData
-            realTimeData[58] = timeInfo # Time information
-
-            self.outputData = np.append(self.outputData, [realTimeData], axis = 0) # Convert to two dimension and add to output data
-
-            if self.outputData.shape[0] > self.outputTimeInterval: # Automatic Recording
-                columnName = [
-                            'cellVoltage_1','cellVoltage_2','cellVoltage_3','cellVoltage_4',
-                            'cellVoltage_5', 'cellVoltage_6', 'cellVoltage_7', 'cellVoltage_8', 
-                            'cellVoltage_9','cellVoltage_10','cellVoltage_11','cellVoltage_12',
-                            'cellVoltage_13','cellVoltage_14',
-                            'packCurrent',
-
-                            'cellSoC_1','cellSoC_2','cellSoC_3','cellSoC_4',
-                            'cellSoC_5','cellSoC_6','cellSoC_7','cellSoC_8',
-                            'cellSoC_9','cellSoC_10','cellSoC_11','cellSoC_12',
-                            'cellSoC_13','cellSoC_14',
-
-                            'cellSoH_1','cellSoH_2','cellSoH_3','cellSoH_4',
-                            'cellSoH_5','cellSoH_6','cellSoH_7','cellSoH_8',
-                            'cellSoH_9','cellSoH_10','cellSoH_11','cellSoH_12',
-                            'cellSoH_13','cellSoH_14',
-                            'equivalentFullCycle',
-
-                            'cellCB_1','cellCB_2','cellCB_3','cellCB_4',
-                            'cellCB_5','cellCB_6','cellCB_7','cellCB_8',
-                            'cellCB_9','cellCB_10','cellCB_11','cellCB_12',
-                            'cellCB_13','cellCB_14',
-
-                            'Date']
-                
-                outputDir_1 = '.\\Data' + '\\' + self.batteryType
-                outputDir_2 = outputDir_1 + '\\' + currentTime.toString('dd-MM-yyyy')
+            self.addOutputRow(timeInfo)
 
-                if not os.path.exists(outputDir_1):
-                    os.mkdir(outputDir_1)
-                
-                if not os.path.exists(outputDir_2):
-                    os.mkdir(outputDir_2)
+        gc.collect() # Collect garbage
 
-                fileName = outputDir_2 + "\\" + str(timeInfo) + ".csv" # Address name
+    def recordFrame(self, frameTime):
+        """Handler for recording a received frame with its own time stamp"""
+        session = self.sessionManager.activeSession()
 
-                self.outputData = np.delete(self.outputData, 0, axis = 0) # Remove first line
+        # Wall-clock time of the frame in ms resolution
+        self.addOutputRow(round(session.clock.toWallTime(frameTime), 3))
 
-                df = pd.DataFrame(self.outputData, columns = columnName) 
-                df.to_csv(fileName, index=False, line_terminator='\n')
+    def addOutputRow(self, timeInfo):
+        """Handler for adding the latest frame to the output data, the data is saved after the output time interval"""
+        # Add realtime data in the order of the recorded columns
+        self.outputData.append((self.frameData[FRAME.recordIndex], timeInfo))
 
-                self.outputData = np.zeros((1,59)).astype(np.int32)
-                del df
+        if timeInfo - self.outputData[0][1] >= self.outputTimeInterval: # Automatic Recording
+            currentTime = QDateTime.fromSecsSinceEpoch(int(timeInfo))
 
-        del realTimeData
-        gc.collect() # Collect garbage
+            outputDir_1 = '.\\Data' + '\\' + self.batteryType
+            outputDir_2 = outputDir_1 + '\\' + currentTime.toString('dd-MM-yyyy')
 
-    def printData(self):
-        """Handler for saving data"""
-        self.stopRecordButton.setChecked(True)
-        
-        if self.serial.isOpen() and self.outputData.shape[0] > 1:
-            fileName = QFileDialog.getSaveFileName(self, "Save File", ".", ("*.csv"))
+            if not os.path.exists(outputDir_1):
+                os.mkdir(outputDir_1)
+            
+            if not os.path.exists(outputDir_2):
+                os.mkdir(outputDir_2)
 
-            self.outputData = np.delete(self.outputData, 0, axis = 0) # Delete 0 line
+            fileName = outputDir_2 + "\\" + str(int(timeInfo)) + ".csv" # Address name
 
-            columnName = [
-            'cellVoltage_1','cellVoltage_2','cellVoltage_3','cellVoltage_4',
-            'cellVoltage_5', 'cellVoltage_6', 'cellVoltage_7', 'cellVoltage_8', 
-            'cellVoltage_9','cellVoltage_10','cellVoltage_11','cellVoltage_12',
-            'cellVoltage_13','cellVoltage_14',
-            'packCurrent',
+            self.writeOutputData(fileName)
 
-            'cellSoC_1','cellSoC_2','cellSoC_3','cellSoC_4',
-            'cellSoC_5','cellSoC_6','cellSoC_7','cellSoC_8',
-            'cellSoC_9','cellSoC_10','cellSoC_11','cellSoC_12',
-            'cellSoC_13','cellSoC_14',
+            self.outputData = []
 
-            'cellSoH_1','cellSoH_2','cellSoH_3','cellSoH_4',
-            'cellSoH_5','cellSoH_6','cellSoH_7','cellSoH_8',
-            'cellSoH_9','cellSoH_10','cellSoH_11','cellSoH_12',
-            'cellSoH_13','cellSoH_14',
-            'equivalentFullCycle',
+    def writeOutputData(self, fileName):
+        """Handler for writing the output data to a CSV file"""
+        df = pd.DataFrame(np.array([row[0] for row in self.outputData]), columns = FRAME.recordColumns[:-1])
+        df['Date'] = [row[1] for row in self.outputData] # Time information
 
-            'cellCB_1','cellCB_2','cellCB_3','cellCB_4',
-            'cellCB_5','cellCB_6','cellCB_7','cellCB_8',
-            'cellCB_9','cellCB_10','cellCB_11','cellCB_12',
-            'cellCB_13','cellCB_14',
+        df.to_csv(fileName, index=False, lineterminator='\n')
+        del df
 
-            'Date']
+    def printData(self):
+        """Handler for saving data"""
+        self.stopRecordButton.setChecked(True)
+        
+        if self.serial.isOpen() and len(self.outputData) > 0:
+            fileName = QFileDialog.getSaveFileName(self, "Save File", ".", ("*.csv"))
 
-            df = pd.DataFrame(self.outputData, columns = columnName)
             try:
-                with open(fileName[0],'w') as f:
-                    df.to_csv(f, index=False, line_terminator='\n')
-                    f.close()
-                    del df
+                self.writeOutputData(fileName[0])
             except:
                 pass
 
-            self.outputData = np.zeros((1,59)).astype(np.int32)
+            self.outputData = []
             gc.collect() # Collect garbage
 
         else:
@@ -934,70 +1228,6 @@ class mainWindow(QMainWindow, Ui_MainWindow):
 
     def plotGraph(self):
         """Show cell status, pack status, IC temperature in a graph"""
-        self.cellCurve0  = self.graphWindow.packVoltageP.plot()
-        self.cellCurve1  = self.graphWindow.p0.plot() # plotDataItem
-        self.cellCurve2  = self.graphWindow.p1.plot()
-        self.cellCurve3  = self.graphWindow.p2.plot()
-        self.cellCurve4  = self.graphWindow.p3.plot()
-        self.cellCurve5  = self.graphWindow.p4.plot()
-        self.cellCurve6  = self.graphWindow.p5.plot()
-        self.cellCurve7  = self.graphWindow.p6.plot()
-        self.cellCurve8  = self.graphWindow.p7.plot()
-        self.cellCurve9  = self.graphWindow.p8.plot()
-        self.cellCurve10 = self.graphWindow.p9.plot()
-        self.cellCurve11 = self.graphWindow.p10.plot()
-        self.cellCurve12 = self.graphWindow.p11.plot()
-        self.cellCurve13 = self.graphWindow.p12.plot()
-        self.cellCurve14 = self.graphWindow.p13.plot()
-
-        self.cellCurve15 = self.graphWindow.ICTempP.plot()
-        self.cellCurve16 = self.graphWindow.packCurrentP.plot()
-
-        self.cellCurve17 = self.graphWindow_SOC.p0.plot()
-        self.cellCurve18 = self.graphWindow_SOC.p1.plot()
-        self.cellCurve19 = self.graphWindow_SOC.p2.plot()
-        self.cellCurve20 = self.graphWindow_SOC.p3.plot()
-        self.cellCurve21 = self.graphWindow_SOC.p4.plot()
-        self.cellCurve22 = self.graphWindow_SOC.p5.plot()
-        self.cellCurve23 = self.graphWindow_SOC.p6.plot()
-        self.cellCurve24 = self.graphWindow_SOC.p7.plot()
-        self.cellCurve25 = self.graphWindow_SOC.p8.plot()
-        self.cellCurve26 = self.graphWindow_SOC.p9.plot()
-        self.cellCurve27 = self.graphWindow_SOC.p10.plot()
-        self.cellCurve28 = self.graphWindow_SOC.p11.plot()
-        self.cellCurve29 = self.graphWindow_SOC.p12.plot()
-        self.cellCurve30 = self.graphWindow_SOC.p13.plot()
-
-        self.cellCurve31 = self.graphWindow_SOH.p0.plot()
-        self.cellCurve32 = self.graphWindow_SOH.p1.plot()
-        self.cellCurve33 = self.graphWindow_SOH.p2.plot()
-        self.cellCurve34 = self.graphWindow_SOH.p3.plot()
-        self.cellCurve35 = self.graphWindow_SOH.p4.plot()
-        self.cellCurve36 = self.graphWindow_SOH.p5.plot()
-        self.cellCurve37 = self.graphWindow_SOH.p6.plot()
-        self.cellCurve38 = self.graphWindow_SOH.p7.plot()
-        self.cellCurve39 = self.graphWindow_SOH.p8.plot()
-        self.cellCurve40 = self.graphWindow_SOH.p9.plot()
-        self.cellCurve41 = self.graphWindow_SOH.p10.plot()
-        self.cellCurve42 = self.graphWindow_SOH.p11.plot()
-        self.cellCurve43 = self.graphWindow_SOH.p12.plot()
-        self.cellCurve44 = self.graphWindow_SOH.p13.plot()
-
-        self.cellCurve45 = self.graphWindow_CB.p0.plot()
-        self.cellCurve46 = self.graphWindow_CB.p1.plot()
-        self.cellCurve47 = self.graphWindow_CB.p2.plot()
-        self.cellCurve48 = self.graphWindow_CB.p3.plot()
-        self.cellCurve49 = self.graphWindow_CB.p4.plot()
-        self.cellCurve50 = self.graphWindow_CB.p5.plot()
-        self.cellCurve51 = self.graphWindow_CB.p6.plot()
-        self.cellCurve52 = self.graphWindow_CB.p7.plot()
-        self.cellCurve53 = self.graphWindow_CB.p8.plot()
-        self.cellCurve54 = self.graphWindow_CB.p9.plot()
-        self.cellCurve55 = self.graphWindow_CB.p10.plot()
-        self.cellCurve56 = self.graphWindow_CB.p11.plot()
-        self.cellCurve57 = self.graphWindow_CB.p12.plot()
-        self.cellCurve58 = self.graphWindow_CB.p13.plot()
-
         if self.serial.isOpen():
             self.timer2.start(200)
             self.startPlotButton.setEnabled(False)
@@ -1008,82 +1238,24 @@ class mainWindow(QMainWindow, Ui_MainWindow):
 
     def updateGraphData(self):
         """Handler for updating curve data"""
-        insertData = list(i / 1000000 for i in self.bccData) # All bcc element divided by 1000000
-        insertData[15] = insertData[15] * 100000 # xxx/1000000*10000=xxx/10
-        insertData[16] = insertData[16] * 1000000 # xx/1000000*1000000=xx
-
-        insertData.extend(list(i / 10 for i in self.SOC_SOHData))
-
-        insertData.extend(self.CBData)
-
-        insertData = np.array(insertData).reshape((59,1))
-
-        self.graphData = np.append(self.graphData, insertData, axis = 1)
-        self.xaxis = np.append(self.xaxis,(self.xaxis[-1] + 0.2))
-
-        if self.graphData.shape[1] >= 9000: # Remove the first value after 9000*0.2/60=30mins
-            self.xaxis = self.xaxis[1:]  # Remove the first x element.
-            self.graphData = np.delete(self.graphData, 0, axis = 1) # Remove first column
-
-        self.cellCurve0.setData(self.xaxis,self.graphData[0], _callSync='off')
-        self.cellCurve1.setData(self.xaxis,self.graphData[1], _callSync='off')
-        self.cellCurve2.setData(self.xaxis,self.graphData[2], _callSync='off')
-        self.cellCurve3.setData(self.xaxis,self.graphData[3], _callSync='off')
-        self.cellCurve4.setData(self.xaxis,self.graphData[4], _callSync='off')
-        self.cellCurve5.setData(self.xaxis,self.graphData[5], _callSync='off')
-        self.cellCurve6.setData(self.xaxis,self.graphData[6], _callSync='off')
-        self.cellCurve7.setData(self.xaxis,self.graphData[7], _callSync='off')
-        self.cellCurve8.setData(self.xaxis,self.graphData[8], _callSync='off')
-        self.cellCurve9.setData(self.xaxis,self.graphData[9], _callSync='off')
-        self.cellCurve10.setData(self.xaxis,self.graphData[10], _callSync='off')
-        self.cellCurve11.setData(self.xaxis,self.graphData[11], _callSync='off')
-        self.cellCurve12.setData(self.xaxis,self.graphData[12], _callSync='off')
-        self.cellCurve13.setData(self.xaxis,self.graphData[13], _callSync='off')
-        self.cellCurve14.setData(self.xaxis,self.graphData[14], _callSync='off')
-        self.cellCurve15.setData(self.xaxis,self.graphData[15], _callSync='off')
-        self.cellCurve16.setData(self.xaxis,self.graphData[16], _callSync='off')
-        self.cellCurve17.setData(self.xaxis,self.graphData[17], _callSync='off')
-        self.cellCurve18.setData(self.xaxis,self.graphData[18], _callSync='off')
-        self.cellCurve19.setData(self.xaxis,self.graphData[19], _callSync='off')
-        self.cellCurve20.setData(self.xaxis,self.graphData[20], _callSync='off')
-        self.cellCurve21.setData(self.xaxis,self.graphData[21], _callSync='off')
-        self.cellCurve22.setData(self.xaxis,self.graphData[22], _callSync='off')
-        self.cellCurve23.setData(self.xaxis,self.graphData[23], _callSync='off')
-        self.cellCurve24.setData(self.xaxis,self.graphData[24], _callSync='off')
-        self.cellCurve25.setData(self.xaxis,self.graphData[25], _callSync='off')
-        self.cellCurve26.setData(self.xaxis,self.graphData[26], _callSync='off')
-        self.cellCurve27.setData(self.xaxis,self.graphData[27], _callSync='off')
-        self.cellCurve28.setData(self.xaxis,self.graphData[28], _callSync='off')
-        self.cellCurve29.setData(self.xaxis,self.graphData[29], _callSync='off')
-        self.cellCurve30.setData(self.xaxis,self.graphData[30], _callSync='off')
-        self.cellCurve31.setData(self.xaxis,self.graphData[31], _callSync='off')
-        self.cellCurve32.setData(self.xaxis,self.graphData[32], _callSync='off')
-        self.cellCurve33.setData(self.xaxis,self.graphData[33], _callSync='off')
-        self.cellCurve34.setData(self.xaxis,self.graphData[34], _callSync='off')
-        self.cellCurve35.setData(self.xaxis,self.graphData[35], _callSync='off')
-        self.cellCurve36.setData(self.xaxis,self.graphData[36], _callSync='off')
-        self.cellCurve37.setData(self.xaxis,self.graphData[37], _callSync='off')
-        self.cellCurve38.setData(self.xaxis,self.graphData[38], _callSync='off')
-        self.cellCurve39.setData(self.xaxis,self.graphData[39], _callSync='off')
-        self.cellCurve40.setData(self.xaxis,self.graphData[40], _callSync='off')
-        self.cellCurve41.setData(self.xaxis,self.graphData[41], _callSync='off')
-        self.cellCurve42.setData(self.xaxis,self.graphData[42], _callSync='off')
-        self.cellCurve43.setData(self.xaxis,self.graphData[43], _callSync='off')
-        self.cellCurve44.setData(self.xaxis,self.graphData[44], _callSync='off')
-        self.cellCurve45.setData(self.xaxis,self.graphData[45], _callSync='off')
-        self.cellCurve46.setData(self.xaxis,self.graphData[46], _callSync='off')
-        self.cellCurve47.setData(self.xaxis,self.graphData[47], _callSync='off')
-        self.cellCurve48.setData(self.xaxis,self.graphData[48], _callSync='off')
-        self.cellCurve49.setData(self.xaxis,self.graphData[49], _callSync='off')
-        self.cellCurve50.setData(self.xaxis,self.graphData[50], _callSync='off')
-        self.cellCurve51.setData(self.xaxis,self.graphData[51], _callSync='off')
-        self.cellCurve52.setData(self.xaxis,self.graphData[52], _callSync='off')
-        self.cellCurve53.setData(self.xaxis,self.graphData[53], _callSync='off')
-        self.cellCurve54.setData(self.xaxis,self.graphData[54], _callSync='off')
-        self.cellCurve55.setData(self.xaxis,self.graphData[55], _callSync='off')
-        self.cellCurve56.setData(self.xaxis,self.graphData[56], _callSync='off')
-        self.cellCurve57.setData(self.xaxis,self.graphData[57], _callSync='off')
-        self.cellCurve58.setData(self.xaxis,self.graphData[58], _callSync='off')
+        # The curves are held at the gap while the port is reconnecting, a zoom or pan is still drawn
+        if self.disconnectTime is not None:
+            self.drawCurves()
+            return None
+
+        session = self.sessionManager.activeSession()
+
+        # The x-axis is the time of the frame since the session started, every frame is plotted once
+        if session is not None and self.frameTime is not None and (
+                len(self.graphPyramid) == 0 or session.clock.elapsed(self.frameTime) > self.graphPyramid.lastX()):
+            # Scale the plotted words of the latest frame to V, degree, mA and %
+            insertData = self.frameData[FRAME.plotIndex] * FRAME.plotScale
+
+            self.graphPyramid.append(session.clock.elapsed(self.frameTime), insertData)
+            self.historyStore.append(session.clock.elapsed(self.frameTime), insertData)
+            self.graphRevision += 1
+
+        self.drawCurves()
 
         self.cbProgressBar.setValue(round(self.SOC_SOHData[0]*0.1))
         self.cbProgressBar_2.setValue(round(self.SOC_SOHData[1]*0.1))
@@ -1100,9 +1272,47 @@ class mainWindow(QMainWindow, Ui_MainWindow):
         self.cbProgressBar_13.setValue(round(self.SOC_SOHData[12]*0.1))
         self.cbProgressBar_14.setValue(round(self.SOC_SOHData[13]*0.1))
 
-        del insertData
         gc.collect()
 
+    def drawCurves(self):
+        """Handler for drawing the curves which are on screen, hidden graphs are skipped until they are shown"""
+        if self.isMinimized():
+            return None
+
+        self.curves.update(self.graphPyramid, self.graphRevision)
+
+    def viewRangeChanged(self):
+        """Handler for a zoomed or panned graph, the redraws are throttled by the view timer"""
+        if not self.viewTimer.isActive():
+            self.viewTimer.start()
+
+    def addGraphGap(self):
+        """Handler for marking a gap after the last point of the graph data, the NaN points break the curves"""
+        if len(self.graphPyramid) == 0:
+            return None
+
+        self.graphPyramid.append(self.graphPyramid.lastX(), np.nan)
+        self.historyStore.append(self.graphPyramid.lastX(), np.nan)
+        self.graphRevision += 1
+
+    def resetGraphData(self):
+        """Handler for emptying the live graph history"""
+        self.graphPyramid.clear()
+        self.historyStore.clear()
+        self.graphRevision += 1
+
+    def updateLiveWindow(self):
+        """Handler for changing the time span of the live graph, the older points stay in the history store"""
+        self.liveWindow = self.liveWindowSpinBox.value()
+
+        self.graphPyramid = minMaxPyramid(self.liveWindow * 300, len(FRAME.plotIndex))
+
+        # Refill the live window with the latest points of the session
+        self.graphPyramid.rebuild(*self.historyStore.read(self.graphPyramid.rebuildStart(len(self.historyStore))))
+        self.graphRevision += 1
+
+        self.drawCurves()
+
     def stopPlotting(self):
         """Handler for stop plotting data"""
         self.timer2.stop()
@@ -1132,7 +1342,7 @@ class mainWindow(QMainWindow, Ui_MainWindow):
             'Pack Current': 16,
         }
 
-        if self.graphData.shape[1] > 2:
+        if len(self.historyStore) > 2:
             graphItemIndex = zoomedGraphDict.get(zoomedGraph)
             
             title = self.zoomGraphComboBox.currentText()
@@ -1146,7 +1356,7 @@ class mainWindow(QMainWindow, Ui_MainWindow):
 
             graphWindow = zoomWindow() # Init zoom window
             graphWindow.labels = [title, yLabel]
-            graphWindow.plot.plot(self.xaxis,self.graphData[graphItemIndex]) # Plot Curve
+            graphWindow.plot.plot(*self.historyStore.read(column = graphItemIndex)) # Plot the whole session from the history store
             graphWindow.updateGraph() # Update labels
             graphWindow.exec()
         else:
@@ -1173,7 +1383,7 @@ class mainWindow(QMainWindow, Ui_MainWindow):
             'Cell 14 SoC': 30,
         }
 
-        if self.graphData.shape[1] > 2:
+        if len(self.historyStore) > 2:
             graphItemIndex = zoomedGraphDict.get(zoomedGraph)
             
             title = self.zoomGraphComboBox_2.currentText()
@@ -1182,7 +1392,7 @@ class mainWindow(QMainWindow, Ui_MainWindow):
 
             graphWindow = zoomWindow() # Init zoom window
             graphWindow.labels = [title, yLabel]
-            graphWindow.plot.plot(self.xaxis,self.graphData[graphItemIndex]) # Plot Curve
+            graphWindow.plot.plot(*self.historyStore.read(column = graphItemIndex)) # Plot the whole session from the history store
             graphWindow.updateGraph() # Update labels
             graphWindow.exec()
         else:
@@ -1209,7 +1419,7 @@ class mainWindow(QMainWindow, Ui_MainWindow):
             'Cell 14 SoH': 44,
         }
 
-        if self.graphData.shape[1] > 2:
+        if len(self.historyStore) > 2:
             graphItemIndex = zoomedGraphDict.get(zoomedGraph)
             
             title = self.zoomGraphComboBox_3.currentText()
@@ -1218,7 +1428,7 @@ class mainWindow(QMainWindow, Ui_MainWindow):
 
             graphWindow = zoomWindow() # Init zoom window
             graphWindow.labels = [title, yLabel]
-            graphWindow.plot.plot(self.xaxis,self.graphData[graphItemIndex]) # Plot Curve
+            graphWindow.plot.plot(*self.historyStore.read(column = graphItemIndex)) # Plot the whole session from the history store
             graphWindow.updateGraph() # Update labels
             graphWindow.exec()
         else:
@@ -1245,7 +1455,7 @@ class mainWindow(QMainWindow, Ui_MainWindow):
             'Cell 14 CB Control': 58,
         }
 
-        if self.graphData.shape[1] > 2:
+        if len(self.historyStore) > 2:
             graphItemIndex = zoomedGraphDict.get(zoomedGraph)
             
             title = self.zoomGraphComboBox_4.currentText()
@@ -1254,7 +1464,7 @@ class mainWindow(QMainWindow, Ui_MainWindow):
 
             graphWindow = zoomWindow() # Init zoom window
             graphWindow.labels = [title, yLabel]
-            graphWindow.plot.plot(self.xaxis,self.graphData[graphItemIndex]) # Plot Curve
+            graphWindow.plot.plot(*self.historyStore.read(column = graphItemIndex)) # Plot the whole session from the history store
             graphWindow.updateGraph() # Update labels
             graphWindow.exec()
         else:
@@ -1331,6 +1541,11 @@ class mainWindow(QMainWindow, Ui_MainWindow):
             else:
                 pass
 
+            self.updateAlarmThresholds()
+
+            # Only the curves of the wired cells are drawn
+            self.curves.setCells(self.cellNumber)
+
 # ===================Status display====================
 
     def displayCellStatus(self, batteryNumber):
@@ -1345,101 +1560,129 @@ class mainWindow(QMainWindow, Ui_MainWindow):
             batteryNumber+1) + " Status", message)
 
     def updateGUIData(self):
-        """This function is used to update GUI display"""
-        # Update cell voltage data and status
+        """This function is used to update GUI display, only the widgets whose value or status changed are updated"""
+        # Update cell voltage data, only the changed rows are repainted
+        self.voltageModel.setVoltages(self.cellData['voltage'])
+
+        # Update cell status
         for i in range(0, 14):
-            self.voltageTable.item(i, 0).setText(
-                str(self.cellData['voltage'][i]))
             if self.cellData['voltageStatus'][i] == voltageStatus.OVERVOLTAGE or self.cellData['voltageStatus'][i] == voltageStatus.UNDERVOLTAGE:
-                self.statusButtonList[i].setStyleSheet(
-                    "background-color: rgb(255, 0, 0)")
+                self.setWidgetStatus(self.statusButtonList[i], 'alarm')
             elif self.cellData['currentStatus'][i] == currentStatus.OVERCURRENT or self.cellData['currentStatus'][i] == currentStatus.UNDERCURRENT:
-                self.statusButtonList[i].setStyleSheet(
-                    "background-color: rgb(255, 0, 0)")
+                self.setWidgetStatus(self.statusButtonList[i], 'alarm')
             else:
-                pass
+                self.setWidgetStatus(self.statusButtonList[i], 'normal')
 
         # Update pack data
-        self.packVoltageLineEdit.setText(str(self.packData['voltage']))
+        self.setWidgetText(self.packVoltageLineEdit, str(self.packData['voltage']))
 
-        self.packCurrentLineEdit.setText(str(self.packData['current']))
+        self.setWidgetText(self.packCurrentLineEdit, str(self.packData['current']))
 
         if self.packData['voltageStatus'] == voltageStatus.OVERVOLTAGE:
-            self.packVoltageStatusDisplay.setStyleSheet(
-                "background-color: rgb(255, 0, 0)")
+            self.setWidgetStatus(self.packVoltageStatusDisplay, 'alarm')
         elif self.packData['voltageStatus'] == voltageStatus.UNDERVOLTAGE:
-            self.packVoltageStatusDisplay.setStyleSheet(
-                "background-color: rgb(255, 0, 0)")
+            self.setWidgetStatus(self.packVoltageStatusDisplay, 'alarm')
         else:
-            pass
+            self.setWidgetStatus(self.packVoltageStatusDisplay, 'normal')
 
         if self.packData['currentStatus'] == currentStatus.OVERCURRENT:
-            self.packCurrentStatusDisplay.setStyleSheet(
-                "background-color: rgb(255, 0, 0)")
+            self.setWidgetStatus(self.packCurrentStatusDisplay, 'alarm')
         elif self.packData['currentStatus'] == currentStatus.UNDERCURRENT:
-            self.packCurrentStatusDisplay.setStyleSheet(
-                "background-color: rgb(255, 0, 0)")
+            self.setWidgetStatus(self.packCurrentStatusDisplay, 'alarm')
         else:
-            pass
+            self.setWidgetStatus(self.packCurrentStatusDisplay, 'normal')
 
         # Update IC data
-        self.ICTempLineEdit.setText(str(self.ICData['temp']))
+        self.setWidgetText(self.ICTempLineEdit, str(self.ICData['temp']))
 
         if self.ICData['tempStatus'] == tempStatus.OVERTEMPERATURE:
-            self.ICStatusDisplay.setStyleSheet(
-                "background-color: rgb(255, 0, 0)")
+            self.setWidgetStatus(self.ICStatusDisplay, 'alarm')
         elif self.ICData['tempStatus'] == tempStatus.UNDERTEMPERATURE:
-            self.ICStatusDisplay.setStyleSheet(
-                "background-color: rgb(255, 0, 0)")
+            self.setWidgetStatus(self.ICStatusDisplay, 'alarm')
         else:
-            pass
+            self.setWidgetStatus(self.ICStatusDisplay, 'normal')
 
         # Update system status data
         if self.systemStatus == systemStatus.IDLE.value:
-            self.systemStatusPushButton.setStyleSheet(
-                "background-color: rgb(0, 0, 0)")
-            self.systemStatusPushButton.setText("IDLE")
+            self.setWidgetStatus(self.systemStatusPushButton, 'idle')
+            self.setWidgetText(self.systemStatusPushButton, "IDLE")
 
         elif self.systemStatus == systemStatus.CHARGE.value:
-            self.systemStatusPushButton.setStyleSheet(
-                "background-color: rgb(65, 105, 225)")
-            self.systemStatusPushButton.setText("CHARGE")
+            self.setWidgetStatus(self.systemStatusPushButton, 'charge')
+            self.setWidgetText(self.systemStatusPushButton, "CHARGE")
 
         elif self.systemStatus == systemStatus.DISCHARGE.value:
-            self.systemStatusPushButton.setStyleSheet(
-                "background-color: rgb(0, 201, 87)")
-            self.systemStatusPushButton.setText("DISCHARGE")
+            self.setWidgetStatus(self.systemStatusPushButton, 'discharge')
+            self.setWidgetText(self.systemStatusPushButton, "DISCHARGE")
 
         elif self.systemStatus == systemStatus.OPENCIRCUIT.value:
-            self.systemStatusPushButton.setStyleSheet(
-                "background-color: rgb(192, 192, 192)")
-            self.systemStatusPushButton.setText("OPENCIRCUIT")
+            self.setWidgetStatus(self.systemStatusPushButton, 'opencircuit')
+            self.setWidgetText(self.systemStatusPushButton, "OPENCIRCUIT")
 
         elif self.systemStatus == systemStatus.FAULT.value:
-            self.systemStatusPushButton.setStyleSheet(
-                "background-color: rgb(255, 0, 0)")
-            self.systemStatusPushButton.setText("FAULT")
+            self.setWidgetStatus(self.systemStatusPushButton, 'fault')
+            self.setWidgetText(self.systemStatusPushButton, "FAULT")
         else:
             pass
 
         # Set EFC value
-        self.efcLineEdit.setText(str(self.EFC_Data))
+        self.setWidgetText(self.efcLineEdit, str(self.EFC_Data))
 
         # Set status
-        self.packVoltageStatusDisplay.setText(
-            self.packData['voltageStatus'].value)
+        self.setWidgetText(self.packVoltageStatusDisplay, self.packData['voltageStatus'].value)
+
+        self.setWidgetText(self.packCurrentStatusDisplay, self.packData['currentStatus'].value)
+
+        self.setWidgetText(self.ICStatusDisplay, self.ICData['tempStatus'].value)
 
-        self.packCurrentStatusDisplay.setText(
-            self.packData['currentStatus'].value)
+        self.setWidgetText(self.packVoltageDifferenceLineEdit, str(self.packData['packVoltageDifference']))
+
+        # Update cell balancing status
+        self.setWidgetChecked(self.CellBalancingStatusDisplay, bool(self.cbStatus == balancingStatus.ON.value))
+
+    def setWidgetText(self, widget, text):
+        """Handler for setting the text of a widget when it differs from the displayed one"""
+        if self.renderCache.changed((id(widget), 'text'), text):
+            widget.setText(text)
+
+    def setWidgetChecked(self, widget, checked):
+        """Handler for checking or unchecking a widget when it differs from the displayed state"""
+        if self.renderCache.changed((id(widget), 'checked'), checked):
+            widget.setChecked(checked)
+
+    def setWidgetStatus(self, widget, status):
+        """Handler for setting the status property of a widget, the style is only polished again on a transition"""
+        if self.renderCache.changed((id(widget), 'status'), status):
+            widget.setProperty('status', status)
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
+
+    def refreshGUI(self):
+        """Handler for refreshing the GUI with the latest frame, the frames received in between are coalesced"""
+        if not self.guiDirty:
+            return None
 
-        self.ICStatusDisplay.setText(self.ICData['tempStatus'].value)
+        self.guiDirty = False
+        self.updateGUIData()
 
-        self.packVoltageDifferenceLineEdit.setText(str(self.packData['packVoltageDifference']))
+        # The GUI latency is measured once per refresh, from the reading of the newest displayed frame
+        session = self.sessionManager.activeSession()
+        if session is not None and self.frameReadTime is not None:
+            session.metrics.addGuiUpdate(self.frameReadTime)
+            self.frameReadTime = None
+
+    def updateDisplayRate(self):
+        """Handler for changing the GUI refresh rate"""
+        self.displayRate = self.displayRateSpinBox.value()
+        self.timer5.start(round(1000 / self.displayRate))
 
 # ===================Cell balancing====================
     def startCellBalancing(self):
         # Disable start cell balancing button if monitoring is started
         if self.serial.isOpen():
+            # A pack which is already balanced is stopped again by the next frame
+            self.renderCache.forget('cellsBalanced')
+
             self.command = b'OPEN\t'
             self.serial.write(self.command)
 
@@ -1461,6 +1704,52 @@ class mainWindow(QMainWindow, Ui_MainWindow):
             QMessageBox.critical(
                 self, 'COM error', 'COM data error, please reconnect the port')
 
+# ===================Acquisition metrics====================
+
+    def updateMetricsDisplay(self):
+        """Show the acquisition health metrics in the status bar"""
+        data = self.metrics.snapshot()
+
+        self.metricsLabel.setText(
+            "Frames: %d (%.1f/s) | Rejected: %d | Resyncs: %d | Discarded: %d B | Decode: %.2f ms | Latency: %.1f ms | Queue: %d | Reconnects: %d | Interval: %.1f ± %.1f ms" % (
+                data['framesReceived'], data['framesPerSecond'], data['framesRejected'],
+                data['resyncs'], data['discardedBytes'], data['decodeTime']['mean'],
+                data['guiLatency']['mean'], data['queueDepth'], data['reconnects'],
+                data['frameIntervalMs'], data['frameJitterMs']))
+
+        # Summary of all the open sessions
+        summary = []
+        for session in self.sessionManager.sessions.values():
+            if not session.connected:
+                summary.append("%s: reconnecting" % session.name)
+            elif session.data is None:
+                summary.append("%s: no data" % session.name)
+            else:
+                summary.append("%s: %.3f V, %d mA, %s" % (
+                    session.name, session.data[0] / 1000000, session.data[16],
+                    systemStatus(int(session.data[60])).name))
+
+        if len(summary) == 0:
+            summary.append("No open session")
+
+        self.sessionSummaryLabel.setText('\n'.join(summary))
+
+    def exportMetrics(self):
+        """Handler for saving the acquisition health metrics"""
+        fileName = QFileDialog.getSaveFileName(
+            self, "Save File", ".", "JSON file(*.json);;CSV file(*.csv)")
+
+        if fileName[0] == '':
+            return None
+
+        try:
+            if fileName[0].lower().endswith('.csv'):
+                self.metrics.exportCsv(fileName[0])
+            else:
+                self.metrics.exportJson(fileName[0])
+        except OSError:
+            QMessageBox.critical(self, "File error", "Metrics export failed")
+
 # ===================GUI pop-up dialogues====================
 
     def helpAction(self):
@@ -1504,128 +1793,123 @@ class mainWindow(QMainWindow, Ui_MainWindow):
 
     def updateData(self):
         """This function is used to update the data as well as the status"""
+        # Debounced status of every channel, a latched alarm is kept until resetStatus is called
+        alarmCodes = self.alarmPolicy.update(self.alarmEngine, self.bccData)
+
         # Update pack voltage
         self.packData['voltage'] = self.bccData[0] / 1000
-
-        if self.statusUpdateFlag[0] == 0:
-            if self.packData['voltage'] > self.packVoltageThreshold[1]:
-                self.packData['voltageStatus'] = voltageStatus.OVERVOLTAGE
-                self.statusUpdateFlag[0] = 1
-            elif self.packData['voltage'] < self.packVoltageThreshold[0]:
-                self.packData['voltageStatus'] = voltageStatus.UNDERVOLTAGE
-                self.statusUpdateFlag[0] = 1
-            else:
-                self.packData['voltageStatus'] = voltageStatus.DEFAULT
+        self.packData['voltageStatus'] = VOLTAGE_STATUS[alarmCodes[PACK_VOLTAGE]]
 
         # Update pack current
         self.packData['current'] = self.bccData[16]
-
-        if self.statusUpdateFlag[16] == 0:
-            if abs(self.packData['current']) > self.currentThreshold[1]:
-                self.packData['currentStatus'] = currentStatus.OVERCURRENT
-                self.statusUpdateFlag[16] = 1
-            elif abs(self.packData['current']) < self.currentThreshold[0]:
-                self.packData['currentStatus'] = currentStatus.UNDERCURRENT
-                self.statusUpdateFlag[16] = 1
-            else:
-                self.packData['currentStatus'] = currentStatus.DEFAULT
+        self.packData['currentStatus'] = CURRENT_STATUS[alarmCodes[PACK_CURRENT]]
 
         # Update cell voltage
+        cellCodes = alarmCodes[CELL_VOLTAGE]
         for i in range(0, 14):
             self.cellData['voltage'][i] = self.bccData[i+1] / 1000
             self.cellData['currentStatus'][i] = self.packData['currentStatus']
-
-            if self.statusUpdateFlag[i + 1] == 0:
-                if self.cellData['voltage'][i] > self.voltageThreshold[1]:
-                    self.cellData['voltageStatus'][i] = voltageStatus.OVERVOLTAGE
-                    self.statusUpdateFlag[i + 1] = 1
-                elif self.cellData['voltage'][i] < self.voltageThreshold[0]:
-                    self.cellData['voltageStatus'][i] = voltageStatus.UNDERVOLTAGE
-                    self.statusUpdateFlag[i + 1] = 1
-                else:
-                    self.cellData['voltageStatus'][i] = voltageStatus.DEFAULT
+            self.cellData['voltageStatus'][i] = VOLTAGE_STATUS[cellCodes[i]]
 
         # Update IC Temperature
         self.ICData['temp'] = self.bccData[15] / 10
-
-        if self.statusUpdateFlag[15] == 0:
-            if self.ICData['temp'] > self.tempThreshold[1]:
-                self.ICData['tempStatus'] = tempStatus.OVERTEMPERATURE
-                self.statusUpdateFlag[15] = 1
-            elif self.ICData['temp'] < self.tempThreshold[0]:
-                self.ICData['tempStatus'] = tempStatus.UNDERTEMPERATURE
-                self.statusUpdateFlag[15] = 1
-            else:
-                self.ICData['tempStatus'] = tempStatus.DEFAULT
+        self.ICData['tempStatus'] = TEMP_STATUS[alarmCodes[IC_TEMP]]
 
         # Update pack voltage difference
         if self.cellNumber == 14:
             self.packData['packVoltageDifference'] = np.ptp(np.array(self.bccData[1:15])) / 1000 # Convert uV to mV
         elif self.cellNumber == 7:
-            subsetIndices = np.array([1, 2, 3, 4, 12, 13, 14])
-            arr = np.array(self.bccData)
-            subSet = arr[subsetIndices]
-            self.packData['packVoltageDifference'] = np.ptp(np.array(subSet)) / 1000 # Convert uV to mV
+            subSet = np.array(self.bccData)[CELL_VOLTAGE][CELL_POSITIONS[7]]
+            self.packData['packVoltageDifference'] = np.ptp(subSet) / 1000 # Convert uV to mV
         else:
             pass
 
-        # Close the cb if the voltage difference is less than threshold
-        if self.packData['packVoltageDifference'] <= self.cbThreshold and all(element == 0 for element in self.CBData):
+        # Close the cb if the voltage difference is less than threshold, the command is only sent when the pack becomes balanced
+        balanced = bool(self.packData['packVoltageDifference'] <= self.cbThreshold and not any(self.CBData))
+        if self.renderCache.changed('cellsBalanced', balanced) and balanced:
             self.stopCellBalancing()
-        
-        # Update cell balancing status
-        if self.cbStatus == balancingStatus.ON.value:
-            self.CellBalancingStatusDisplay.setChecked(True)
-        else:
-            self.CellBalancingStatusDisplay.setChecked(False)
 
-    def receiveData(self):
-        """Handler for receiving data"""
-        bccRawData = []
-        dataList = []
+    def receiveData(self, name, data, frameTime, readTime):
+        """Handler for receiving the data decoded by the acquisition thread of a session"""
+        session = self.sessionManager.sessions.get(name)
 
-        try:
-            # Get the data bits in waiting
-            self.waitBits = self.serial.in_waiting
+        if session is None: # Session closed while the frame was queued
+            return None
 
-            # Wait and receive the data again to avoid error
-            if self.waitBits > 0:
-                time.sleep(0.1)
-                self.waitBits = self.serial.in_waiting
-        except:
-            QMessageBox.critical(
-                self, 'COM error', 'COM data error, please reconnect the port')
-            self.stopMonitor()
+        # The frames of other sessions are only kept in their session
+        if name == self.sessionManager.activeName:
+            self.displayData(data, frameTime)
+            self.frameReadTime = readTime
+
+            if self.fullRateRecording:
+                self.recordFrame(frameTime)
+
+        session.metrics.addFrameHandled()
+
+    def displayData(self, data, frameTime):
+        """Update the displayed data with a decoded frame and its time stamp"""
+        self.frameData = data
+        self.frameTime = frameTime
+        self.bccData = data[FRAME.slice('packVoltage', 'packCurrent')]
+        self.SOC_SOHData = data[FRAME.slice('cellSoC', 'cellSoH')]
+        self.EFC_Data = data[FRAME.field('equivalentFullCycle').offset]
+        self.CBData = data[FRAME.slice('cellCB')]
+        self.systemStatus = data[FRAME.field('systemStatus').offset]
+        self.cbStatus = data[FRAME.field('cbStatus').offset]
+
+        self.updateData()
+
+        # The widgets are updated by the GUI refresh timer
+        self.guiDirty = True
+
+    def serialError(self, name, message):
+        """Handler for serial errors reported by the acquisition thread of a session"""
+        if name not in self.sessionManager.sessions:
             return None
 
-        if self.waitBits > 0:
-            # Read data from COM port
-            bccRawData = self.serial.read(self.waitBits)
-            
-            # Transfer the byte data to UART data list
-            dataList = list(hex(data) for data in list(bccRawData))
-
-            # Filter out incorrect inputs
-            if len(dataList) == 248:
-                data = util.listData2strData(dataList)
-
-                if data[46] > 2: # 46 is the cb control of cell 1, if it is larger than 2, it is incorrect
-                    self.serial.reset_input_buffer()
-                else:
-                    self.bccData = data[0:17]
-                    self.SOC_SOHData = data[17:45]
-                    self.EFC_Data = data[45]
-                    self.CBData = data[46:60]
-                    self.systemStatus = data[60]
-                    self.cbStatus = data[61]
-
-                    self.updateData()
-                    self.updateGUIData()
-            else:
-                pass
+        QMessageBox.critical(
+            self, 'COM error', '%s data error, please reconnect the port' % name)
+
+        self.endSession(name)
+
+    def replayFinished(self, name):
+        """Handler for the end of a replayed file, its session is closed"""
+        if name not in self.sessionManager.sessions:
+            return None
+
+        self.statusBar().showMessage("Replay of %s finished" % name, 5000)
+        self.endSession(name)
+
+    def endSession(self, name):
+        """Close a session which ended by itself, the display is only reset if the session was displayed"""
+        if name == self.sessionManager.activeName:
+            self.stopMonitor()
         else:
-            pass
+            self.closeSession(name)
     
+    def connectionLost(self, name, message):
+        """Handler for a dropout of a port, the session keeps its data and reconnects in the background"""
+        if name != self.sessionManager.activeName:
+            return None
+
+        self.portStatusDisplay.setChecked(False)
+        self.statusBar().showMessage("%s lost (%s), reconnecting..." % (name, message))
+
+        # Break the curves after the last received point
+        self.disconnectTime = time.monotonic()
+        self.addGraphGap()
+
+    def connectionRestored(self, name):
+        """Handler for a port opened again, plotting and recording carry on by themselves"""
+        if name != self.sessionManager.activeName:
+            return None
+
+        self.portStatusDisplay.setChecked(True)
+        self.statusBar().showMessage("%s reconnected" % name, 5000)
+
+        # The next frame is plotted at its own time after the gap
+        self.disconnectTime = None
+
     def closeEvent(self, event):
         """ Handler for closing event """
         yesButton = QMessageBox.StandardButton.Yes
@@ -1634,9 +1918,12 @@ class mainWindow(QMainWindow, Ui_MainWindow):
         msg = QMessageBox.warning(
             self, "Warning", "You are going to close the GUI!", yesButton, noButton)
         if msg == QMessageBox.Yes:
-            # Send stop balancing command before close the GUI
-            if self.serial.isOpen():
-                self.stopMonitor()
+            # Send stop balancing command and close every session before close the GUI
+            for name in list(self.sessionManager.sessions):
+                self.closeSession(name, stopBalancing=True)
+
+            # Delete the history files
+            self.historyStore.close()
                 
             event.accept()
         else:
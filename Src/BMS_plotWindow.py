@@ -11,6 +11,8 @@ sys.path.append('.')
 
 # Import 
 from UI.initDialog import Ui_InitValueDialog
+# Import frame layout schema
+from util.frameSchema import FRAME
 
 class plotWindow(pg.GraphicsLayoutWidget):
     """Window for plotting graphs"""
@@ -71,6 +73,10 @@ class plotWindow(pg.GraphicsLayoutWidget):
         self.packCurrentP.setLabel('left', "Current (mA)")
         self.packCurrentP.enableAutoRange(axis='y')
 
+    def livePlots(self):
+        """Return the plots in the order of the graph data rows"""
+        return [self.packVoltageP] + self.voltageCurves + [self.ICTempP, self.packCurrentP]
+
 
 class zoomWindow(QDialog):
     """Window for zooming graphs"""
@@ -319,22 +325,28 @@ class loadGraphWindow(QDialog):
     
     def loadGraphData(self, readFile):
         """Handler for loading curve data"""
+        # Keep the recorded columns which are plotted, the time and EFC columns are left out
+        fieldNames = [field.name for field in FRAME.fields if field.recorded and field.plotted]
 
-        readFile = readFile.drop('Date', axis=1) # Remove time column
-        readFile = readFile.drop('equivalentFullCycle', axis=1) # Remove EFC column
-
-        self.data = readFile.values # Set data frame as matrix
+        self.data = readFile[FRAME.columnNames(*fieldNames)].values # Set data frame as matrix
 
         self.data = np.array(self.data).astype(np.float32) # Transfer matrix to numpy matrix
 
         self.data = np.transpose(self.data) # Transpose the matrix
 
-        for j in range(0,14):
-            self.plotTabWindow.voltageCurves[j].plot(list(i / 1000000 for i in self.data[j])) # Set voltage data in order
-            self.plotTabWindow_2.SoCCurves[j].plot(list(i / 10 for i in self.data[j+15]))
-            self.plotTabWindow_3.SoHCurves[j].plot(list(i / 10 for i in self.data[j+29]))
-            self.plotTabWindow_4.CBCurves[j].plot(list(i / 10 for i in self.data[j+43]))
-        self.plotTabWindow.packCurrentP.plot(list(i for i in self.data[14]))
+        curveDict = {
+            'cellVoltage': self.plotTabWindow.voltageCurves,
+            'cellSoC': self.plotTabWindow_2.SoCCurves,
+            'cellSoH': self.plotTabWindow_3.SoHCurves,
+            'cellCB': self.plotTabWindow_4.CBCurves,
+        }
+
+        for name, curves in curveDict.items():
+            fieldData = readFile[FRAME.columnNames(name)].values.astype(np.float32) * FRAME.field(name).scale
+
+            for j in range(len(curves)):
+                curves[j].plot(fieldData[:, j]) # Set data in order
+        self.plotTabWindow.packCurrentP.plot(readFile['packCurrent'].values.astype(np.float32))
 
     def zoomGraph(self):
         """Handler for zooming graph"""
@@ -527,6 +539,10 @@ class SOCPlotWindow(pg.GraphicsLayoutWidget):
             curve.setLabel('left', "SoC (%)")
             curve.enableAutoRange(axis='y')
 
+    def livePlots(self):
+        """Return the plots in the order of the graph data rows"""
+        return self.SoCCurves
+
 
 class SOHPlotWindow(pg.GraphicsLayoutWidget):
     """Window for plotting graphs"""
@@ -570,6 +586,10 @@ class SOHPlotWindow(pg.GraphicsLayoutWidget):
             curve.setLabel('left', "SoH (%)")
             curve.enableAutoRange(axis='y')
 
+    def livePlots(self):
+        """Return the plots in the order of the graph data rows"""
+        return self.SoHCurves
+
 class CBPlotWindow(pg.GraphicsLayoutWidget):
     """Window for plotting graphs"""
     def __init__(self):
@@ -612,6 +632,90 @@ class CBPlotWindow(pg.GraphicsLayoutWidget):
             curve.setLabel('left', "CB (On/Off)")
             curve.enableAutoRange(axis='y')
 
+    def livePlots(self):
+        """Return the plots in the order of the graph data rows"""
+        return self.CBCurves
+
+class curveRegistry:
+    """Live curves of the graph windows, one per graph data row, keyed by the schema column name"""
+    def __init__(self, columns, plots):
+        self.columns = list(columns)
+        self.rows = {column: row for row, column in enumerate(self.columns)}
+
+        # Every curve is created once and reused by every plotting run
+        self.curves = [plot.plot() for plot in plots]
+        self.enabled = [True for _ in self.curves]
+
+        # What each curve was last drawn with: (data revision, x range, pixels)
+        self.drawn = {}
+
+    def __len__(self):
+        return len(self.curves)
+
+    def curve(self, column):
+        return self.curves[self.rows[column]]
+
+    def setEnabled(self, columns, enabled=True):
+        """Show or hide several curves at once, hidden curves are not drawn"""
+        for column in columns:
+            row = self.rows[column]
+
+            self.enabled[row] = enabled
+            self.curves[row].setVisible(enabled)
+            self.drawn.pop(row, None)
+
+    def viewBoxes(self):
+        """Return the view box of every plot holding a curve"""
+        viewBoxes = []
+        for curve in self.curves:
+            viewBox = curve.getViewBox()
+            if viewBox is not None and viewBox not in viewBoxes:
+                viewBoxes.append(viewBox)
+
+        return viewBoxes
+
+    def setCells(self, cellNumber):
+        """Only draw the per cell curves of the cells wired in the set-up"""
+        fitted = FRAME.cellColumns(cellNumber)
+
+        self.setEnabled(fitted, True)
+        self.setEnabled([column for column in FRAME.cellColumns() if column not in fitted], False)
+
+    def clear(self):
+        """Empty every curve"""
+        for curve in self.curves:
+            curve.clear()
+
+        self.drawn = {}
+
+    def update(self, pyramid, revision):
+        """Draw the enabled curves which are on screen from the decimation pyramid"""
+        for row, curve in enumerate(self.curves):
+            if not self.enabled[row]:
+                continue
+
+            viewWidget = curve.getViewWidget()
+            if viewWidget is None or not viewWidget.isVisible(): # Inactive tab or page
+                continue
+
+            viewBox = curve.getViewBox()
+
+            if viewBox is None or viewBox.state['autoRange'][0]: # Following the latest data
+                xRange = None
+            else:
+                xRange = tuple(viewBox.viewRange()[0])
+
+            pixels = max(int(viewBox.width()), 100) if viewBox is not None else 1000
+
+            # Nothing to redraw if neither the data nor the view changed
+            drawState = (revision, xRange, pixels)
+            if self.drawn.get(row) == drawState:
+                continue
+
+            # Every curve only gets the points of its visible range at the screen resolution
+            curve.setData(*pyramid.curveData(row, xRange, pixels), _callSync='off')
+            self.drawn[row] = drawState
+
 class setInitValueDialog(QDialog, Ui_InitValueDialog):
     """Main window widget for BMS GUI"""
     def __init__(self):
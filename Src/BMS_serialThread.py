@@ -0,0 +1,190 @@
+"""
+Serial acquisition thread for the BMS GUI
+The UART data is read and decoded here so that the GUI thread is never blocked by serial I/O
+"""
+
+# Import time for stamping the raw data
+import time
+# Expend file path
+import sys
+sys.path.append('.')
+
+# Import pyserial for serial communication
+import serial
+# Import PyQt thread: PySide6
+from PySide6.QtCore import QThread, Signal
+
+# Import util functions
+import util.util as util
+
+
+class serialThread(QThread):
+    """Background worker which owns the reading of the serial port"""
+    frameReceived = Signal(object, float, float) # Decoded bcc data array, frame time stamp, read time (perf_counter)
+    errorOccurred = Signal(str) # Serial error message
+    connectionLost = Signal(str) # Serial error message, the thread is reconnecting
+    connectionRestored = Signal()
+    sourceFinished = Signal() # End of a replayed file
+
+    def __init__(self, serialPort, metrics, captureWriter=None, reconnect=True, maxQueueDepth=None):
+        super().__init__()
+
+        self.serial = serialPort
+
+        # Acquisition health metrics shared with the GUI
+        self.metrics = metrics
+
+        # Optional raw UART capture log, every byte read is handed to its writer thread
+        self.captureWriter = captureWriter
+
+        # Read timeout, the thread checks the running flag at least once per timeout
+        # A stop request also wakes up the blocked read through cancel_read
+        self.serial.timeout = 1
+
+        # Set until stop is called, so that a stop before the thread starts running is not lost
+        self.running = True
+
+        # Reopen the port after a dropout instead of stopping, the delay is doubled after every failed attempt
+        self.reconnect = reconnect
+        self.minReconnectDelay = 0.5 # s
+        self.maxReconnectDelay = 8 # s
+
+        # Frames the GUI may have queued before the reading waits, None never waits
+        # A source faster than the GUI, such as an unthrottled replay, is slowed down to the display speed
+        self.maxQueueDepth = maxQueueDepth
+
+        # Framer which re-aligns the UART stream without flushing the port
+        self.framer = util.frameSynchroniser()
+
+        # Time of the previous read (perf_counter), the earliest possible stamp of the next frames
+        self.lastReadTime = 0
+
+        # Bytes read from the source, the position of the frames in the stream of a replay
+        self.bytesRead = 0
+
+    def run(self):
+        """Handler for receiving data"""
+        while self.running:
+            try:
+                # Block until the rest of the next frame arrives, the thread only wakes up when data is received
+                # Everything in waiting is taken at once if more than one frame is queued
+                frameRemain = util.FRAME_SIZE - self.framer.pendingBytes() % util.FRAME_SIZE
+                bccRawData = self.serial.read(max(frameRemain, self.serial.in_waiting))
+            except EOFError:
+                self.sourceFinished.emit()
+                break
+            except (serial.SerialException, OSError, TypeError, AttributeError) as error:
+                if not self.running:
+                    break
+
+                if not self.reconnect:
+                    self.errorOccurred.emit(str(error))
+                    break
+
+                self.connectionLost.emit(str(error))
+
+                if not self.reopen():
+                    break
+
+                # The bytes of the broken frame are lost with the old connection
+                self.framer.reset()
+                self.metrics.addReconnect()
+                self.connectionRestored.emit()
+                continue
+
+            if len(bccRawData) == 0:
+                continue
+
+            readTime = time.perf_counter()
+            self.bytesRead += len(bccRawData)
+
+            if self.captureWriter is not None:
+                self.captureWriter.write(bccRawData, time.monotonic())
+
+            # Pull every complete frame out of the stream, garbage bytes are skipped by the framer
+            rawFrames = self.framer.push(bccRawData)
+
+            laterBytes = self.framer.pendingBytes() + len(rawFrames) * util.FRAME_SIZE
+
+            frames = []
+            for frame in rawFrames:
+                laterBytes -= util.FRAME_SIZE
+                data = util.bytesData2bccData(frame)
+
+                if not util.isFrameValid(data):
+                    self.metrics.addFrame(False)
+                else:
+                    frames.append((data, self.frameTime(readTime, laterBytes)))
+
+            self.metrics.addRead(len(bccRawData), self.framer.resyncCount,
+                                 self.framer.discardedBytes, time.perf_counter() - readTime)
+            self.lastReadTime = readTime
+
+            for data, frameTime in frames:
+                self.waitForGui()
+                self.metrics.addFrame(True, frameTime)
+                self.frameReceived.emit(data, frameTime, readTime)
+
+        self.running = False
+
+    def waitForGui(self):
+        """Handler for waiting until the GUI has room for one more frame, return at once if the thread is stopped"""
+        if self.maxQueueDepth is None:
+            return None
+
+        while self.running and self.metrics.pendingFrames() >= self.maxQueueDepth:
+            time.sleep(0.005)
+
+    def frameTime(self, readTime, laterBytes):
+        """Handler for the time stamp of a frame followed by laterBytes bytes of the latest read
+
+        A replayed frame keeps the wall-clock time it was recorded at, so the replay speed does not change its
+        time line. A received frame is stamped with the read time less the time taken by the bytes received
+        after it, but not earlier than the previous read since its bytes were not there yet.
+        """
+        if hasattr(self.serial, 'recordedTime'):
+            return self.serial.recordedTime(self.bytesRead - laterBytes - 1)
+
+        return max(readTime - laterBytes * self.byteTime(), self.lastReadTime)
+
+    def byteTime(self):
+        """Handler for the time (s) taken by one UART byte with start and stop bits, 0 for the replay sources"""
+        baudRate = getattr(self.serial, 'baudrate', None)
+
+        return 10 / baudRate if baudRate else 0
+
+    def reopen(self):
+        """Handler for opening the lost port again with back-off, return False if the thread is stopped first"""
+        delay = self.minReconnectDelay
+
+        while self.running:
+            try:
+                self.serial.close()
+            except (serial.SerialException, OSError):
+                pass
+
+            # Wait in short steps so that a stop request is handled at once
+            endTime = time.monotonic() + delay
+            while self.running and time.monotonic() < endTime:
+                time.sleep(0.05)
+
+            if not self.running:
+                break
+
+            try:
+                self.serial.open()
+                return True
+            except (serial.SerialException, OSError, ValueError):
+                delay = min(delay * 2, self.maxReconnectDelay)
+
+        return False
+
+    def stop(self):
+        """Handler for stopping the thread, the port is left open for the caller to close"""
+        self.running = False
+
+        # Wake up the blocked read
+        if hasattr(self.serial, 'cancel_read'):
+            self.serial.cancel_read()
+
+        self.wait()
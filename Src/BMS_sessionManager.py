@@ -0,0 +1,149 @@
+"""
+Session manager for monitoring several BMS boards at once
+Every session has its own serial port, acquisition thread, health metrics and decoded data
+"""
+
+# Expend file path
+import sys
+sys.path.append('.')
+
+# Import pyserial for telling the real ports from the replay sources
+import serial
+# Import PyQt core: PySide6
+from PySide6.QtCore import QObject, Signal
+
+# Import serial acquisition thread
+from BMS_serialThread import serialThread
+# Import acquisition health metrics
+from util.acquisitionMetrics import acquisitionMetrics
+# Import wall-clock anchor of the frame time stamps
+from util.frameTiming import frameClock
+
+
+class bmsSession(QObject):
+    """One connected BMS board"""
+    frameReceived = Signal(str, object, float, float) # Session name, decoded bcc data array, frame time stamp, read time
+    errorOccurred = Signal(str, str) # Session name, serial error message
+    connectionLost = Signal(str, str) # Session name, serial error message
+    connectionRestored = Signal(str) # Session name
+    replayFinished = Signal(str) # Session name
+
+    def __init__(self, serialPort, captureWriter=None):
+        super().__init__()
+
+        self.name = str(serialPort.port)
+        self.serial = serialPort
+        self.captureWriter = captureWriter
+        self.metrics = acquisitionMetrics()
+
+        # Latest decoded frame, its time stamp and its read time (perf_counter), None until the first frame is received
+        self.data = None
+        self.frameTime = None
+        self.readTime = None
+
+        # Wall-clock time of the frame time stamps, a replay keeps the time line of its recording
+        if hasattr(self.serial, 'recordedTime'):
+            self.clock = frameClock(self.serial.firstTimeStamp, self.serial.firstTimeStamp)
+        else:
+            self.clock = frameClock()
+
+        # False while the port is being reopened after a dropout
+        self.connected = True
+
+        # Only the real ports are reopened, a replay source ends for good and is read no faster than the GUI
+        realPort = isinstance(self.serial, serial.Serial)
+        self.thread = serialThread(self.serial, self.metrics, self.captureWriter,
+                                   reconnect=realPort, maxQueueDepth=None if realPort else 16)
+        self.thread.frameReceived.connect(self.receiveData)
+        self.thread.errorOccurred.connect(lambda message: self.errorOccurred.emit(self.name, message))
+        self.thread.connectionLost.connect(self.loseConnection)
+        self.thread.connectionRestored.connect(self.restoreConnection)
+        self.thread.sourceFinished.connect(lambda: self.replayFinished.emit(self.name))
+
+    def start(self):
+        """Start the acquisition thread of the session"""
+        self.thread.start()
+
+    def stop(self):
+        """Stop the acquisition thread, close the capture log and the port"""
+        self.thread.stop()
+
+        if self.captureWriter is not None:
+            self.captureWriter.close()
+            self.captureWriter = None
+
+        self.serial.close()
+
+    def loseConnection(self, message):
+        """Handler for a dropout of the port"""
+        self.connected = False
+        self.connectionLost.emit(self.name, message)
+
+    def restoreConnection(self):
+        """Handler for the port opened again"""
+        self.connected = True
+        self.connectionRestored.emit(self.name)
+
+    def receiveData(self, data, frameTime, readTime):
+        """Handler for keeping the latest frame of the session"""
+        self.data = data
+        self.frameTime = frameTime
+        self.readTime = readTime
+        self.frameReceived.emit(self.name, data, frameTime, readTime)
+
+
+class sessionManager(QObject):
+    """Keep the open sessions and the one displayed by the GUI"""
+    frameReceived = Signal(str, object, float, float) # Session name, decoded bcc data array, frame time stamp, read time
+    errorOccurred = Signal(str, str) # Session name, serial error message
+    connectionLost = Signal(str, str) # Session name, serial error message
+    connectionRestored = Signal(str) # Session name
+    replayFinished = Signal(str) # Session name
+
+    def __init__(self):
+        super().__init__()
+
+        self.sessions = {}
+        self.activeName = None
+
+    def addSession(self, serialPort, captureWriter=None):
+        """Start a session for an opened port and return it"""
+        session = bmsSession(serialPort, captureWriter)
+        session.frameReceived.connect(self.frameReceived)
+        session.errorOccurred.connect(self.errorOccurred)
+        session.connectionLost.connect(self.connectionLost)
+        session.connectionRestored.connect(self.connectionRestored)
+        session.replayFinished.connect(self.replayFinished)
+
+        self.sessions[session.name] = session
+        session.start()
+
+        if self.activeName is None:
+            self.activeName = session.name
+
+        return session
+
+    def removeSession(self, name):
+        """Stop a session and forget it"""
+        session = self.sessions.pop(name, None)
+
+        # The next session is displayed even if closing the port fails
+        if self.activeName == name:
+            self.activeName = next(iter(self.sessions), None)
+
+        if session is not None:
+            session.stop()
+
+    def setActive(self, name):
+        """Set the session displayed by the GUI"""
+        if name in self.sessions:
+            self.activeName = name
+
+    def activeSession(self):
+        """Return the displayed session, None if no session is open"""
+        return self.sessions.get(self.activeName)
+
+    def stopAll(self):
+        """Stop every session"""
+        for name in list(self.sessions):
+            self.removeSession(name)
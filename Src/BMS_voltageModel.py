@@ -0,0 +1,65 @@
+"""
+Table model of the cell voltages
+The voltage table reads the cell voltages straight from a NumPy array, a refresh only repaints the rows
+whose voltage changed and the number of rows follows the number of cells of the daisy chain
+"""
+
+# Expend file path
+import sys
+sys.path.append('.')
+
+import numpy as np
+# Import PyQt core: PySide6
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+
+class voltageTableModel(QAbstractTableModel):
+    """Cell voltage (mV) and unit of every cell"""
+    headers = ['Voltage', 'Unit']
+
+    def __init__(self, cellNumber=14):
+        super().__init__()
+
+        self.voltages = np.zeros(cellNumber)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.voltages.size
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+
+        if index.column() == 0:
+            return str(float(self.voltages[index.row()]))
+
+        return 'mV'
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+
+        if orientation == Qt.Horizontal:
+            return self.headers[section]
+
+        return 'CELL%d' % (section + 1)
+
+    def setVoltages(self, voltages):
+        """Show new cell voltages, one dataChanged range covers the changed rows"""
+        voltages = np.asarray(voltages, dtype=float)
+
+        # A different number of cells changes the rows of the table
+        if voltages.size != self.voltages.size:
+            self.beginResetModel()
+            self.voltages = voltages.copy()
+            self.endResetModel()
+            return None
+
+        changed = np.flatnonzero(voltages != self.voltages)
+        if changed.size == 0:
+            return None
+
+        self.voltages[:] = voltages
+        self.dataChanged.emit(self.index(changed[0], 0), self.index(changed[-1], 0), [Qt.DisplayRole])
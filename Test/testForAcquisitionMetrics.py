@@ -0,0 +1,39 @@
+import sys
+sys.path.append('.')
+import json
+import os
+import tempfile
+import time
+import unittest
+from util.acquisitionMetrics import acquisitionMetrics
+
+class functionTest(unittest.TestCase):
+    def test_of_metrics(self):
+        """Handler for testing the counters and the export"""
+        metrics = acquisitionMetrics()
+        readTime = time.perf_counter()
+
+        metrics.addRead(496, 1, 12, 0.0002)
+        metrics.addFrame(True)
+        metrics.addFrame(True)
+        metrics.addFrame(False)
+        metrics.addFrameHandled()
+        metrics.addGuiUpdate(readTime)
+
+        data = metrics.snapshot()
+        self.assertEqual(data['framesReceived'], 2)
+        self.assertEqual(data['framesRejected'], 1)
+        self.assertEqual(data['queueDepth'], 1)
+        self.assertEqual(len(metrics.guiLatency.samples), 1)
+        self.assertEqual(data['discardedBytes'], 12)
+        self.assertAlmostEqual(data['decodeTime']['max'], 0.2)
+
+        with tempfile.TemporaryDirectory() as folder:
+            metrics.exportJson(os.path.join(folder, 'metrics.json'))
+            metrics.exportCsv(os.path.join(folder, 'metrics.csv'))
+
+            with open(os.path.join(folder, 'metrics.json')) as f:
+                self.assertEqual(json.load(f)['resyncs'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
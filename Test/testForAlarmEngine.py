@@ -0,0 +1,93 @@
+import sys
+sys.path.append('.')
+import unittest
+import numpy as np
+from util.alarmEngine import (NORMAL, UNDER, OVER, PACK_VOLTAGE, CELL_VOLTAGE, IC_TEMP, PACK_CURRENT,
+                              alarmEngine, alarmPolicy, packAlarmEngine)
+
+class functionTest(unittest.TestCase):
+    def test_of_status_codes(self):
+        """Handler for testing the under, normal and over codes, the limits are normal"""
+        engine = alarmEngine(3)
+        engine.setThreshold(slice(0, 3), 10, 20)
+
+        codes = engine.evaluate([9, 10, 21])
+        self.assertEqual(codes.tolist(), [UNDER, NORMAL, OVER])
+        self.assertEqual(codes.dtype, np.int8)
+
+    def test_of_pack_channels(self):
+        """Handler for testing the scaling of the pack channels on a batch of frames"""
+        engine = packAlarmEngine()
+        engine.setThreshold(PACK_VOLTAGE, 2500 * 14, 4200 * 14)
+        engine.setThreshold(CELL_VOLTAGE, 2500, 4200)
+        engine.setThreshold(IC_TEMP, -20, 60)
+        engine.setThreshold(PACK_CURRENT, 0, 1500)
+
+        frame = np.zeros(17)
+        frame[PACK_VOLTAGE] = 3600000 * 14 # uV
+        frame[CELL_VOLTAGE] = 3600000
+        frame[IC_TEMP] = 250 # 0.1 degree
+        frame[PACK_CURRENT] = -1000 # mA, charging
+
+        batch = np.tile(frame, (3, 1))
+        batch[1, 5] = 4300000 # Cell 5 over voltage
+        batch[2, IC_TEMP] = 700 # Over temperature
+        batch[2, PACK_CURRENT] = -2000 # Over current in the charging direction
+
+        codes = engine.evaluate(batch)
+        self.assertEqual(codes.shape, (3, 17))
+        self.assertTrue(np.all(codes[0] == NORMAL))
+        self.assertEqual(np.flatnonzero(codes[1]).tolist(), [5])
+        self.assertEqual(codes[2, [IC_TEMP, PACK_CURRENT]].tolist(), [OVER, OVER])
+
+    def test_of_debounce(self):
+        """Handler for testing that a single glitch is ignored and 2 of the last 3 frames raise the alarm"""
+        engine = alarmEngine(2)
+        engine.setThreshold(slice(0, 2), 10, 20)
+        policy = alarmPolicy(2, window=3)
+        policy.setDebounce(slice(None), 2)
+
+        statuses = [policy.update(engine, frame).tolist() for frame in [[15, 15], [25, 15], [15, 15], [15, 5], [15, 5]]]
+        self.assertEqual(statuses, [[NORMAL, NORMAL], [NORMAL, NORMAL], [NORMAL, NORMAL], [NORMAL, NORMAL], [NORMAL, UNDER]])
+
+    def test_of_hysteresis_and_auto_clear(self):
+        """Handler for testing that an auto-clear alarm only clears inside the hysteresis band"""
+        engine = alarmEngine(1)
+        engine.setThreshold(0, 10, 20)
+        policy = alarmPolicy(1)
+        policy.setHysteresis(0, 2)
+        policy.setLatch(0, False)
+
+        statuses = [int(policy.update(engine, [value])[0]) for value in [21, 19, 18, 21, 5, 15]]
+        self.assertEqual(statuses, [OVER, OVER, NORMAL, OVER, UNDER, NORMAL])
+
+    def test_of_hysteresis_at_zero_limit(self):
+        """Handler for testing that an auto-clear alarm clears at rest when the low limit is 0"""
+        engine = alarmEngine(1)
+        engine.setThreshold(0, 0, 1000)
+        policy = alarmPolicy(1)
+        policy.setHysteresis(0, 10)
+        policy.setLatch(0, False)
+
+        # A normal channel is normal at the limit, an over alarm clears at 0 mA
+        statuses = [int(policy.update(engine, [value])[0]) for value in [0, 1200, 995, 0, 0]]
+        self.assertEqual(statuses, [NORMAL, OVER, OVER, NORMAL, NORMAL])
+
+        # An under alarm needs the hysteresis above the low limit
+        statuses = [int(policy.update(engine, [value])[0]) for value in [-5, 5, 10]]
+        self.assertEqual(statuses, [UNDER, UNDER, NORMAL])
+
+    def test_of_latch(self):
+        """Handler for testing that the default policy latches the first violation until reset"""
+        engine = alarmEngine(1)
+        engine.setThreshold(0, 10, 20)
+        policy = alarmPolicy(1)
+
+        statuses = [int(policy.update(engine, [value])[0]) for value in [20, 5, 15, 25]]
+        self.assertEqual(statuses, [NORMAL, UNDER, UNDER, UNDER])
+
+        policy.reset()
+        self.assertEqual(int(policy.update(engine, [25])[0]), OVER)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,27 @@
+import sys
+sys.path.append('.')
+import os
+import tempfile
+import unittest
+from util.captureLog import captureWriter, captureReader
+
+class functionTest(unittest.TestCase):
+    def test_of_capture_round_trip(self):
+        """Handler for testing writing and reading a capture file"""
+        with tempfile.TemporaryDirectory() as folder:
+            fileName = os.path.join(folder, 'capture.bin')
+
+            writer = captureWriter(fileName)
+            writer.write(b'\x01\x02\x03', 10.0)
+            writer.write(b'\x04' * 300, 10.5)
+            writer.close()
+
+            reader = captureReader(fileName)
+            chunks = list(reader)
+
+            self.assertEqual(chunks, [(10.0, b'\x01\x02\x03'), (10.5, b'\x04' * 300)])
+            self.assertEqual(reader.readAll(), b'\x01\x02\x03' + b'\x04' * 300)
+            self.assertEqual(writer.byteCount, 303)
+
+if __name__ == '__main__':
+    unittest.main()
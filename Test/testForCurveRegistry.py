@@ -0,0 +1,41 @@
+import sys
+sys.path.append('.')
+sys.path.append('./Src')
+import os
+import unittest
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+import pyqtgraph as pg
+from PySide6.QtWidgets import QApplication
+from util.frameSchema import FRAME
+from BMS_plotWindow import curveRegistry
+
+app = QApplication.instance() or QApplication([])
+
+class functionTest(unittest.TestCase):
+    def test_of_seven_cells(self):
+        """Handler for testing that the 7 cells set-up draws the curves of cells 1-4 and 12-14 only"""
+        plot = pg.PlotItem()
+        curves = curveRegistry(FRAME.plotColumns, [plot] * len(FRAME.plotColumns))
+
+        curves.setCells(7)
+        enabled = [column for column in FRAME.plotColumns if curves.enabled[curves.rows[column]]]
+
+        self.assertEqual([column for column in enabled if column.startswith('cellVoltage')],
+                         ['cellVoltage_%d' % i for i in [1, 2, 3, 4, 12, 13, 14]])
+        self.assertIn('packCurrent', enabled)
+        self.assertIn('cellCB_13', enabled)
+        self.assertNotIn('cellSoH_7', enabled)
+        self.assertFalse(curves.curve('cellVoltage_5').isVisible())
+
+        curves.setCells(14)
+        self.assertTrue(all(curves.enabled))
+
+    def test_of_view_boxes(self):
+        """Handler for testing that every plot is listed once for the range changed redraws"""
+        plots = [pg.PlotItem(), pg.PlotItem()]
+        curves = curveRegistry(['a', 'b', 'c'], [plots[0], plots[1], plots[0]])
+
+        self.assertEqual(curves.viewBoxes(), [plot.getViewBox() for plot in plots])
+
+if __name__ == '__main__':
+    unittest.main()
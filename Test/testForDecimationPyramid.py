@@ -0,0 +1,78 @@
+import sys
+sys.path.append('.')
+import unittest
+import numpy as np
+from util.decimationPyramid import minMaxPyramid
+
+class functionTest(unittest.TestCase):
+    def test_of_spike_kept(self):
+        """Handler for testing that a coarse level keeps the spikes and stays within the pixel budget"""
+        pyramid = minMaxPyramid(20000, 2, minimumBuckets=16, dtype=np.float32)
+        values = np.sin(np.arange(20000) / 500.0)
+        values[12345] = 9.0
+
+        for i in range(20000):
+            pyramid.append(i * 0.2, [values[i], -values[i]])
+
+        x, y = pyramid.curveData(0, pixels=500)
+        self.assertLessEqual(len(x), 1000 + 2)
+        self.assertEqual(y.max(), 9.0)
+        self.assertAlmostEqual(float(y.min()), values.min(), places=5)
+
+        # A small visible range is drawn from the points themselves
+        x, y = pyramid.curveData(1, xRange=(100.0, 110.0), pixels=500)
+        self.assertTrue(np.allclose(y, -values[np.round(x / 0.2).astype(int)]))
+        self.assertLessEqual(x[0], 100.0)
+        self.assertGreater(x[-1], 110.0)
+        self.assertLess(len(x), 60)
+
+    def test_of_rebuild(self):
+        """Handler for testing that rebuilding gives the same levels as adding the points one by one"""
+        x = np.arange(1999) * 0.2
+        values = np.random.rand(3, 1999)
+        values[1, 700] = np.nan # Gap
+
+        incremental = minMaxPyramid(2000, 3, minimumBuckets=8, dtype=np.float32)
+        for i in range(1999):
+            incremental.append(x[i], values[:, i])
+
+        rebuilt = minMaxPyramid(2000, 3, minimumBuckets=8, dtype=np.float32)
+        rebuilt.rebuild(x, values)
+
+        for level in range(len(incremental.xLevels)):
+            for row in range(3):
+                a = incremental.curveData(row, pixels=10 ** level)
+                b = rebuilt.curveData(row, pixels=10 ** level)
+                self.assertTrue(np.array_equal(a[0], b[0]))
+                self.assertTrue(np.array_equal(a[1], b[1], equal_nan=True))
+
+    def test_of_rebuild_after_wrap(self):
+        """Handler for testing that rebuilding a wrapped live window gives the same curves as adding the points"""
+        x = np.arange(20001) * 0.2
+        values = np.random.rand(3, 20001)
+
+        incremental = minMaxPyramid(9000, 3, minimumBuckets=8, dtype=np.float32)
+        for i in range(20001):
+            incremental.append(x[i], values[:, i])
+
+        rebuilt = minMaxPyramid(9000, 3, minimumBuckets=8, dtype=np.float32)
+        start = rebuilt.rebuildStart(20001)
+        rebuilt.rebuild(x[start:], values[:, start:])
+
+        for pixels in [10, 100, 500, 5000]:
+            for row in range(3):
+                a = incremental.curveData(row, pixels=pixels)
+                b = rebuilt.curveData(row, pixels=pixels)
+                self.assertTrue(np.array_equal(a[0], b[0]))
+                self.assertTrue(np.array_equal(a[1], b[1]))
+
+                # No bucket older than the live window is drawn
+                self.assertGreaterEqual(a[0][0], x[20001 - 9000])
+
+        # Both carry on the same way
+        incremental.append(x[-1] + 0.2, values[:, 0])
+        rebuilt.append(x[-1] + 0.2, values[:, 0])
+        self.assertTrue(np.array_equal(incremental.curveData(2, pixels=100)[1], rebuilt.curveData(2, pixels=100)[1]))
+
+if __name__ == '__main__':
+    unittest.main()
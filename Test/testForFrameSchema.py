@@ -0,0 +1,47 @@
+import sys
+sys.path.append('.')
+import struct
+import unittest
+import numpy as np
+from util.frameSchema import CELL_POSITIONS, FRAME
+from util.util import bytesData2bccData
+
+class functionTest(unittest.TestCase):
+    def test_of_frame_layout(self):
+        """Handler for testing that the schema matches the frame sent by the firmware"""
+        self.assertEqual(FRAME.words, 62)
+        self.assertEqual(FRAME.dtype.itemsize, 248)
+        self.assertEqual(FRAME.slice('packVoltage', 'packCurrent'), slice(0, 17))
+        self.assertEqual(FRAME.slice('cellCB'), slice(46, 60))
+        self.assertEqual(FRAME.field('cbStatus').offset, 61)
+
+        # Recorded columns and graph rows of the previous versions
+        self.assertEqual(len(FRAME.recordColumns), 59)
+        self.assertEqual(FRAME.recordColumns[14:16], ['packCurrent', 'cellSoC_1'])
+        self.assertEqual(FRAME.recordColumns[-1], 'Date')
+        self.assertEqual(FRAME.plotIndex.tolist(), list(range(45)) + list(range(46, 60)))
+        self.assertEqual(FRAME.plotColumns[15:18], ['icTemp', 'packCurrent', 'cellSoC_1'])
+
+    def test_of_structured_view(self):
+        """Handler for testing reading the fields by name from the decoded frames"""
+        data = bytesData2bccData(struct.pack('<62i', *range(62)) * 2)
+        frames = FRAME.view(data)
+
+        self.assertEqual(frames.shape, (2,))
+        self.assertEqual(frames['cellVoltage'][1].tolist(), list(range(1, 15)))
+        self.assertEqual(int(FRAME.view(data[0])['systemStatus']), 60)
+        self.assertTrue(np.allclose((data[0][FRAME.plotIndex] * FRAME.plotScale)[[1, 15, 16]], [1e-6, 1.5, 16]))
+
+    def test_of_cell_columns(self):
+        """Handler for testing the columns of the cells wired in the 7 cells set-up"""
+        columns = FRAME.cellColumns(7)
+
+        self.assertEqual(len(FRAME.cellColumns()), 56)
+        self.assertEqual(len(columns), 28)
+        self.assertEqual(columns[:7], ['cellVoltage_%d' % i for i in [1, 2, 3, 4, 12, 13, 14]])
+        self.assertIn('cellCB_12', columns)
+        self.assertNotIn('cellSoC_5', columns)
+        self.assertEqual(CELL_POSITIONS[14], list(range(14)))
+
+if __name__ == '__main__':
+    unittest.main()
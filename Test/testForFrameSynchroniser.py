@@ -0,0 +1,51 @@
+import sys
+sys.path.append('.')
+import struct
+import unittest
+import util.util as util
+
+def makeFrame(cellVoltage):
+    """Handler for building a bcc UART frame"""
+    data = [cellVoltage * 14] + [cellVoltage] * 14 + [250, -34] + [500] * 28 + [3] + [0] * 14 + [2, 0]
+    return struct.pack('<62i', *data)
+
+class functionTest(unittest.TestCase):
+    def test_of_split_frames(self):
+        """Handler for testing frames split over several reads"""
+        framer = util.frameSynchroniser()
+        stream = makeFrame(3600000) + makeFrame(3700000)
+
+        frames = framer.push(stream[:100])
+        frames += framer.push(stream[100:372])
+        frames += framer.push(stream[372:])
+
+        self.assertEqual(frames, [makeFrame(3600000), makeFrame(3700000)])
+        self.assertEqual(framer.resyncCount, 0)
+        self.assertEqual(framer.discardedBytes, 0)
+
+    def test_of_resync(self):
+        """Handler for testing garbage between frames"""
+        framer = util.frameSynchroniser()
+        garbage = b'\xff\x13\x77'
+        stream = makeFrame(3600000)[100:] + makeFrame(3700000) + garbage + makeFrame(3800000)
+
+        frames = framer.push(stream)
+
+        self.assertEqual(frames, [makeFrame(3700000), makeFrame(3800000)])
+        self.assertEqual(framer.resyncCount, 2)
+        self.assertEqual(framer.discardedBytes, 248 - 100 + len(garbage))
+
+    def test_of_large_read(self):
+        """Handler for testing that every frame of a read larger than the buffer capacity is kept"""
+        framer = util.frameSynchroniser()
+        stream = b''.join(makeFrame(3600000 + i) for i in range(100))
+
+        frames = framer.push(stream)
+
+        self.assertEqual(len(frames), 100)
+        self.assertEqual(frames[-1], makeFrame(3600099))
+        self.assertEqual(framer.discardedBytes, 0)
+        self.assertEqual(framer.pendingBytes(), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,27 @@
+import sys
+sys.path.append('.')
+import unittest
+from util.frameTiming import frameRateEstimator, frameClock
+
+class functionTest(unittest.TestCase):
+    def test_of_rate_estimation(self):
+        """Handler for testing the send interval and jitter estimate"""
+        estimator = frameRateEstimator()
+        self.assertEqual(estimator.rate, 0.0)
+
+        for i in range(500):
+            estimator.add(i * 0.2 + (0.01 if i % 2 else -0.01)) # 5 Hz with +-10 ms jitter
+
+        self.assertAlmostEqual(estimator.interval, 0.2, places=2)
+        self.assertAlmostEqual(estimator.rate, 5, places=0)
+        self.assertGreater(estimator.jitter, 0.01)
+        self.assertLess(estimator.jitter, 0.03)
+
+    def test_of_wall_time(self):
+        """Handler for testing the conversion of the frame stamps to wall-clock time"""
+        clock = frameClock()
+        self.assertAlmostEqual(clock.toWallTime(clock.monotonicTime + 1.5), clock.wallTime + 1.5)
+        self.assertAlmostEqual(clock.elapsed(clock.monotonicTime + 2), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import sys
+sys.path.append('.')
+import os
+import unittest
+import numpy as np
+from util.historyStore import historyStore
+
+class functionTest(unittest.TestCase):
+    def test_of_segments(self):
+        """Handler for testing reading the points across several memory-mapped segments"""
+        store = historyStore(3, segmentRows=4)
+
+        for i in range(10):
+            store.append(i * 0.2, [i, 2 * i, 3 * i])
+        store.append(2.0, np.nan) # Gap
+
+        self.assertEqual(len(store), 11)
+        self.assertEqual(len(os.listdir(store.folder)), 3)
+
+        x, data = store.read()
+        self.assertTrue(np.allclose(x[:10], np.arange(10) * 0.2))
+        self.assertEqual(data.shape, (3, 11))
+        self.assertEqual(data[2, 3:7].tolist(), [9, 12, 15, 18])
+        self.assertTrue(np.isnan(data[:, -1]).all())
+
+        x, data = store.read(2, 6, column=1)
+        self.assertEqual(data.tolist(), [4, 6, 8, 10])
+        self.assertEqual(x.tolist(), [0.4, 0.6000000000000001, 0.8, 1.0])
+
+        # One column of the whole history matches the full read
+        self.assertTrue(np.array_equal(store.read(column=2)[1], store.read()[1][2], equal_nan=True))
+
+        store.clear()
+        self.assertEqual(store.read()[1].shape, (3, 0))
+
+        store.close()
+        self.assertFalse(os.path.exists(store.folder))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import sys
+sys.path.append('.')
+import subprocess
+import unittest
+from util.portDiscovery import discoverPorts, probePort
+
+class functionTest(unittest.TestCase):
+    def test_of_unusable_ports(self):
+        """Handler for testing that missing ports are left out of the discovery"""
+        self.assertEqual(discoverPorts([], [115200]), [])
+        self.assertEqual(probePort('/dev/nonexistent_bms', [9600, 115200]), [])
+        self.assertEqual(discoverPorts(['/dev/nonexistent_bms'], [9600, 115200]), [])
+
+    @unittest.skipIf(sys.platform == 'win32', "the virtual device needs a pseudo-terminal")
+    def test_of_ranking(self):
+        """Handler for testing that a clean virtual device is found and ranked ahead of a noisy one"""
+        devices = []
+        try:
+            for faultRate in ['0', '0.5']:
+                device = subprocess.Popen([sys.executable, 'util/virtualS32K.py', '--rate', '50',
+                                           '--fault-rate', faultRate, '--duration', '10'],
+                                          stdout=subprocess.PIPE, text=True)
+                devices.append(device)
+            cleanPort, noisyPort = [device.stdout.readline().split()[-1] for device in devices]
+
+            results = discoverPorts([noisyPort, cleanPort], [115200], listenTime=1.0)
+        finally:
+            for device in devices:
+                device.kill()
+                device.communicate()
+
+        self.assertEqual([result[0] for result in results], [cleanPort, noisyPort])
+        self.assertEqual(results[0][1], 115200)
+        self.assertGreater(results[0][2], 10)
+        self.assertEqual(results[0][3], 1.0)
+        self.assertLess(results[1][3], 1.0)
+
+if __name__ == '__main__':
+    unittest.main()
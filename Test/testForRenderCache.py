@@ -0,0 +1,29 @@
+import sys
+sys.path.append('.')
+import unittest
+from util.renderCache import renderCache
+
+class functionTest(unittest.TestCase):
+    def test_of_change_only(self):
+        """Handler for testing that only changed values are pushed"""
+        cache = renderCache()
+        self.assertTrue(cache.changed(('pack', 'text'), '3.7'))
+        self.assertFalse(cache.changed(('pack', 'text'), '3.7'))
+        self.assertTrue(cache.changed(('pack', 'style'), '3.7')) # Properties are kept apart
+        self.assertTrue(cache.changed(('pack', 'text'), '3.8'))
+
+    def test_of_forget(self):
+        """Handler for testing that forgotten values are pushed again"""
+        cache = renderCache()
+        cache.changed('a', 1)
+        cache.changed('b', 2)
+
+        cache.forget('a')
+        self.assertTrue(cache.changed('a', 1))
+        self.assertFalse(cache.changed('b', 2))
+
+        cache.clear()
+        self.assertTrue(cache.changed('b', 2))
+
+if __name__ == '__main__':
+    unittest.main()
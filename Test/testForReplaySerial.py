@@ -0,0 +1,97 @@
+import sys
+sys.path.append('.')
+sys.path.append('./Src')
+import os
+import tempfile
+import time
+import unittest
+import util.util as util
+from util.acquisitionMetrics import acquisitionMetrics
+from util.replaySerial import replaySerial
+from BMS_serialThread import serialThread
+
+columnName = (['cellVoltage_%d' % i for i in range(1, 15)] + ['packCurrent'] +
+              ['cellSoC_%d' % i for i in range(1, 15)] + ['cellSoH_%d' % i for i in range(1, 15)] +
+              ['equivalentFullCycle'] + ['cellCB_%d' % i for i in range(1, 15)] + ['Date'])
+
+def writeRecord(fileName, rowNumber):
+    """Write a CSV file like recordData with one row per second"""
+    with open(fileName, 'w') as f:
+        f.write(','.join(columnName) + '\n')
+        for second in range(rowNumber):
+            row = [3600000] * 14 + [-500] + [800] * 14 + [1000] * 14 + [2] + [1] + [0] * 13 + [1681388555 + second]
+            f.write(','.join(str(i) for i in row) + '\n')
+
+class functionTest(unittest.TestCase):
+    def test_of_csv_replay(self):
+        """Handler for testing the replay of a recorded CSV file"""
+        with tempfile.TemporaryDirectory() as folder:
+            fileName = os.path.join(folder, 'record.csv')
+            writeRecord(fileName, 3)
+
+            port = replaySerial(fileName, 0)
+            port.timeout = 0.1
+            port.open()
+
+            frames = util.frameSynchroniser().push(port.read(248 * 3))
+            data = util.bytesData2bccData(b''.join(frames))
+
+            self.assertEqual(data.shape, (3, 62))
+            self.assertEqual(data[0, 0], 3600000 * 14)
+            self.assertEqual(data[1, 16], -500)
+            self.assertEqual(data[2, 46], 1)
+            self.assertEqual(data[2, 61], 1)
+
+            # The end of the file is reported instead of reading nothing forever
+            with self.assertRaises(EOFError):
+                port.read(10)
+
+    def test_of_replay_end(self):
+        """Handler for testing that the acquisition thread reports the end of the replay after the last frame"""
+        with tempfile.TemporaryDirectory() as folder:
+            fileName = os.path.join(folder, 'record.csv')
+            writeRecord(fileName, 3)
+
+            port = replaySerial(fileName, 0)
+            port.open()
+            thread = serialThread(port, acquisitionMetrics(), reconnect=False)
+
+            events = []
+            frameTimes = []
+            thread.frameReceived.connect(lambda data, frameTime, readTime: events.append('frame'))
+            thread.frameReceived.connect(lambda data, frameTime, readTime: frameTimes.append(frameTime))
+            thread.sourceFinished.connect(lambda: events.append('finished'))
+            thread.errorOccurred.connect(lambda message: events.append('error'))
+            thread.run()
+
+            self.assertEqual(events, ['frame', 'frame', 'frame', 'finished'])
+
+            # The unthrottled replay keeps the recorded time line
+            self.assertEqual(frameTimes, [1681388555, 1681388556, 1681388557])
+
+    def test_of_unthrottled_backpressure(self):
+        """Handler for testing that an unthrottled replay waits for the GUI to handle the queued frames"""
+        with tempfile.TemporaryDirectory() as folder:
+            fileName = os.path.join(folder, 'record.csv')
+            writeRecord(fileName, 50)
+
+            port = replaySerial(fileName, 0)
+            port.open()
+            metrics = acquisitionMetrics()
+            thread = serialThread(port, metrics, reconnect=False, maxQueueDepth=4)
+            thread.start()
+
+            try:
+                time.sleep(0.3)
+                self.assertEqual(metrics.pendingFrames(), 4)
+
+                # One frame handled by the GUI lets one more frame through
+                metrics.addFrameHandled()
+                time.sleep(0.1)
+                self.assertEqual(metrics.snapshot()['framesReceived'], 5)
+            finally:
+                thread.stop()
+            port.close()
+
+if __name__ == '__main__':
+    unittest.main()
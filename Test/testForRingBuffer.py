@@ -0,0 +1,34 @@
+import sys
+sys.path.append('.')
+import unittest
+import numpy as np
+from util.ringBuffer import ringBuffer
+
+class functionTest(unittest.TestCase):
+    def test_of_wrap_around(self):
+        """Handler for testing that the views keep the latest samples in order after wrapping around"""
+        buffer = ringBuffer(4, 2)
+        self.assertEqual(buffer.view().shape, (2, 0))
+
+        for i in range(7):
+            buffer.append([i, -i])
+
+        self.assertTrue(buffer.full)
+        self.assertEqual(buffer.view().tolist(), [[3, 4, 5, 6], [-3, -4, -5, -6]])
+        self.assertEqual(buffer.last().tolist(), [6, -6])
+        self.assertTrue(buffer.view()[0].flags['C_CONTIGUOUS'])
+        self.assertTrue(np.shares_memory(buffer.view(), buffer.storage))
+
+    def test_of_one_dimension(self):
+        """Handler for testing a one dimension buffer"""
+        buffer = ringBuffer(3)
+        buffer.extend(np.arange(10.0))
+        self.assertEqual(buffer.view().tolist(), [7.0, 8.0, 9.0])
+
+        buffer.clear()
+        buffer.append(1.5)
+        self.assertEqual(buffer.view().tolist(), [1.5])
+        self.assertEqual(len(buffer), 1)
+
+if __name__ == '__main__':
+    unittest.main()
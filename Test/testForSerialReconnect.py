@@ -0,0 +1,71 @@
+import sys
+sys.path.append('.')
+sys.path.append('./Src')
+import struct
+import unittest
+import serial
+from BMS_serialThread import serialThread
+from util.acquisitionMetrics import acquisitionMetrics
+
+class droppingPort:
+    """Port which drops out once, fails to reopen once and then sends one frame"""
+    def __init__(self, thread=None):
+        self.thread = thread
+        self.timeout = None
+        self.in_waiting = 0
+        self.reads = 0
+        self.opens = 0
+
+    def read(self, size):
+        self.reads += 1
+        if self.reads == 1:
+            raise serial.SerialException("device disconnected")
+        self.thread.running = False
+        return struct.pack('<62i', *([0] * 62))
+
+    def open(self):
+        self.opens += 1
+        if self.opens == 1:
+            raise serial.SerialException("port not found")
+
+    def close(self):
+        pass
+
+class functionTest(unittest.TestCase):
+    def test_of_reconnect_after_dropout(self):
+        """Handler for testing that the thread reopens the port and carries on receiving"""
+        port = droppingPort()
+        metrics = acquisitionMetrics()
+        thread = serialThread(port, metrics)
+        thread.minReconnectDelay = 0
+        port.thread = thread
+
+        events = []
+        thread.connectionLost.connect(lambda message: events.append('lost'))
+        thread.connectionRestored.connect(lambda: events.append('restored'))
+        thread.errorOccurred.connect(lambda message: events.append('error'))
+        thread.frameReceived.connect(lambda data, frameTime, readTime: events.append(int(data[0])))
+
+        thread.run() # Run in this thread
+
+        self.assertEqual(events, ['lost', 'restored', 0])
+        self.assertEqual(port.opens, 2)
+        self.assertEqual(metrics.snapshot()['reconnects'], 1)
+
+    def test_of_no_reconnect(self):
+        """Handler for testing that a source without reconnecting reports the error and stops"""
+        port = droppingPort()
+        thread = serialThread(port, acquisitionMetrics(), reconnect=False)
+        port.thread = thread
+
+        events = []
+        thread.connectionLost.connect(lambda message: events.append('lost'))
+        thread.errorOccurred.connect(lambda message: events.append(message))
+
+        thread.run()
+
+        self.assertEqual(events, ['device disconnected'])
+        self.assertEqual(port.opens, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import sys
+sys.path.append('.')
+sys.path.append('./Src')
+import time
+import unittest
+from BMS_sessionManager import sessionManager
+
+class silentPort:
+    """Port without data, closing it can fail"""
+    def __init__(self, port, closeFails=False):
+        self.port = port
+        self.timeout = None
+        self.in_waiting = 0
+        self.closed = False
+        self.closeFails = closeFails
+
+    def read(self, size=1):
+        time.sleep(0.01)
+        return b''
+
+    def cancel_read(self):
+        pass
+
+    def close(self):
+        self.closed = True
+        if self.closeFails:
+            raise OSError('close failed')
+
+class functionTest(unittest.TestCase):
+    def test_of_remove_background_session(self):
+        """Handler for testing that removing a session that is not displayed keeps the displayed one"""
+        manager = sessionManager()
+        ports = [silentPort('COM1'), silentPort('COM2')]
+        for port in ports:
+            manager.addSession(port)
+
+        manager.removeSession('COM2')
+
+        self.assertEqual(manager.activeName, 'COM1')
+        self.assertEqual(list(manager.sessions), ['COM1'])
+        self.assertTrue(ports[1].closed)
+        self.assertFalse(ports[0].closed)
+        manager.stopAll()
+
+    def test_of_remove_failing_session(self):
+        """Handler for testing that the next session is displayed even if closing the port fails"""
+        manager = sessionManager()
+        manager.addSession(silentPort('COM1', closeFails=True))
+        manager.addSession(silentPort('COM2'))
+
+        with self.assertRaises(OSError):
+            manager.removeSession('COM1')
+
+        self.assertEqual(manager.activeName, 'COM2')
+        self.assertNotIn('COM1', manager.sessions)
+        manager.stopAll()
+
+if __name__ == '__main__':
+    unittest.main()
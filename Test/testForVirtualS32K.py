@@ -0,0 +1,60 @@
+import sys
+sys.path.append('.')
+import os
+import unittest
+import util.util as util
+from util.virtualS32K import virtualS32K, writeAvailable
+
+class functionTest(unittest.TestCase):
+    def test_of_frame_layout(self):
+        """Handler for testing the frames of the virtual device"""
+        device = virtualS32K(cellNumber=7, noise=0)
+
+        data = util.bytesData2bccData(device.nextFrame())
+
+        self.assertTrue(util.isFramePlausible(data))
+        self.assertEqual(data[0], sum(data[1:15]))
+        self.assertEqual(data[5], 0) # Cell 5 is not used by the 7 cells set-up
+        self.assertEqual(data[60], 2) # Discharge
+
+    def test_of_balancing_command(self):
+        """Handler for testing the balancing commands"""
+        device = virtualS32K(noise=0)
+        device.cellVoltage[3] += 100000
+
+        device.handleCommand(b'OPEN\t')
+        data = util.bytesData2bccData(device.nextFrame())
+        self.assertEqual(data[61], 1)
+        self.assertEqual(data[46 + 3], 1)
+
+        device.handleCommand(b'OVER\t')
+        data = util.bytesData2bccData(device.nextFrame())
+        self.assertEqual(data[61], 0)
+        self.assertEqual(sum(data[46:60]), 0)
+
+    @unittest.skipIf(sys.platform == 'win32', "non-blocking pipes are not available")
+    def test_of_partial_write(self):
+        """Handler for testing that the bytes which do not fit are kept for the next write"""
+        readEnd, writeEnd = os.pipe()
+        os.set_blocking(writeEnd, False)
+
+        try:
+            data = bytes(range(256)) * 4096 # Larger than the pipe buffer
+            rest = writeAvailable(writeEnd, data)
+            self.assertTrue(0 < len(rest) < len(data))
+            self.assertEqual(writeAvailable(writeEnd, rest), rest) # Full, nothing written
+
+            received = b''
+            while len(received) < len(data) - len(rest):
+                received += os.read(readEnd, 65536)
+            rest = writeAvailable(writeEnd, rest)
+
+            while len(received) < len(data) - len(rest):
+                received += os.read(readEnd, 65536)
+            self.assertEqual(received, data[:len(data) - len(rest)])
+        finally:
+            os.close(readEnd)
+            os.close(writeEnd)
+
+if __name__ == '__main__':
+    unittest.main()
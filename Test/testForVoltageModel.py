@@ -0,0 +1,35 @@
+import sys
+sys.path.append('.')
+sys.path.append('./Src')
+import unittest
+from PySide6.QtCore import Qt
+from BMS_voltageModel import voltageTableModel
+
+class functionTest(unittest.TestCase):
+    def test_of_changed_rows(self):
+        """Handler for testing that one dataChanged range covers the changed voltages"""
+        model = voltageTableModel()
+        ranges = []
+        model.dataChanged.connect(lambda first, last, roles: ranges.append((first.row(), last.row())))
+
+        voltages = [0.0] * 14
+        voltages[3] = 3600.5
+        voltages[9] = 3590.25
+        model.setVoltages(voltages)
+        model.setVoltages(voltages) # Unchanged
+
+        self.assertEqual(ranges, [(3, 9)])
+        self.assertEqual(model.data(model.index(3, 0)), '3600.5')
+        self.assertEqual(model.data(model.index(3, 1)), 'mV')
+        self.assertEqual(model.headerData(13, Qt.Vertical), 'CELL14')
+
+    def test_of_cell_number(self):
+        """Handler for testing that the rows follow the number of cells of the daisy chain"""
+        model = voltageTableModel()
+        model.setVoltages(range(84)) # 6 BCC devices of 14 cells
+
+        self.assertEqual(model.rowCount(), 84)
+        self.assertEqual(model.data(model.index(83, 0)), '83.0')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -30,5 +30,27 @@ class functionTest(unittest.TestCase):
 
         self.assertEqual(result, exampleResult)
 
+    def test_of_bytesData2bccData(self):
+        """Handler for testing function with several frames"""
+        frame = bytes(range(0, 248))
+        exampleResult = [int.from_bytes(frame[i:i+4], 'little', signed=True) for i in range(0, 248, 4)]
+
+        result = util.bytesData2bccData(frame * 3)
+
+        self.assertEqual(result.shape, (3, 62))
+        self.assertEqual(result[2].tolist(), exampleResult)
+        self.assertEqual(util.bytesData2bccData(frame).tolist(), exampleResult)
+
+    def test_of_batchData2bccData(self):
+        """Handler for testing function with a buffer of frames"""
+        validFrame = bytes(248)
+        invalidFrame = bytes(184) + (3).to_bytes(4, 'little') + bytes(60)
+
+        data, validMask = util.batchData2bccData(validFrame + invalidFrame + validFrame + bytes(100))
+
+        self.assertEqual(data.shape, (3, 62))
+        self.assertEqual(validMask.tolist(), [True, False, True])
+        self.assertEqual(data[1, 46], 3)
+
 if __name__ == '__main__':
     unittest.main()
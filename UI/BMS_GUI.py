@@ -21,7 +21,7 @@ from PySide6.QtWidgets import (QApplication, QCheckBox, QComboBox, QDoubleSpinBo
     QLabel, QLineEdit, QMainWindow, QMenu,
     QMenuBar, QProgressBar, QPushButton, QRadioButton,
     QSizePolicy, QSpacerItem, QStackedWidget, QTabWidget,
-    QTableWidget, QTableWidgetItem, QVBoxLayout, QWidget)
+    QTableView, QVBoxLayout, QWidget)
 
 class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
@@ -512,71 +512,7 @@ class Ui_MainWindow(object):
         self.batteryData_1.setEnabled(True)
         self.batteryData_1Layout = QVBoxLayout(self.batteryData_1)
         self.batteryData_1Layout.setObjectName(u"batteryData_1Layout")
-        self.voltageTable = QTableWidget(self.batteryData_1)
-        if (self.voltageTable.columnCount() < 2):
-            self.voltageTable.setColumnCount(2)
-        __qtablewidgetitem = QTableWidgetItem()
-        self.voltageTable.setHorizontalHeaderItem(0, __qtablewidgetitem)
-        __qtablewidgetitem1 = QTableWidgetItem()
-        self.voltageTable.setHorizontalHeaderItem(1, __qtablewidgetitem1)
-        if (self.voltageTable.rowCount() < 14):
-            self.voltageTable.setRowCount(14)
-        __qtablewidgetitem2 = QTableWidgetItem()
-        self.voltageTable.setVerticalHeaderItem(0, __qtablewidgetitem2)
-        __qtablewidgetitem3 = QTableWidgetItem()
-        self.voltageTable.setVerticalHeaderItem(1, __qtablewidgetitem3)
-        __qtablewidgetitem4 = QTableWidgetItem()
-        self.voltageTable.setVerticalHeaderItem(2, __qtablewidgetitem4)
-        __qtablewidgetitem5 = QTableWidgetItem()
-        self.voltageTable.setVerticalHeaderItem(3, __qtablewidgetitem5)
-        __qtablewidgetitem6 = QTableWidgetItem()
-        self.voltageTable.setVerticalHeaderItem(4, __qtablewidgetitem6)
-        __qtablewidgetitem7 = QTableWidgetItem()
-        self.voltageTable.setVerticalHeaderItem(5, __qtablewidgetitem7)
-        __qtablewidgetitem8 = QTableWidgetItem()
-        self.voltageTable.setVerticalHeaderItem(6, __qtablewidgetitem8)
-        __qtablewidgetitem9 = QTableWidgetItem()
-        self.voltageTable.setVerticalHeaderItem(7, __qtablewidgetitem9)
-        __qtablewidgetitem10 = QTableWidgetItem()
-        self.voltageTable.setVerticalHeaderItem(8, __qtablewidgetitem10)
-        __qtablewidgetitem11 = QTableWidgetItem()
-        self.voltageTable.setVerticalHeaderItem(9, __qtablewidgetitem11)
-        __qtablewidgetitem12 = QTableWidgetItem()
-        self.voltageTable.setVerticalHeaderItem(10, __qtablewidgetitem12)
-        __qtablewidgetitem13 = QTableWidgetItem()
-        self.voltageTable.setVerticalHeaderItem(11, __qtablewidgetitem13)
-        __qtablewidgetitem14 = QTableWidgetItem()
-        self.voltageTable.setVerticalHeaderItem(12, __qtablewidgetitem14)
-        __qtablewidgetitem15 = QTableWidgetItem()
-        self.voltageTable.setVerticalHeaderItem(13, __qtablewidgetitem15)
-        __qtablewidgetitem16 = QTableWidgetItem()
-        self.voltageTable.setItem(0, 1, __qtablewidgetitem16)
-        __qtablewidgetitem17 = QTableWidgetItem()
-        self.voltageTable.setItem(1, 1, __qtablewidgetitem17)
-        __qtablewidgetitem18 = QTableWidgetItem()
-        self.voltageTable.setItem(2, 1, __qtablewidgetitem18)
-        __qtablewidgetitem19 = QTableWidgetItem()
-        self.voltageTable.setItem(3, 1, __qtablewidgetitem19)
-        __qtablewidgetitem20 = QTableWidgetItem()
-        self.voltageTable.setItem(4, 1, __qtablewidgetitem20)
-        __qtablewidgetitem21 = QTableWidgetItem()
-        self.voltageTable.setItem(5, 1, __qtablewidgetitem21)
-        __qtablewidgetitem22 = QTableWidgetItem()
-        self.voltageTable.setItem(6, 1, __qtablewidgetitem22)
-        __qtablewidgetitem23 = QTableWidgetItem()
-        self.voltageTable.setItem(7, 1, __qtablewidgetitem23)
-        __qtablewidgetitem24 = QTableWidgetItem()
-        self.voltageTable.setItem(8, 1, __qtablewidgetitem24)
-        __qtablewidgetitem25 = QTableWidgetItem()
-        self.voltageTable.setItem(9, 1, __qtablewidgetitem25)
-        __qtablewidgetitem26 = QTableWidgetItem()
-        self.voltageTable.setItem(10, 1, __qtablewidgetitem26)
-        __qtablewidgetitem27 = QTableWidgetItem()
-        self.voltageTable.setItem(11, 1, __qtablewidgetitem27)
-        __qtablewidgetitem28 = QTableWidgetItem()
-        self.voltageTable.setItem(12, 1, __qtablewidgetitem28)
-        __qtablewidgetitem29 = QTableWidgetItem()
-        self.voltageTable.setItem(13, 1, __qtablewidgetitem29)
+        self.voltageTable = QTableView(self.batteryData_1)
         self.voltageTable.setObjectName(u"voltageTable")
         self.voltageTable.setFocusPolicy(Qt.NoFocus)
 
@@ -1304,71 +1240,6 @@ class Ui_MainWindow(object):
         self.SystemStatusLabel_5.setText(QCoreApplication.translate("MainWindow", u"Cell Balancing Threshold:", None))
         self.cbThresholdLineEdit.setPlaceholderText(QCoreApplication.translate("MainWindow", u"No Connection", None))
         self.SystemStatusLabel_46.setText(QCoreApplication.translate("MainWindow", u"mV", None))
-        ___qtablewidgetitem = self.voltageTable.horizontalHeaderItem(0)
-        ___qtablewidgetitem.setText(QCoreApplication.translate("MainWindow", u"Voltage", None));
-        ___qtablewidgetitem1 = self.voltageTable.horizontalHeaderItem(1)
-        ___qtablewidgetitem1.setText(QCoreApplication.translate("MainWindow", u"Unit", None));
-        ___qtablewidgetitem2 = self.voltageTable.verticalHeaderItem(0)
-        ___qtablewidgetitem2.setText(QCoreApplication.translate("MainWindow", u"CELL1", None));
-        ___qtablewidgetitem3 = self.voltageTable.verticalHeaderItem(1)
-        ___qtablewidgetitem3.setText(QCoreApplication.translate("MainWindow", u"CELL2", None));
-        ___qtablewidgetitem4 = self.voltageTable.verticalHeaderItem(2)
-        ___qtablewidgetitem4.setText(QCoreApplication.translate("MainWindow", u"CELL3", None));
-        ___qtablewidgetitem5 = self.voltageTable.verticalHeaderItem(3)
-        ___qtablewidgetitem5.setText(QCoreApplication.translate("MainWindow", u"CELL4", None));
-        ___qtablewidgetitem6 = self.voltageTable.verticalHeaderItem(4)
-        ___qtablewidgetitem6.setText(QCoreApplication.translate("MainWindow", u"CELL5", None));
-        ___qtablewidgetitem7 = self.voltageTable.verticalHeaderItem(5)
-        ___qtablewidgetitem7.setText(QCoreApplication.translate("MainWindow", u"CELL6", None));
-        ___qtablewidgetitem8 = self.voltageTable.verticalHeaderItem(6)
-        ___qtablewidgetitem8.setText(QCoreApplication.translate("MainWindow", u"CELL7", None));
-        ___qtablewidgetitem9 = self.voltageTable.verticalHeaderItem(7)
-        ___qtablewidgetitem9.setText(QCoreApplication.translate("MainWindow", u"CELL8", None));
-        ___qtablewidgetitem10 = self.voltageTable.verticalHeaderItem(8)
-        ___qtablewidgetitem10.setText(QCoreApplication.translate("MainWindow", u"CELL9", None));
-        ___qtablewidgetitem11 = self.voltageTable.verticalHeaderItem(9)
-        ___qtablewidgetitem11.setText(QCoreApplication.translate("MainWindow", u"CELL10", None));
-        ___qtablewidgetitem12 = self.voltageTable.verticalHeaderItem(10)
-        ___qtablewidgetitem12.setText(QCoreApplication.translate("MainWindow", u"CELL11", None));
-        ___qtablewidgetitem13 = self.voltageTable.verticalHeaderItem(11)
-        ___qtablewidgetitem13.setText(QCoreApplication.translate("MainWindow", u"CELL12", None));
-        ___qtablewidgetitem14 = self.voltageTable.verticalHeaderItem(12)
-        ___qtablewidgetitem14.setText(QCoreApplication.translate("MainWindow", u"CELL13", None));
-        ___qtablewidgetitem15 = self.voltageTable.verticalHeaderItem(13)
-        ___qtablewidgetitem15.setText(QCoreApplication.translate("MainWindow", u"CELL14", None));
-
-        __sortingEnabled = self.voltageTable.isSortingEnabled()
-        self.voltageTable.setSortingEnabled(False)
-        ___qtablewidgetitem16 = self.voltageTable.item(0, 1)
-        ___qtablewidgetitem16.setText(QCoreApplication.translate("MainWindow", u"mV", None));
-        ___qtablewidgetitem17 = self.voltageTable.item(1, 1)
-        ___qtablewidgetitem17.setText(QCoreApplication.translate("MainWindow", u"mV", None));
-        ___qtablewidgetitem18 = self.voltageTable.item(2, 1)
-        ___qtablewidgetitem18.setText(QCoreApplication.translate("MainWindow", u"mV", None));
-        ___qtablewidgetitem19 = self.voltageTable.item(3, 1)
-        ___qtablewidgetitem19.setText(QCoreApplication.translate("MainWindow", u"mV", None));
-        ___qtablewidgetitem20 = self.voltageTable.item(4, 1)
-        ___qtablewidgetitem20.setText(QCoreApplication.translate("MainWindow", u"mV", None));
-        ___qtablewidgetitem21 = self.voltageTable.item(5, 1)
-        ___qtablewidgetitem21.setText(QCoreApplication.translate("MainWindow", u"mV", None));
-        ___qtablewidgetitem22 = self.voltageTable.item(6, 1)
-        ___qtablewidgetitem22.setText(QCoreApplication.translate("MainWindow", u"mV", None));
-        ___qtablewidgetitem23 = self.voltageTable.item(7, 1)
-        ___qtablewidgetitem23.setText(QCoreApplication.translate("MainWindow", u"mV", None));
-        ___qtablewidgetitem24 = self.voltageTable.item(8, 1)
-        ___qtablewidgetitem24.setText(QCoreApplication.translate("MainWindow", u"mV", None));
-        ___qtablewidgetitem25 = self.voltageTable.item(9, 1)
-        ___qtablewidgetitem25.setText(QCoreApplication.translate("MainWindow", u"mV", None));
-        ___qtablewidgetitem26 = self.voltageTable.item(10, 1)
-        ___qtablewidgetitem26.setText(QCoreApplication.translate("MainWindow", u"mV", None));
-        ___qtablewidgetitem27 = self.voltageTable.item(11, 1)
-        ___qtablewidgetitem27.setText(QCoreApplication.translate("MainWindow", u"mV", None));
-        ___qtablewidgetitem28 = self.voltageTable.item(12, 1)
-        ___qtablewidgetitem28.setText(QCoreApplication.translate("MainWindow", u"mV", None));
-        ___qtablewidgetitem29 = self.voltageTable.item(13, 1)
-        ___qtablewidgetitem29.setText(QCoreApplication.translate("MainWindow", u"mV", None));
-        self.voltageTable.setSortingEnabled(__sortingEnabled)
-
         self.monitorWindowTab.setTabText(self.monitorWindowTab.indexOf(self.batteryData_1), QCoreApplication.translate("MainWindow", u"Cell Voltage Data", None))
         self.packMonitoringGroupBox.setTitle(QCoreApplication.translate("MainWindow", u"Pack Monitoring", None))
         self.packVoltageUnit.setText(QCoreApplication.translate("MainWindow", u"mV", None))
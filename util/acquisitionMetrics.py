@@ -0,0 +1,165 @@
+"""
+Acquisition health metrics
+Counters and rolling histograms of the serial ingest process, updated by the acquisition thread and read by the GUI
+"""
+
+import collections
+import csv
+import json
+import threading
+import time
+
+import numpy as np
+
+from util.frameTiming import frameRateEstimator
+
+
+class rollingHistogram:
+    """Keep the latest samples of a duration (s) for statistics and histograms"""
+    def __init__(self, size=1000):
+        self.samples = collections.deque(maxlen=size)
+
+    def add(self, value):
+        self.samples.append(value)
+
+    def summary(self):
+        """Return mean, 50th, 95th percentile and maximum in ms"""
+        if len(self.samples) == 0:
+            return {'mean': 0.0, 'p50': 0.0, 'p95': 0.0, 'max': 0.0}
+
+        data = np.array(self.samples) * 1000
+
+        return {'mean': float(data.mean()),
+                'p50': float(np.percentile(data, 50)),
+                'p95': float(np.percentile(data, 95)),
+                'max': float(data.max())}
+
+    def histogram(self, edges):
+        """Return the sample counts between the bin edges (ms)"""
+        counts, _ = np.histogram(np.array(self.samples) * 1000, bins=edges)
+        return counts.tolist()
+
+
+class acquisitionMetrics:
+    """Health metrics of the serial acquisition process, safe to use from several threads"""
+    # Histogram bin edges (ms) used for exporting
+    HISTOGRAM_EDGES = [0, 0.1, 0.2, 0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, float('inf')]
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Clear all the counters and histograms"""
+        with self.lock:
+            self.startTime = time.perf_counter()
+            self.bytesReceived = 0
+            self.framesReceived = 0
+            self.framesRejected = 0
+            self.resyncs = 0
+            self.discardedBytes = 0
+            self.queueDepth = 0 # Frames sent to the GUI and not handled yet
+            self.reconnects = 0
+
+            # Firmware send interval estimated from the frame time stamps
+            self.frameTiming = frameRateEstimator()
+
+            self.decodeTime = rollingHistogram()
+            self.guiLatency = rollingHistogram()
+
+            # Previous snapshot used for the frame rate
+            self.lastTime = self.startTime
+            self.lastFrames = 0
+            self.frameRate = 0.0
+
+    def addRead(self, byteNumber, resyncs, discardedBytes, decodeTime):
+        """Update the counters after one read of the acquisition thread"""
+        with self.lock:
+            self.bytesReceived += byteNumber
+            self.resyncs = resyncs
+            self.discardedBytes = discardedBytes
+            self.decodeTime.add(decodeTime)
+
+    def addReconnect(self):
+        """Count a port reopened after a dropout"""
+        with self.lock:
+            self.reconnects += 1
+
+    def addFrame(self, accepted, timeStamp=None):
+        """Count a decoded frame, accepted frames are queued to the GUI"""
+        with self.lock:
+            if accepted:
+                self.framesReceived += 1
+                self.queueDepth += 1
+
+                if timeStamp is not None:
+                    self.frameTiming.add(timeStamp)
+            else:
+                self.framesRejected += 1
+
+    def pendingFrames(self):
+        """Return the number of frames sent to the GUI and not handled yet"""
+        with self.lock:
+            return self.queueDepth
+
+    def addFrameHandled(self):
+        """Count a queued frame taken by the GUI"""
+        with self.lock:
+            self.queueDepth -= 1
+
+    def addGuiUpdate(self, frameTime):
+        """Record the time from receiving the newest displayed frame to the end of the GUI refresh"""
+        with self.lock:
+            self.guiLatency.add(time.perf_counter() - frameTime)
+
+    def snapshot(self):
+        """Return all the metrics in a dictionary"""
+        with self.lock:
+            now = time.perf_counter()
+
+            if now - self.lastTime >= 0.5:
+                self.frameRate = (self.framesReceived - self.lastFrames) / (now - self.lastTime)
+                self.lastTime = now
+                self.lastFrames = self.framesReceived
+
+            return {'elapsedTime': now - self.startTime,
+                    'bytesReceived': self.bytesReceived,
+                    'framesReceived': self.framesReceived,
+                    'framesPerSecond': self.frameRate,
+                    'framesRejected': self.framesRejected,
+                    'resyncs': self.resyncs,
+                    'discardedBytes': self.discardedBytes,
+                    'queueDepth': self.queueDepth,
+                    'reconnects': self.reconnects,
+                    'frameIntervalMs': self.frameTiming.interval * 1000,
+                    'frameJitterMs': self.frameTiming.jitter * 1000,
+                    'decodeTime': self.decodeTime.summary(),
+                    'guiLatency': self.guiLatency.summary(),
+                    'decodeTimeHistogram': self.decodeTime.histogram(self.HISTOGRAM_EDGES),
+                    'guiLatencyHistogram': self.guiLatency.histogram(self.HISTOGRAM_EDGES)}
+
+    def exportJson(self, fileName):
+        """Save the metrics as JSON"""
+        data = self.snapshot()
+        data['histogramEdges'] = [str(edge) for edge in self.HISTOGRAM_EDGES]
+
+        with open(fileName, 'w') as f:
+            json.dump(data, f, indent=4)
+
+    def exportCsv(self, fileName):
+        """Save the metrics as a two column CSV file"""
+        data = self.snapshot()
+
+        with open(fileName, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['metric', 'value'])
+
+            for name, value in data.items():
+                if isinstance(value, dict):
+                    for key, item in value.items():
+                        writer.writerow([name + '_' + key + '_ms', item])
+                elif isinstance(value, list):
+                    for i, count in enumerate(value):
+                        writer.writerow([name + '_' + str(self.HISTOGRAM_EDGES[i]) + '_ms', count])
+                else:
+                    writer.writerow([name, value])
@@ -0,0 +1,144 @@
+"""
+Vectorised threshold check of the pack channels
+The raw words of a frame, or of a batch of frames, are scaled and compared with the threshold arrays in
+one pass, the result is a compact status code per channel. The alarm policy turns these codes into the
+displayed status with hysteresis, N-of-M debounce and latching, updated per frame in O(channels)
+"""
+
+import numpy as np
+
+from util.frameSchema import FRAME
+
+# Status codes of a channel
+NORMAL = 0
+UNDER = 1
+OVER = 2
+HOLD = 3 # Inside the limits but in the hysteresis band, used by the alarm policy only
+
+
+class alarmEngine:
+    """Threshold arrays of the channels and their vectorised check"""
+    def __init__(self, channels):
+        self.channels = channels
+
+        self.scale = np.ones(channels) # Multiplier from the raw word to the threshold unit
+        self.absolute = np.zeros(channels, dtype=bool) # Compare the magnitude of the value
+        self.low = np.full(channels, -np.inf)
+        self.high = np.full(channels, np.inf)
+
+    def setChannels(self, index, scale=1, absolute=False):
+        """Set how the raw words of some channels are converted before the comparison"""
+        self.scale[index] = scale
+        self.absolute[index] = absolute
+
+    def setThreshold(self, index, low, high):
+        """Set the normal range of some channels, the limits themselves are normal"""
+        self.low[index] = low
+        self.high[index] = high
+
+    def values(self, raw):
+        """Return the converted values of a frame (channels,) or of a batch of frames (n, channels)"""
+        values = np.asarray(raw) * self.scale
+
+        return np.where(self.absolute, np.abs(values), values)
+
+    def evaluate(self, raw):
+        """Return the status codes of a frame (channels,) or of a batch of frames (n, channels)"""
+        values = self.values(raw)
+
+        codes = np.zeros(values.shape, dtype=np.int8)
+        codes[values < self.low] = UNDER
+        codes[values > self.high] = OVER
+
+        return codes
+
+
+class alarmPolicy:
+    """Hysteresis, N-of-M debounce and latch or auto-clear policy of the channel status"""
+    def __init__(self, channels, window=1):
+        self.channels = channels
+        self.window = window # M, number of the latest frames the debounce looks at
+
+        self.hysteresis = np.zeros(channels) # Distance inside the alarmed limit a value must reach for clearing
+        self.count = np.ones(channels, dtype=int) # N, frames out of the window needed for a change
+        self.latch = np.ones(channels, dtype=bool) # Latched alarms are only cleared by reset
+
+        self.channelIndex = np.arange(channels)
+        self.reset()
+
+    def reset(self):
+        """Clear every alarm and forget the frames seen"""
+        self.status = np.zeros(self.channels, dtype=np.int8)
+
+        # Codes of the latest window frames and the number of frames of every code
+        self.history = np.full((self.window, self.channels), NORMAL, dtype=np.int8)
+        self.codeCounts = np.zeros((4, self.channels), dtype=int)
+        self.codeCounts[NORMAL] = self.window
+        self.position = 0
+
+    def setHysteresis(self, index, hysteresis):
+        self.hysteresis[index] = hysteresis
+
+    def setDebounce(self, index, count):
+        """Set N of the N-of-M debounce of some channels, at most the window"""
+        self.count[index] = min(count, self.window)
+
+    def setLatch(self, index, latch=True):
+        self.latch[index] = latch
+
+    def classify(self, engine, raw):
+        """Return the codes of one frame, an alarmed value inside the limits but not yet past its hysteresis is HOLD"""
+        values = engine.values(raw)
+
+        # The hysteresis only applies on the side of the alarm, a normal channel is normal anywhere inside the limits
+        cleared = np.where(self.status == OVER, values <= engine.high - self.hysteresis,
+                           np.where(self.status == UNDER, values >= engine.low + self.hysteresis, True))
+
+        codes = np.full(self.channels, HOLD, dtype=np.int8)
+        codes[(values >= engine.low) & (values <= engine.high) & cleared] = NORMAL
+        codes[values < engine.low] = UNDER
+        codes[values > engine.high] = OVER
+
+        return codes
+
+    def update(self, engine, raw):
+        """Add one frame and return the status of every channel"""
+        codes = self.classify(engine, raw)
+
+        # Slide the window, the frame counts are updated with the dropped and the new codes only
+        self.codeCounts[self.history[self.position], self.channelIndex] -= 1
+        self.codeCounts[codes, self.channelIndex] += 1
+        self.history[self.position] = codes
+        self.position = (self.position + 1) % self.window
+
+        under = self.codeCounts[UNDER] >= self.count
+        over = self.codeCounts[OVER] >= self.count
+        normal = self.codeCounts[NORMAL] >= self.count
+
+        # A latched alarm keeps its first status, the others follow the debounced codes, raising wins over clearing
+        free = (self.status == NORMAL) | ~self.latch
+        self.status[free & normal] = NORMAL
+        self.status[free & under] = UNDER
+        self.status[free & over & (self.codeCounts[OVER] >= self.codeCounts[UNDER])] = OVER
+
+        return self.status
+
+
+# Channels of the pack: the words from the pack voltage to the pack current of a frame, which start at word 0
+PACK_CHANNELS = FRAME.slice('packVoltage', 'packCurrent')
+PACK_VOLTAGE = FRAME.field('packVoltage').offset
+CELL_VOLTAGE = FRAME.slice('cellVoltage')
+IC_TEMP = FRAME.field('icTemp').offset
+PACK_CURRENT = FRAME.field('packCurrent').offset
+
+
+def packAlarmEngine():
+    """Return an engine for the pack channels, voltages in mV, temperature in degree and current magnitude in mA"""
+    engine = alarmEngine(PACK_CHANNELS.stop - PACK_CHANNELS.start)
+
+    engine.setChannels(PACK_VOLTAGE, 1 / 1000) # uV to mV
+    engine.setChannels(CELL_VOLTAGE, 1 / 1000)
+    engine.setChannels(IC_TEMP, 1 / 10) # 0.1 degree to degree
+    engine.setChannels(PACK_CURRENT, 1, absolute=True)
+
+    return engine
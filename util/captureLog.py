@@ -0,0 +1,102 @@
+"""
+Raw UART capture log
+Every chunk read from the serial port is appended to a binary file with a host monotonic timestamp
+
+File layout:
+    Header: b'BCCRAW01' + wall clock time (float64) + monotonic time (float64) when the file was opened
+    Chunk:  monotonic timestamp (float64) + chunk length (uint32) + raw bytes
+All numbers are little-endian.
+"""
+
+import queue
+import struct
+import threading
+import time
+
+CAPTURE_MAGIC = b'BCCRAW01'
+CAPTURE_HEADER = struct.Struct('<8sdd')
+CHUNK_HEADER = struct.Struct('<dI')
+
+
+class captureWriter:
+    """Append raw UART chunks to a capture file through a background writer thread"""
+    def __init__(self, fileName):
+        self.fileName = fileName
+        self.file = open(fileName, 'wb')
+
+        # Wall clock anchor for lining up the monotonic timestamps with other logs
+        self.file.write(CAPTURE_HEADER.pack(CAPTURE_MAGIC, time.time(), time.monotonic()))
+
+        self.queue = queue.Queue()
+        self.byteCount = 0
+
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def write(self, rawData, timeStamp=None):
+        """Queue a chunk of raw data, this never blocks the caller"""
+        if timeStamp is None:
+            timeStamp = time.monotonic()
+
+        self.queue.put((timeStamp, bytes(rawData)))
+
+    def run(self):
+        """Handler for writing the queued chunks to the file"""
+        while True:
+            item = self.queue.get()
+
+            if item is None:
+                break
+
+            timeStamp, rawData = item
+            self.file.write(CHUNK_HEADER.pack(timeStamp, len(rawData)))
+            self.file.write(rawData)
+            self.byteCount += len(rawData)
+
+            # Flush once the queue is drained so that the file is usable if the GUI crashes
+            if self.queue.empty():
+                self.file.flush()
+
+        self.file.close()
+
+    def close(self):
+        """Write the remaining chunks and close the file"""
+        self.queue.put(None)
+        self.thread.join()
+
+
+class captureReader:
+    """Read the chunks of a capture file in order"""
+    def __init__(self, fileName):
+        self.fileName = fileName
+
+        with open(fileName, 'rb') as f:
+            magic, self.wallTime, self.monotonicTime = CAPTURE_HEADER.unpack(f.read(CAPTURE_HEADER.size))
+
+        if magic != CAPTURE_MAGIC:
+            raise ValueError("%s is not a raw UART capture file" % fileName)
+
+    def __iter__(self):
+        """Yield (monotonic timestamp, raw bytes) for every chunk, a truncated last chunk is ignored"""
+        with open(self.fileName, 'rb') as f:
+            f.seek(CAPTURE_HEADER.size)
+
+            while True:
+                header = f.read(CHUNK_HEADER.size)
+                if len(header) < CHUNK_HEADER.size:
+                    break
+
+                timeStamp, length = CHUNK_HEADER.unpack(header)
+                rawData = f.read(length)
+                if len(rawData) < length:
+                    break
+
+                yield timeStamp, rawData
+
+    def toWallTime(self, timeStamp):
+        """Convert a monotonic timestamp of this file to wall clock time"""
+        return self.wallTime + (timeStamp - self.monotonicTime)
+
+    def readAll(self):
+        """Return all the captured bytes joined together"""
+        return b''.join(rawData for _, rawData in self)
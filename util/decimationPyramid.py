@@ -0,0 +1,175 @@
+"""
+Min/max decimation pyramid for the live graph
+Level 0 keeps the plotted points of the live window, level k keeps the minimum and the maximum of every
+factor**k points. Each curve is drawn from the finest level which gives about two points per pixel of the
+visible range, so the drawing cost does not grow with the history and no spike is lost
+"""
+
+import numpy as np
+
+from util.ringBuffer import ringBuffer
+
+
+class minMaxPyramid:
+    """Multi-resolution min/max summary of the live graph window, updated with every point"""
+    def __init__(self, capacity, rows, factor=4, minimumBuckets=512, dtype=np.float16):
+        self.capacity = capacity
+        self.rows = rows
+        self.factor = factor
+        self.dtype = dtype
+
+        # Level 0 keeps the points, its minimum and maximum are the points themselves
+        self.xLevels = [ringBuffer(capacity)]
+        self.minLevels = [ringBuffer(capacity, rows, dtype)]
+        self.maxLevels = [self.minLevels[0]]
+
+        # Coarser levels are added while they still have enough buckets to fill a screen
+        bucketNumber = capacity // factor
+        while bucketNumber >= minimumBuckets:
+            self.xLevels.append(ringBuffer(bucketNumber + 1))
+            self.minLevels.append(ringBuffer(bucketNumber + 1, rows, dtype))
+            self.maxLevels.append(ringBuffer(bucketNumber + 1, rows, dtype))
+            bucketNumber //= factor
+
+        self.clear()
+
+    def clear(self):
+        """Forget every point"""
+        for level in range(len(self.xLevels)):
+            self.xLevels[level].clear()
+            self.minLevels[level].clear()
+            self.maxLevels[level].clear()
+
+        # Unfinished bucket of every level: [first x, minimum, maximum, number of finer buckets]
+        self.pending = [None for _ in self.xLevels]
+
+    def __len__(self):
+        return len(self.xLevels[0])
+
+    def lastX(self):
+        return self.xLevels[0].last()
+
+    def append(self, x, values):
+        """Add one point, a time and a column of values, NaN values mark a gap at every level"""
+        values = np.broadcast_to(np.asarray(values, dtype=self.dtype), (self.rows,))
+
+        self.xLevels[0].append(x)
+        self.minLevels[0].append(values)
+
+        # Fold the point into the unfinished buckets, a finished bucket is folded into the next level
+        bucketX, bucketMin, bucketMax = x, values, values
+        for level in range(1, len(self.xLevels)):
+            bucket = self.pending[level]
+
+            if bucket is None:
+                bucket = self.pending[level] = [bucketX, bucketMin.copy(), bucketMax.copy(), 1]
+            else:
+                np.minimum(bucket[1], bucketMin, out=bucket[1])
+                np.maximum(bucket[2], bucketMax, out=bucket[2])
+                bucket[3] += 1
+
+            if bucket[3] < self.factor:
+                break
+
+            self.xLevels[level].append(bucket[0])
+            self.minLevels[level].append(bucket[1])
+            self.maxLevels[level].append(bucket[2])
+            self.pending[level] = None
+
+            bucketX, bucketMin, bucketMax = bucket[0], bucket[1], bucket[2]
+
+    def rebuildStart(self, pointNumber):
+        """Return the index of the first of pointNumber points which rebuild needs
+
+        The live window is extended back to the start of a bucket of the coarsest level, so that the buckets
+        of every level line up with those made by appending the points one by one.
+        """
+        start = max(pointNumber - self.capacity, 0)
+
+        return start - start % self.factor ** (len(self.xLevels) - 1)
+
+    def rebuild(self, x, values):
+        """Fill the pyramid with many points at once, values has the shape (rows, n)
+
+        x[0] should be the point at rebuildStart, then the pyramid is the same as after appending every point.
+        """
+        self.clear()
+
+        x = np.asarray(x)
+        values = np.asarray(values, dtype=self.dtype)
+
+        # The coarse levels are made from every point, only the live window is kept at level 0
+        self.xLevels[0].extend(x[-self.capacity:])
+        self.minLevels[0].extend(values[:, -self.capacity:])
+
+        bucketX, bucketMin, bucketMax = x, values, values
+        for level in range(1, len(self.xLevels)):
+            bucketNumber = bucketX.size // self.factor
+            used = bucketNumber * self.factor
+
+            # The remaining finer buckets make the unfinished bucket
+            if bucketX.size > used:
+                self.pending[level] = [bucketX[used], bucketMin[:, used:].min(axis=1),
+                                       bucketMax[:, used:].max(axis=1), bucketX.size - used]
+
+            bucketX = bucketX[:used:self.factor]
+            bucketMin = bucketMin[:, :used].reshape(self.rows, bucketNumber, self.factor).min(axis=2)
+            bucketMax = bucketMax[:, :used].reshape(self.rows, bucketNumber, self.factor).max(axis=2)
+
+            self.xLevels[level].extend(bucketX)
+            self.minLevels[level].extend(bucketMin)
+            self.maxLevels[level].extend(bucketMax)
+
+    def pendingBucket(self, level, row):
+        """Return the points of the live window which are not in a finished bucket of the level yet"""
+        bucket = None
+        for finerLevel in range(level, 0, -1):
+            if self.pending[finerLevel] is None:
+                continue
+
+            if bucket is None:
+                bucket = [self.pending[finerLevel][0], self.pending[finerLevel][1][row],
+                          self.pending[finerLevel][2][row]]
+            else:
+                bucket[1] = np.minimum(bucket[1], self.pending[finerLevel][1][row])
+                bucket[2] = np.maximum(bucket[2], self.pending[finerLevel][2][row])
+
+        return bucket
+
+    def curveData(self, row, xRange=None, pixels=1000):
+        """Return the x and y data of one curve for the visible x range (the whole window if None)"""
+        if len(self) == 0:
+            return np.zeros(0), np.zeros(0)
+
+        # The coarser levels may still keep buckets older than the live window
+        firstX = self.xLevels[0].view()[0]
+        xMin, xMax = (firstX, self.lastX()) if xRange is None else (max(xRange[0], firstX), xRange[1])
+
+        # Choose the finest level with at most two points per pixel
+        for level in range(len(self.xLevels)):
+            x = self.xLevels[level].view()
+
+            # One more point on both sides keeps the curve going to the edges of the view,
+            # the coarse buckets which started before the live window are left out
+            first = max(np.searchsorted(x, xMin, side='right') - 1, np.searchsorted(x, firstX, side='left'))
+            last = min(np.searchsorted(x, xMax, side='right') + 1, len(x))
+
+            pointNumber = (last - first) * (1 if level == 0 else 2)
+            if pointNumber <= 2 * pixels or level == len(self.xLevels) - 1:
+                break
+
+        if level == 0:
+            return x[first:last], self.minLevels[0].view()[row, first:last]
+
+        # Every bucket is drawn as its minimum followed by its maximum
+        xData = np.repeat(x[first:last], 2)
+        yData = np.empty(xData.size, dtype=self.dtype)
+        yData[0::2] = self.minLevels[level].view()[row, first:last]
+        yData[1::2] = self.maxLevels[level].view()[row, first:last]
+
+        bucket = self.pendingBucket(level, row)
+        if last == len(x) and bucket is not None:
+            xData = np.append(xData, [bucket[0], bucket[0]])
+            yData = np.append(yData, [bucket[1], bucket[2]])
+
+        return xData, yData
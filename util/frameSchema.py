@@ -0,0 +1,118 @@
+"""
+BCC UART frame layout schema
+Every field of the frame sent by dataTransmit in S32K_Src/main.c is declared once here, the decoder dtype,
+the plausible ranges, the recorded CSV columns and the plot scaling are all generated from it
+"""
+
+import numpy as np
+
+# Number of cells measured by the MC33771C
+CELL_NUMBER = 14
+
+# Cells wired in each set-up, counted from 0, the 7 cells set-up uses cells 1-4 and 12-14
+CELL_POSITIONS = {14: list(range(CELL_NUMBER)), 7: [0, 1, 2, 3, 11, 12, 13]}
+
+
+class frameField:
+    """One named field of the frame, made of one or more little-endian int32 words"""
+    def __init__(self, name, words, scale, unit, minimum, maximum, recorded=True, plotted=True):
+        self.name = name
+        self.words = words
+        self.scale = scale # Multiplier from the raw value to the plotted unit
+        self.unit = unit
+        self.minimum = minimum # Plausible raw range, used for finding the frame alignment
+        self.maximum = maximum
+        self.recorded = recorded # Saved in the CSV files
+        self.plotted = plotted # Shown in the live graphs
+
+        self.offset = 0 # First word, set by the schema
+
+    def columnNames(self):
+        """Return the CSV column names of the field"""
+        if self.words == 1:
+            return [self.name]
+
+        return ['%s_%d' % (self.name, i) for i in range(1, self.words + 1)]
+
+
+def frameFields(cellNumber=CELL_NUMBER):
+    """Return the fields of the frame in the order they are sent"""
+    return [
+        frameField('packVoltage', 1, 1e-6, 'V', -1000000, 100000000, recorded=False),
+        frameField('cellVoltage', cellNumber, 1e-6, 'V', -1000000, 6000000),
+        frameField('icTemp', 1, 0.1, 'degree', -500, 2000, recorded=False),
+        frameField('packCurrent', 1, 1, 'mA', -1000000, 1000000),
+        frameField('cellSoC', cellNumber, 0.1, '%', -10000, 10000),
+        frameField('cellSoH', cellNumber, 0.1, '%', -10000, 10000),
+        frameField('equivalentFullCycle', 1, 1, 'cycle', 0, 1000000, plotted=False),
+        frameField('cellCB', cellNumber, 1, '', 0, 255), # Invalid values are rejected after the framing
+        frameField('systemStatus', 1, 1, '', 0, 4, recorded=False, plotted=False),
+        frameField('cbStatus', 1, 1, '', 0, 1, recorded=False, plotted=False)]
+
+
+class frameSchema:
+    """Frame layout built from the field list, shared by decoding, recording and plotting"""
+    def __init__(self, fields):
+        self.fields = fields
+        self.fieldDict = {}
+
+        offset = 0
+        for field in self.fields:
+            field.offset = offset
+            offset += field.words
+            self.fieldDict[field.name] = field
+
+        self.words = offset
+        self.size = self.words * 4
+
+        # Structured dtype for reading the fields by name straight from the raw bytes
+        self.dtype = np.dtype([(field.name, '<i4', (field.words,)) if field.words > 1 else (field.name, '<i4')
+                               for field in self.fields])
+
+        # Word indices and columns of the recorded data, the time column is added by the recorder
+        self.recordIndex = self.index(*[field.name for field in self.fields if field.recorded])
+        self.recordColumns = self.columnNames(*[field.name for field in self.fields if field.recorded]) + ['Date']
+
+        # Word indices, columns and scales of the graph data rows
+        self.plotIndex = self.index(*[field.name for field in self.fields if field.plotted])
+        self.plotColumns = self.columnNames(*[field.name for field in self.fields if field.plotted])
+        self.plotScale = np.concatenate([np.full(field.words, field.scale)
+                                         for field in self.fields if field.plotted])
+
+    def field(self, name):
+        return self.fieldDict[name]
+
+    def slice(self, first, last=None):
+        """Return the slice of the words from the field first to the field last"""
+        last = first if last is None else last
+
+        return slice(self.fieldDict[first].offset, self.fieldDict[last].offset + self.fieldDict[last].words)
+
+    def index(self, *names):
+        """Return the word indices of the fields"""
+        return np.concatenate([np.arange(self.fieldDict[name].offset, self.fieldDict[name].offset +
+                                         self.fieldDict[name].words) for name in names])
+
+    def columnNames(self, *names):
+        """Return the CSV column names of the fields"""
+        return [column for name in names for column in self.fieldDict[name].columnNames()]
+
+    def cellColumns(self, cellNumber=CELL_NUMBER):
+        """Return the columns of the per cell fields which belong to the cells wired in the set-up"""
+        return [field.columnNames()[i] for field in self.fields if field.words == CELL_NUMBER
+                for i in CELL_POSITIONS[cellNumber]]
+
+    def bounds(self):
+        """Return the plausible range of every field as [first word, last word, minimum, maximum]"""
+        return [[field.offset, field.offset + field.words - 1, field.minimum, field.maximum]
+                for field in self.fields]
+
+    def view(self, data):
+        """Return a structured view of one (62,) or more (n, 62) decoded frames without copying"""
+        records = data.view(self.dtype).reshape(data.shape[:-1])
+
+        return records[()] if records.ndim == 0 else records
+
+
+# Frame layout of the S32K144EVB firmware
+FRAME = frameSchema(frameFields())
@@ -0,0 +1,65 @@
+"""
+Host-side frame timing
+Frames are stamped with time.perf_counter() when they are read, these helpers estimate the firmware send
+interval and convert the monotonic stamps to wall-clock time for lining the logs up with other instruments
+"""
+
+import time
+
+
+class frameRateEstimator:
+    """Running estimate of the firmware send interval and its jitter from the frame time stamps"""
+    def __init__(self, alpha=0.05):
+        self.alpha = alpha # Weight of the newest interval
+        self.reset()
+
+    def reset(self):
+        self.lastTime = None
+        self.interval = 0.0 # Mean send interval (s)
+        self.variance = 0.0
+        self.count = 0 # Number of intervals seen
+
+    def add(self, timeStamp):
+        """Update the estimate with the time stamp of a new frame"""
+        if self.lastTime is not None:
+            interval = timeStamp - self.lastTime
+
+            if self.count == 0:
+                self.interval = interval
+            else:
+                # Exponentially weighted mean and variance
+                difference = interval - self.interval
+                self.interval += self.alpha * difference
+                self.variance = (1 - self.alpha) * (self.variance + self.alpha * difference * difference)
+
+            self.count += 1
+
+        self.lastTime = timeStamp
+
+    @property
+    def jitter(self):
+        """Standard deviation of the send interval (s)"""
+        return self.variance ** 0.5
+
+    @property
+    def rate(self):
+        """Estimated firmware frame rate (frames/s)"""
+        return 1 / self.interval if self.interval > 0 else 0.0
+
+
+class frameClock:
+    """Anchor between the monotonic frame stamps and the wall clock, taken when the session starts
+
+    A replay gives its recorded wall-clock time for both, its frame stamps are already wall-clock time.
+    """
+    def __init__(self, wallTime=None, monotonicTime=None):
+        self.wallTime = time.time() if wallTime is None else wallTime
+        self.monotonicTime = time.perf_counter() if monotonicTime is None else monotonicTime
+
+    def elapsed(self, timeStamp):
+        """Seconds from the anchor to a frame time stamp"""
+        return timeStamp - self.monotonicTime
+
+    def toWallTime(self, timeStamp):
+        """Convert a frame time stamp to seconds since the epoch"""
+        return self.wallTime + timeStamp - self.monotonicTime
@@ -0,0 +1,75 @@
+"""
+Memory-mapped history of the live graph
+Every plotted point of the session is appended to fixed size memory-mapped segment files in a temporary
+folder, so hours of data can be browsed while the RAM use stays flat
+"""
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+
+class historyStore:
+    """Append-only store of graph points (time and plotted values) backed by memory-mapped files"""
+    def __init__(self, columns, segmentRows=65536, directory=None):
+        self.columns = columns # Plotted values per point
+        self.segmentRows = segmentRows
+
+        # Time in float64 and the values in float32
+        self.recordDtype = np.dtype([('x', '<f8'), ('y', '<f4', (columns,))])
+
+        self.folder = tempfile.mkdtemp(prefix='bmsHistory_', dir=directory)
+        self.segments = []
+        self.length = 0
+
+    def __len__(self):
+        return self.length
+
+    def append(self, x, values):
+        """Add one point, a time and a column of values"""
+        segmentIndex, row = divmod(self.length, self.segmentRows)
+
+        # A new segment file is mapped when the previous one is full, the mapped files are never resized
+        if segmentIndex == len(self.segments):
+            fileName = os.path.join(self.folder, 'segment_%d.bin' % segmentIndex)
+            self.segments.append(np.memmap(fileName, dtype=self.recordDtype, mode='w+', shape=(self.segmentRows,)))
+
+        self.segments[segmentIndex][row] = (x, values)
+        self.length += 1
+
+    def read(self, first=0, last=None, column=None):
+        """Return a copy of the times and the values of the points from first to last
+
+        The values have the shape (columns, n), or (n,) if a column is given.
+        """
+        last = self.length if last is None else min(last, self.length)
+        first = max(first, 0)
+
+        # Only the requested fields of every segment are copied, the whole records are never joined in RAM
+        x = np.empty(max(last - first, 0))
+        y = np.empty((self.columns, x.size) if column is None else x.size, dtype='<f4')
+
+        i = first
+        while i < last:
+            segmentIndex, start = divmod(i, self.segmentRows)
+            stop = min(self.segmentRows, start + last - i)
+
+            records = self.segments[segmentIndex][start:stop]
+            x[i - first:i - first + stop - start] = records['x']
+            y[..., i - first:i - first + stop - start] = records['y'].T if column is None else records['y'][:, column]
+            i += stop - start
+
+        return x, y
+
+    def clear(self):
+        """Forget every point, the segment files are reused"""
+        self.length = 0
+
+    def close(self):
+        """Unmap and delete the segment files"""
+        self.segments = []
+        self.length = 0
+
+        shutil.rmtree(self.folder, ignore_errors=True)
@@ -0,0 +1,71 @@
+"""
+Serial port auto-discovery
+Every candidate port is opened at the same time and listened to for valid BMS frames at each baud rate,
+the ports are ranked by the share of valid frames in their stream
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import serial
+
+import util.util as util
+
+
+def probePort(portName, baudRates, listenTime=0.6):
+    """Listen to one port at each baud rate in turn and rate the stream
+
+    The whole listen time is used so that the ports can be compared, the probing stops at the first baud rate
+    which gives frames. The quality is the share of the decoded frames which are valid, the frames rejected by
+    the receiving check and the resyncs after garbage bytes count against it.
+    Return a list of [port name, baud rate, number of frames, quality].
+    """
+    results = []
+
+    for baudRate in baudRates:
+        frameNumber = 0
+        rejectedNumber = 0
+
+        try:
+            with serial.Serial(portName, baudRate, timeout=0.05) as port:
+                port.reset_input_buffer() # Only rate the bytes sent while listening
+                framer = util.frameSynchroniser()
+                endTime = time.monotonic() + listenTime
+
+                while time.monotonic() < endTime:
+                    for frame in framer.push(port.read(max(1, port.in_waiting))):
+                        if util.isFrameValid(util.bytesData2bccData(frame)): # Same check as the receiving process
+                            frameNumber += 1
+                        else:
+                            rejectedNumber += 1
+        except (serial.SerialException, OSError, ValueError):
+            break # Port busy or not usable
+
+        # Joining the stream in the middle of a frame is not an error, the first resync is free
+        errorNumber = rejectedNumber + max(0, framer.resyncCount - 1)
+        quality = frameNumber / (frameNumber + errorNumber) if frameNumber > 0 else 0.0
+
+        results.append([portName, baudRate, frameNumber, quality])
+
+        if frameNumber > 0:
+            break
+
+    return results
+
+
+def discoverPorts(portNames, baudRates, listenTime=0.6):
+    """Probe all the ports in parallel and rank them by the quality, then by the number of valid frames
+
+    Return a list of [port name, baud rate, number of frames, quality], best first, ports without frames are left out.
+    """
+    if len(portNames) == 0:
+        return []
+
+    with ThreadPoolExecutor(max_workers=len(portNames)) as pool:
+        futures = [pool.submit(probePort, portName, baudRates, listenTime) for portName in portNames]
+        results = [result for future in futures for result in future.result()]
+
+    results = [result for result in results if result[2] > 0]
+    results.sort(key=lambda result: (result[3], result[2]), reverse=True)
+
+    return results
@@ -0,0 +1,27 @@
+"""
+Last rendered state of the GUI
+The displayed values are pushed to the widgets through this cache, so a widget is only touched when its
+text or style really changes and Qt does not re-parse the same stylesheet for every frame
+"""
+
+
+class renderCache:
+    """Last value pushed to every widget property, keyed by (widget, property)"""
+    def __init__(self):
+        self.values = {}
+
+    def changed(self, key, value):
+        """Return True and remember the value if it differs from the last pushed one"""
+        if key in self.values and self.values[key] == value:
+            return False
+
+        self.values[key] = value
+        return True
+
+    def forget(self, key):
+        """Push the next value of a property even if it is unchanged"""
+        self.values.pop(key, None)
+
+    def clear(self):
+        """Push the next value of every property"""
+        self.values = {}
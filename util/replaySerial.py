@@ -0,0 +1,168 @@
+"""
+Replay source for recorded BMS data
+Behaves like the pyserial port used by the GUI, so a raw UART capture (.bin) or a CSV file written by
+recordData can be fed back through the live decoding, displaying, plotting and recording process
+"""
+
+import collections
+import csv
+import time
+
+import numpy as np
+
+from util.captureLog import captureReader
+from util.frameSchema import FRAME
+
+
+def csvFrames(fileName):
+    """Yield (time stamp, raw frame) for every row of a CSV file written by recordData
+
+    The pack voltage is rebuilt from the cell voltages, the IC temperature and the system status
+    are not recorded so they are set to 25 degree and IDLE.
+    """
+    with open(fileName, newline='') as f:
+        for row in csv.DictReader(f):
+            data = np.zeros(FRAME.words, dtype='<i4')
+            data[FRAME.recordIndex] = [int(float(row[column])) for column in FRAME.recordColumns[:-1]]
+
+            frame = FRAME.view(data)
+            frame['packVoltage'] = frame['cellVoltage'].sum()
+            frame['icTemp'] = 250
+            frame['cbStatus'] = 1 if frame['cellCB'].any() else 0
+
+            yield float(row['Date']), data.tobytes()
+
+
+class replaySerial:
+    """Serial port like object which plays back a recorded file at a chosen speed"""
+    def __init__(self, fileName, speed=1.0):
+        self.port = fileName
+        self.speed = speed # Replay speed, 0 means unthrottled
+        self.timeout = None
+        self.is_open = False
+
+        self.chunks = None
+        self.nextChunk = None
+        self.buffer = bytearray()
+        self.maxBuffer = 248 * 64 # Maximum bytes loaded ahead when unthrottled
+
+        # Recorded wall-clock time of the loaded chunks: (read position after the chunk, time stamp)
+        self.chunkTimes = collections.deque()
+        self.position = 0 # Bytes loaded since the file was opened
+
+        self.firstTimeStamp = 0
+        self.startTime = 0
+        self.finished = False
+        self.cancelled = False
+
+    def open(self):
+        """Open the file and start the replay clock"""
+        # The chunks are stamped with wall-clock time, a capture file keeps monotonic time stamps
+        if self.port.lower().endswith('.csv'):
+            self.chunks = csvFrames(self.port)
+        else:
+            reader = captureReader(self.port)
+            self.chunks = ((reader.toWallTime(timeStamp), rawData) for timeStamp, rawData in reader)
+
+        self.nextChunk = next(self.chunks, None)
+        self.finished = self.nextChunk is None
+
+        if not self.finished:
+            self.firstTimeStamp = self.nextChunk[0]
+
+        self.startTime = time.monotonic()
+        self.is_open = True
+
+    def isOpen(self):
+        return self.is_open
+
+    def close(self):
+        self.is_open = False
+        self.chunks = None
+        self.nextChunk = None
+        self.buffer = bytearray()
+
+    def dueTime(self):
+        """Monotonic time when the next chunk is due, None if the replay is finished"""
+        if self.nextChunk is None:
+            return None
+
+        if self.speed == 0:
+            return self.startTime
+
+        return self.startTime + (self.nextChunk[0] - self.firstTimeStamp) / self.speed
+
+    def loadDueChunks(self):
+        """Move the chunks which are due into the receive buffer"""
+        while self.nextChunk is not None and len(self.buffer) < self.maxBuffer:
+            if self.dueTime() > time.monotonic():
+                break
+
+            self.buffer += self.nextChunk[1]
+            self.position += len(self.nextChunk[1])
+            self.chunkTimes.append((self.position, self.nextChunk[0]))
+            self.nextChunk = next(self.chunks, None)
+
+        self.finished = self.nextChunk is None
+
+    @property
+    def in_waiting(self):
+        self.loadDueChunks()
+        return len(self.buffer)
+
+    def read(self, size=1):
+        """Read size bytes, wait for them like a serial port until the timeout
+
+        EOFError is raised once every byte of the file has been read.
+        """
+        if not self.is_open:
+            raise OSError("Replay file is not open")
+
+        endTime = None if self.timeout is None else time.monotonic() + self.timeout
+
+        self.loadDueChunks()
+        self.cancelled = False
+
+        if self.finished and len(self.buffer) == 0:
+            raise EOFError("Replay of %s finished" % self.port)
+
+        while len(self.buffer) < size and not self.cancelled:
+            waitUntil = self.dueTime()
+
+            if endTime is not None and (waitUntil is None or waitUntil > endTime):
+                waitUntil = endTime
+
+            if waitUntil is None: # Replay finished and no timeout
+                break
+
+            now = time.monotonic()
+            if endTime is not None and now >= endTime:
+                break
+
+            time.sleep(min(max(0, waitUntil - now), 0.05)) # Wake up regularly to check cancel_read
+            self.loadDueChunks()
+
+        rawData = bytes(self.buffer[:size])
+        del self.buffer[:size]
+
+        return rawData
+
+    def recordedTime(self, position):
+        """Return the recorded wall-clock time of the byte at a read position, the positions must not go back"""
+        while len(self.chunkTimes) > 1 and self.chunkTimes[0][0] <= position:
+            self.chunkTimes.popleft()
+
+        return self.chunkTimes[0][1]
+
+    def write(self, data):
+        """Commands are ignored during the replay"""
+        return len(data)
+
+    def cancel_read(self):
+        """Make the waiting read return at once"""
+        self.cancelled = True
+
+    def reset_input_buffer(self):
+        self.position -= len(self.buffer)
+        self.chunkTimes.clear()
+        self.buffer = bytearray()
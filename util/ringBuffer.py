@@ -0,0 +1,68 @@
+"""
+Preallocated ring buffer for the live graph history
+Every sample is written twice, at its slot and one capacity further, so that the latest samples are
+always a contiguous slice of the storage and can be handed to pyqtgraph without copying
+"""
+
+import numpy as np
+
+
+class ringBuffer:
+    """Fixed capacity circular buffer of columns, a new column replaces the oldest one when it is full"""
+    def __init__(self, capacity, rows=None, dtype=np.float64):
+        self.capacity = capacity
+        self.rows = rows # None for a one dimension buffer
+
+        shape = (2 * capacity,) if rows is None else (rows, 2 * capacity)
+        self.storage = np.zeros(shape, dtype=dtype)
+
+        self.clear()
+
+    def clear(self):
+        """Forget every sample, the storage is kept"""
+        self.start = 0 # Slot of the oldest sample
+        self.length = 0
+
+    def __len__(self):
+        return self.length
+
+    @property
+    def full(self):
+        return self.length == self.capacity
+
+    def append(self, values):
+        """Add one sample, a value for a one dimension buffer or a column of rows values"""
+        if self.length < self.capacity:
+            index = self.start + self.length
+            self.length += 1
+        else:
+            index = self.start
+            self.start = (self.start + 1) % self.capacity
+
+        # Write the sample to both halves, the views never wrap around
+        self.storage[..., index % self.capacity] = values
+        self.storage[..., index % self.capacity + self.capacity] = values
+
+    def extend(self, values):
+        """Add several samples, values has the samples along the last axis"""
+        values = np.asarray(values)
+        count = values.shape[-1]
+
+        # Only the latest capacity samples are kept
+        number = min(count, self.capacity)
+        index = (self.start + self.length + count - number + np.arange(number)) % self.capacity
+
+        self.storage[..., index] = values[..., count - number:]
+        self.storage[..., index + self.capacity] = values[..., count - number:]
+
+        newLength = min(self.length + count, self.capacity)
+        self.start = (self.start + self.length + count - newLength) % self.capacity
+        self.length = newLength
+
+    def view(self):
+        """Return the samples from the oldest to the latest as a contiguous view"""
+        return self.storage[..., self.start:self.start + self.length]
+
+    def last(self):
+        """Return the latest sample"""
+        return self.storage[..., self.start + self.length - 1]
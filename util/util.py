@@ -1,24 +1,135 @@
 import sys
 import os
+import struct
+
+import numpy as np
+
+from util.frameSchema import FRAME
+
+# BCC UART frame: 62 little-endian 32 bit words sent by dataTransmit in S32K_Src/main.c
+FRAME_WORDS = FRAME.words
+FRAME_SIZE = FRAME.size
+
+# Plausible range of every word in a frame, used for finding the frame alignment
+# [first word, last word, minimum, maximum]
+FRAME_BOUNDS = FRAME.bounds()
+
+# The cb control of cell 1 is used to check the decoded frames
+CB_CONTROL_INDEX = FRAME.field('cellCB').offset
+
+def bytesData2bccData(rawData):
+    """This function is used to transfer one or more raw bcc UART frames to bcc data without copying
+
+    The frame is made of little-endian int32 words, a single frame gives a (62,) array and
+    concatenated frames give a (n, 62) array. The array is a read-only view of rawData.
+    """
+    data = np.frombuffer(rawData, dtype='<i4')
+
+    if data.size != FRAME_WORDS:
+        data = data.reshape(-1, FRAME_WORDS)
+
+    return data
 
 def listData2strData(dataList):
     """This function is used to transfer the bcc UART data to bcc data list"""
-    dataList.reverse()  # Reverse the UART data list
-    outputData = []
-
-    for i in range(0, len(dataList), 4):
-        # This is used to separate the UART data list since every 4 elements consist of 1 hex number
-        data = int(dataList[i], 16)*(2**24) + int(dataList[i+1], 16)*(2**16) + \
-            int(dataList[i+2], 16)*(2**8) + int(dataList[i+3], 16)*(2**0)
-        
-        # Detect minus value and transfer to signed value (The maximum output values of BCC are smaller then 4,000,000,000)
-        if data > 4000000000:
-            data = data - 2**32
-
-        outputData.append(data)
-    outputData.reverse()  # Reverse the data list again to correct order
-    
-    return outputData
+    # Every 4 elements of the UART data list consist of 1 little-endian signed number
+    # (The maximum output values of BCC are smaller then 2**31, so the sign bit only marks minus values)
+    rawData = bytes(int(data, 16) for data in dataList)
+
+    return np.frombuffer(rawData, dtype='<i4').tolist()
+
+def batchData2bccData(rawBuffer):
+    """This function is used to decode a large buffer of back-to-back bcc UART frames
+
+    rawBuffer can be bytes, a memory-mapped file or a numpy memmap. A trailing partial frame is ignored.
+    Return a (n, 62) data array and a validity mask using the same check as the receiving process,
+    (the cb control of cell 1 must not be larger than 2).
+    """
+    rawData = memoryview(rawBuffer).cast('B')
+    frameNumber = len(rawData) // FRAME_SIZE
+
+    data = np.frombuffer(rawData, dtype='<i4', count=frameNumber * FRAME_WORDS).reshape(frameNumber, FRAME_WORDS)
+    validMask = isFrameValid(data)
+
+    return data, validMask
+
+def isFrameValid(data):
+    """This function is used to check decoded frames, the cb control of cell 1 must not be larger than 2
+
+    Works on one (62,) frame or on a (n, 62) array of frames.
+    """
+    return data[..., CB_CONTROL_INDEX] <= 2
+
+def isFramePlausible(data):
+    """This function is used to check whether all the words of a decoded frame are in range"""
+    for first, last, minimum, maximum in FRAME_BOUNDS:
+        for i in range(first, last + 1):
+            if data[i] < minimum or data[i] > maximum:
+                return False
+    return True
+
+class frameSynchroniser:
+    """Byte level framer which pulls every complete bcc frame out of the UART stream"""
+    def __init__(self, capacity=FRAME_SIZE * 64):
+        self.buffer = bytearray()
+        self.readIndex = 0 # Start of the unprocessed bytes in the buffer
+        self.capacity = capacity # Maximum number of unsynchronised bytes kept between two pushes
+        self.skippedBytes = 0 # Bytes skipped since the last frame
+
+        # Statistics
+        self.frameCount = 0
+        self.resyncCount = 0
+        self.discardedBytes = 0
+
+    def pendingBytes(self):
+        """Number of received bytes which are not part of a returned frame yet"""
+        return len(self.buffer) - self.readIndex
+
+    def push(self, rawData):
+        """Add the received bytes and return every complete frame found in the stream"""
+        self.buffer += rawData
+
+        frames = []
+
+        while len(self.buffer) - self.readIndex >= FRAME_SIZE:
+            data = struct.unpack_from('<62i', self.buffer, self.readIndex)
+
+            if isFramePlausible(data):
+                if self.skippedBytes > 0: # Frame found again after the garbage
+                    self.resyncCount += 1
+                    self.skippedBytes = 0
+
+                frames.append(bytes(self.buffer[self.readIndex:self.readIndex + FRAME_SIZE]))
+                self.readIndex += FRAME_SIZE
+                self.frameCount += 1
+            else:
+                # Slide one byte and try to align again
+                self.readIndex += 1
+                self.discardedBytes += 1
+                self.skippedBytes += 1
+
+        # Every complete frame of a large read is kept, only the unsynchronised bytes left over are limited
+        overflow = len(self.buffer) - self.readIndex - self.capacity
+        if overflow > 0:
+            self.readIndex += overflow
+            self.discardedBytes += overflow
+            self.skippedBytes += overflow
+
+        # Remove the processed bytes once they take up half of the buffer
+        if self.readIndex > len(self.buffer) // 2:
+            del self.buffer[:self.readIndex]
+            self.readIndex = 0
+
+        return frames
+
+    def reset(self):
+        """Clear the buffered bytes and the statistics"""
+        self.buffer = bytearray()
+        self.readIndex = 0
+        self.skippedBytes = 0
+        self.frameCount = 0
+        self.resyncCount = 0
+        self.discardedBytes = 0
 
 def get_resource_path(self, relative_path):
     '''Handler used for inserting image when using pyinstaller'''
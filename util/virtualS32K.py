@@ -0,0 +1,190 @@
+"""
+Virtual S32K144EVB serial device for load testing without hardware (Linux / macOS)
+Creates a pseudo-terminal and sends 248-byte frames in the layout of dataTransmit in S32K_Src/main.c
+
+Usage:
+    python util/virtualS32K.py --rate 50 --cells 14 --noise 2000 --fault-rate 0.01
+
+Connect the GUI to the printed /dev/pts/N port. 'OPEN\\t' starts and 'OVER\\t' stops the cell balancing.
+"""
+
+import argparse
+import os
+import random
+import select
+import struct
+import sys
+import time
+import tty
+
+# Run as a script the util folder is searched first, where util.py would hide the util package
+if __name__ == '__main__':
+    sys.path[0] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+from util.frameSchema import CELL_POSITIONS
+
+# Fault injection types
+FAULTS = ['garbage', 'truncate', 'corrupt', 'overvoltage']
+
+
+def buildFrame(cellVoltage, icTemp, packCurrent, cellSoC, cellSoH, efc, cbControl, systemStatus, cbStatus):
+    """Pack the battery data into one UART frame, voltages in uV, temperature in 0.1 degree, current in mA"""
+    data = [sum(cellVoltage)] + list(cellVoltage) + [icTemp, packCurrent]
+    data += list(cellSoC) + list(cellSoH) + [efc] + list(cbControl) + [systemStatus, cbStatus]
+
+    return struct.pack('<62i', *data)
+
+
+def writeAvailable(fd, data):
+    """Write as much of data as the non-blocking file takes, return the bytes left"""
+    try:
+        return data[os.write(fd, data):]
+    except BlockingIOError:
+        return data
+
+
+class virtualS32K:
+    """Battery pack model which answers like the S32K144EVB firmware"""
+    def __init__(self, cellNumber=14, noise=1000, faultRate=0.0, cbThreshold=9):
+        self.noise = noise # Standard deviation of the cell voltage noise (uV)
+        self.faultRate = faultRate # Probability of a fault per frame
+        self.cbThreshold = cbThreshold * 1000 # Balancing threshold (uV)
+
+        positions = CELL_POSITIONS.get(cellNumber, list(range(cellNumber)))
+
+        # Unused cells read 0 V
+        self.cellVoltage = [0.0] * 14
+        for i in positions:
+            self.cellVoltage[i] = 3600000 + random.uniform(-30000, 30000)
+        self.positions = positions
+
+        self.packCurrent = -500
+        self.icTemp = 250
+        self.cellSoC = [800 if i in positions else 0 for i in range(14)]
+        self.cellSoH = [1000 if i in positions else 0 for i in range(14)]
+        self.efc = 0
+        self.cbControl = [0] * 14
+        self.cbStatus = 0
+
+        self.frameCount = 0
+        self.faultCount = 0
+
+    def handleCommand(self, command):
+        """Handler for the balancing commands sent by the GUI"""
+        if b'OPEN\t' in command:
+            self.cbStatus = 1
+        if b'OVER\t' in command:
+            self.cbStatus = 0
+
+    def updateBalancing(self):
+        """Balance the cells which are above the lowest cell by more than the threshold"""
+        lowest = min(self.cellVoltage[i] for i in self.positions)
+
+        for i in range(14):
+            if self.cbStatus == 1 and i in self.positions and self.cellVoltage[i] - lowest > self.cbThreshold:
+                self.cbControl[i] = 1
+                self.cellVoltage[i] -= 200 # Bleed the balanced cell
+            else:
+                self.cbControl[i] = 0
+
+        # Balancing finished
+        if self.cbStatus == 1 and not any(self.cbControl):
+            self.cbStatus = 0
+
+    def nextFrame(self):
+        """Return the raw bytes of the next frame, with a fault injected sometimes"""
+        self.updateBalancing()
+
+        cellVoltage = [round(v + random.gauss(0, self.noise)) if v > 0 else 0 for v in self.cellVoltage]
+
+        if self.packCurrent < 0:
+            systemStatus = 2 # DISCHARGE
+        elif self.packCurrent > 0:
+            systemStatus = 1 # CHARGE
+        else:
+            systemStatus = 3 # OPENCIRCUIT
+
+        fault = None
+        if random.random() < self.faultRate:
+            fault = random.choice(FAULTS)
+            self.faultCount += 1
+
+        if fault == 'overvoltage':
+            cellVoltage[self.positions[0]] = 4500000
+            systemStatus = 4 # FAULT
+
+        cbControl = list(self.cbControl)
+        if fault == 'corrupt':
+            cbControl[0] = 7 # Rejected by the GUI
+
+        frame = buildFrame(cellVoltage, self.icTemp, self.packCurrent, self.cellSoC, self.cellSoH,
+                           self.efc, cbControl, systemStatus, self.cbStatus)
+
+        if fault == 'garbage':
+            frame = bytes(random.getrandbits(8) for _ in range(random.randint(1, 16))) + frame
+        elif fault == 'truncate':
+            frame = frame[:random.randint(1, len(frame) - 1)]
+
+        self.frameCount += 1
+
+        return frame
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Virtual S32K144EVB serial device")
+    parser.add_argument('--rate', type=float, default=5, help="frames per second")
+    parser.add_argument('--cells', type=int, default=14, choices=range(1, 15), metavar='1-14', help="number of cells")
+    parser.add_argument('--noise', type=float, default=1000, help="cell voltage noise in uV")
+    parser.add_argument('--fault-rate', type=float, default=0.0, help="probability of a fault per frame")
+    parser.add_argument('--cb-threshold', type=float, default=9, help="cell balancing threshold in mV")
+    parser.add_argument('--duration', type=float, default=0, help="stop after this many seconds, 0 runs forever")
+    args = parser.parse_args()
+
+    master, slave = os.openpty()
+    tty.setraw(slave) # Pass every byte through unchanged
+    os.set_blocking(master, False)
+    print("Virtual S32K port: %s" % os.ttyname(slave), flush=True)
+
+    device = virtualS32K(args.cells, args.noise, args.fault_rate, args.cb_threshold)
+
+    period = 1 / args.rate
+    startTime = time.monotonic()
+    nextTime = startTime
+
+    # Rest of the frame which did not fit in the pty buffer, frames are only sent whole
+    pending = b''
+    overrunCount = 0
+
+    try:
+        while args.duration == 0 or time.monotonic() - startTime < args.duration:
+            # Wait for the next frame while listening to the commands and finishing the pending frame
+            timeout = max(0, nextTime - time.monotonic())
+            readable, writable, _ = select.select([master], [master] if pending else [], [], timeout)
+
+            if readable:
+                device.handleCommand(os.read(master, 64))
+                continue
+
+            if writable:
+                pending = writeAvailable(master, pending)
+                continue
+
+            frame = device.nextFrame()
+
+            if pending:
+                overrunCount += 1 # The reader is too slow, the whole frame is dropped
+            else:
+                pending = writeAvailable(master, frame)
+
+            nextTime += period
+    except KeyboardInterrupt:
+        pass
+    finally:
+        elapsed = time.monotonic() - startTime
+        print("Sent %d frames (%d faults, %d overruns) in %.1f s"
+              % (device.frameCount - overrunCount, device.faultCount, overrunCount, elapsed))
+        os.close(slave)
+        os.close(master)
+
+
+if __name__ == "__main__":
+    main()